@@ -153,8 +153,7 @@ if uploaded is not None:
 # ---------------- HELPERS ----------------
 def to_clean_df(obj: Any, order_hint: list[str] | None = None) -> pd.DataFrame:
     if obj is None: return pd.DataFrame()
-    data: Dict[str, Any] = {k: v for k, v in getattr(obj, "__dict__", {}).items()
-                            if not k.startswith("_") and v is not None}
+    data: Dict[str, Any] = {k: v for k, v in obj.to_dict().items() if v is not None}
     default_order = ["province","district","ward","street",
                      "short_province","short_district","short_ward",
                      "province_type","district_type","ward_type",
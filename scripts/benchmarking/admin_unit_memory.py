@@ -0,0 +1,70 @@
+'''
+Memory of many `AdminUnit` objects, slot-based, against the same class with a per-instance `__dict__` (before
+`__slots__`). Units are copies of a few parsed units, as in batch jobs where values come from the lookup tables, so only
+the objects themselves are measured. Also times `to_dict()` and `to_tuple()`.
+
+Usage:
+    python scripts/benchmarking/admin_unit_memory.py
+    python scripts/benchmarking/admin_unit_memory.py --units 100000
+'''
+import argparse
+import copy
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits import parse_address
+from vietnamadminunits.parser.objects import AdminUnit
+
+
+class DictAdminUnit:
+    # AdminUnit before __slots__
+    def __init__(self, **kwargs):
+        for name in AdminUnit.__slots__:
+            setattr(self, name, kwargs.get(name))
+
+
+def measure(units: int, make_unit):
+    gc.collect()
+    tracemalloc.start()
+    objects = [make_unit(i) for i in range(units)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objects, size
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--units', type=int, default=1000000, help='Number of units.')
+    args = arg_parser.parse_args()
+
+    prototypes = [
+        parse_address('Phường Bến Thành, Quận 1, Thành phố Hồ Chí Minh', mode='LEGACY', keep_street=False, level=3),
+        parse_address('Phường Hoàn Kiếm, Thành phố Hà Nội', mode='FROM_2025', keep_street=False, level=2),
+    ]
+    dict_prototypes = [DictAdminUnit(**{name: getattr(u, name) for name in AdminUnit.__slots__}) for u in prototypes]
+
+    slots_units, slots_size = measure(args.units, lambda i: copy.copy(prototypes[i % 2]))
+    del slots_units
+    dict_units, dict_size = measure(args.units, lambda i: copy.copy(dict_prototypes[i % 2]))
+    del dict_units
+
+    print(f'{args.units:,} units')
+    print(f'__dict__:  {dict_size / 1e6:>8.1f} MB ({dict_size / args.units:.0f} bytes per unit)')
+    print(f'__slots__: {slots_size / 1e6:>8.1f} MB ({slots_size / args.units:.0f} bytes per unit, {dict_size / slots_size:.1f}x less)')
+
+    unit, dict_unit = prototypes[0], dict_prototypes[0]
+    for name, func in [
+        ('__dict__ comprehension', lambda: {k: v for k, v in dict_unit.__dict__.items() if k != 'show_district'}),
+        ('to_dict()', unit.to_dict),
+        ('to_tuple()', unit.to_tuple),
+    ]:
+        start = time.perf_counter()
+        for _ in range(100000):
+            func()
+        print(f'{name:<24} {(time.perf_counter() - start) * 10:>6.2f} µs')
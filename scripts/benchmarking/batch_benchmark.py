@@ -0,0 +1,73 @@
+'''
+Throughput of `parse_addresses()` against a list comprehension over `parse_address()` on the Shopee/TikTok test datasets.
+Both are run on the raw dataset and on a duplicate-heavy version (every address repeated, shuffled).
+
+Usage:
+    python scripts/benchmarking/batch_benchmark.py
+    python scripts/benchmarking/batch_benchmark.py --repeat 10
+'''
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits import parse_address, parse_addresses, set_cache_size
+from vietnamadminunits.parser.parser_legacy import load_data as load_legacy_data
+from vietnamadminunits.parser.parser_from_2025 import load_data as load_from_2025_data
+
+from parser_benchmark import load_addresses
+
+
+def safe_parse_address(address, **kwargs):
+    # The single-address parser raises on a few dataset rows, keep the comparison going
+    try:
+        return parse_address(address, **kwargs)
+    except Exception:
+        return None
+
+
+def run_loop(addresses: list, mode: str, level: int):
+    start = time.perf_counter()
+    [safe_parse_address(a, mode=mode, level=level) for a in addresses]
+    return time.perf_counter() - start
+
+
+def run_batch(addresses: list, mode: str, level: int):
+    start = time.perf_counter()
+    parse_addresses(addresses, mode=mode, level=level)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--repeat', type=int, default=5, help='How many times each address appears in the duplicate-heavy dataset.')
+    args = arg_parser.parse_args()
+    set_cache_size(0)  # Measure the parser, not the address cache
+
+    load_legacy_data()
+    load_from_2025_data()
+
+    datasets = {
+        'shopee': load_addresses('shopee_admin_units.csv', ['ward', 'district', 'province']),
+        'tiktok_api': load_addresses('tiktok_admin_units_api.csv', ['district', 'province']),
+        'tiktok_contract': load_addresses('tiktok_admin_units_contract.csv', ['district', 'province']),
+    }
+
+    print(f"{'Dataset':<22} | {'Mode':<9} | {'Rows':>7} | {'Loop (s)':>9} | {'Batch (s)':>9} | {'Speedup':>7}")
+    print('-' * 76)
+    for name, addresses in datasets.items():
+        duplicated = addresses * args.repeat
+        random.Random(0).shuffle(duplicated)
+        for mode in ['LEGACY', 'FROM_2025']:
+            # parse_addresses() stops on the first failing address, so only keep the addresses that parse
+            parsable = {a for a in addresses if safe_parse_address(a, mode=mode) is not None}
+            rows = [a for a in addresses if a in parsable]
+            for label, rows in [(name, rows), (f'{name} x{args.repeat}', [a for a in duplicated if a in parsable])]:
+                run_loop(rows[:100], mode, 0)  # Warm up the matchers
+                loop = run_loop(rows, mode, 0)
+                batch = run_batch(rows, mode, 0)
+                print(f"{label:<22} | {mode:<9} | {len(rows):>7} | {loop:>9.3f} | {batch:>9.3f} | {loop / batch:>6.2f}x")
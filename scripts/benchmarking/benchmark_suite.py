@@ -0,0 +1,279 @@
+'''
+Benchmark suite over the Shopee/TikTok test datasets, with a JSON baseline to flag regressions between local runs.
+
+Cases:
+    parse/<dataset>/<mode>/level=<level>[/keep_street]   `parse_address()` per address, both modes, every level
+    convert/<dataset>                                     `convert_address()` per address, with an offline stub geocoder
+    pandas/standardize/<dataset>                          `standardize_admin_unit_columns()` on the dataset DataFrame
+    pandas/convert/<dataset>                              `convert_address_column()` on the dataset DataFrame
+
+Each case reports its throughput (items/s), p50/p99 latency (per address, or per call for the pandas cases), errors,
+and peak memory (the peak of Python allocations during a separate, untimed run, from `tracemalloc`). Timings are the
+best of `--repeat` runs of at least `--min-time` seconds, after a warm-up run, with the data preloaded and the
+address cache disabled.
+
+If the baseline file exists, the results are compared with it and the run fails (exit code 1) when a case is slower,
+or uses more memory, by more than `--threshold`. Save the baseline on a known-good commit first, on the same machine.
+The cases over the threshold are measured again, and only reported if their best values of both measures still are,
+so that a short hiccup of a busy machine is not reported as a regression.
+
+Usage:
+    python scripts/benchmarking/benchmark_suite.py --save-baseline
+    python scripts/benchmarking/benchmark_suite.py
+    python scripts/benchmarking/benchmark_suite.py --filter parse/shopee --threshold 0.1
+'''
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits import parse_address, convert_address, preload, set_cache_size
+from vietnamadminunits.converter.geocoders import Geocoder
+
+from parser_benchmark import DATA_DIR, load_addresses
+
+BASELINE_PATH = ROOT_DIR / 'scripts/benchmarking/benchmark_baseline.json'
+DATASETS = {
+    'shopee': ('shopee_admin_units.csv', ['ward', 'district', 'province']),
+    'tiktok_api': ('tiktok_admin_units_api.csv', ['district', 'province']),
+    'tiktok_contract': ('tiktok_admin_units_contract.csv', ['district', 'province']),
+}
+LEVELS = {'LEGACY': [1, 2, 3], 'FROM_2025': [1, 2]}
+
+# Gated metrics: {metric: (True if higher is better, minimum absolute change to count as a regression)}
+GATES = {
+    'throughput': (True, 0),
+    'p50_us': (False, 1),
+    'p99_us': (False, 5),
+    'peak_kb': (False, 256),
+}
+
+
+class StubGeocoder(Geocoder):
+    '''
+    Offline geocoder of the benchmark: the centroid of the old ward, no network request and no geocode cache.
+    '''
+    offline = True
+
+    def geocode(self, unit):
+        if unit.latitude is None or unit.longitude is None:
+            return None
+        return unit.latitude, unit.longitude
+
+
+# CASES
+def per_address(function, addresses: list, **kwargs):
+    def run(timed: bool=True):
+        latencies = []
+        errors = 0
+        for address in addresses:
+            start = time.perf_counter() if timed else 0
+            try:
+                function(address, **kwargs)
+            except Exception:
+                errors += 1
+            if timed:  # Not in the memory run, the latencies would be counted in its peak
+                latencies.append(time.perf_counter() - start)
+        return latencies, errors
+    return run
+
+
+def per_call(function, *args, **kwargs):
+    def run(timed: bool=True):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        return [time.perf_counter() - start], 0
+    return run
+
+
+def build_cases(names: list) -> list:
+    '''
+    :param names: Dataset names, see `DATASETS`.
+    :return: List of `(case name, number of items, run)`, `run(timed=True)` returns `(latencies in seconds, errors)`.
+    '''
+    import pandas as pd
+    from vietnamadminunits.pandas import standardize_admin_unit_columns, convert_address_column
+
+    cases = []
+    for name in names:
+        file_name, columns = DATASETS[name]
+        addresses = load_addresses(file_name, columns)
+        n = len(addresses)
+
+        for mode, levels in LEVELS.items():
+            for level in levels:
+                for keep_street in [False, True]:
+                    case = f"parse/{name}/{mode}/level={level}{'/keep_street' if keep_street else ''}"
+                    cases.append((case, n, per_address(parse_address, addresses, mode=mode, level=level, keep_street=keep_street)))
+
+        cases.append((f'convert/{name}', n, per_address(convert_address, addresses, geocoder=StubGeocoder())))
+
+        df = pd.read_csv(DATA_DIR / file_name, dtype=str)
+        df['address'] = addresses
+        admin_unit_columns = dict(zip(['ward', 'district', 'province'][-len(columns):], columns))
+        cases.append((f'pandas/standardize/{name}', n, per_call(standardize_admin_unit_columns, df, parse_mode='LEGACY', show_progress=False, **admin_unit_columns)))
+        cases.append((f'pandas/convert/{name}', n, per_call(convert_address_column, df, address='address', show_progress=False)))
+    return cases
+
+
+def measure(items: int, run, repeat: int, min_time: float) -> dict:
+    '''
+    :param items: Number of items processed by `run()`.
+    :param run: Function returning `(latencies in seconds, errors)`.
+    :param repeat: Number of timed runs, the best value of each metric is kept.
+    :param min_time: Minimum seconds of a timed run, `run()` is called again until it is reached.
+    :return: Metrics of the case.
+    '''
+    _, errors = run()  # Warm up: lazy lookups, pattern registry, branch predictors...
+
+    results = []
+    for _ in range(repeat):
+        gc.collect()
+        latencies, passes = [], 0
+        while not passes or sum(latencies) < min_time:
+            latencies += run()[0]
+            passes += 1
+        latencies.sort()
+        results.append({
+            'throughput': items * passes / sum(latencies),
+            'p50_us': latencies[len(latencies) // 2] * 1e6,
+            'p99_us': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e6,
+        })
+
+    gc.collect()
+    tracemalloc.start()
+    run(timed=False)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'items': items,
+        'throughput': round(max(r['throughput'] for r in results), 1),
+        'p50_us': round(min(r['p50_us'] for r in results), 1),
+        'p99_us': round(min(r['p99_us'] for r in results), 1),
+        'errors': errors,
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+# BASELINE
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> dict:
+    '''
+    :param results: `{case: metrics}` of this run.
+    :param baseline: `{case: metrics}` of the baseline.
+    :param threshold: Maximum relative change of a gated metric, e.g. `0.2` for 20%.
+    :return: `{case: list of regression messages}`.
+    '''
+    regressions = {}
+    for case, metrics in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        messages = []
+        for metric, (higher_is_better, min_change) in GATES.items():
+            old, new = base.get(metric), metrics[metric]
+            if not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            if worse > threshold and abs(new - old) > min_change:
+                messages.append(f'{metric} {old:,.1f} -> {new:,.1f} ({change:+.0%})')
+        if metrics['errors'] != base.get('errors', metrics['errors']):
+            messages.append(f"errors {base['errors']} -> {metrics['errors']}")
+        if messages:
+            regressions[case] = messages
+    return regressions
+
+
+def best_of(a: dict, b: dict) -> dict:
+    '''
+    :return: Best value of each metric of two measures of a case.
+    '''
+    return {
+        **a,
+        'throughput': max(a['throughput'], b['throughput']),
+        'p50_us': min(a['p50_us'], b['p50_us']),
+        'p99_us': min(a['p99_us'], b['p99_us']),
+        'peak_kb': min(a['peak_kb'], b['peak_kb']),
+    }
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--datasets', nargs='+', default=list(DATASETS), choices=list(DATASETS), help='Datasets to run. Default is every dataset.')
+    arg_parser.add_argument('--filter', default='', help='Only run the cases whose name contains this text.')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case, the best value of each metric is kept.')
+    arg_parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds of a timed run: small datasets are run several times.')
+    arg_parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='Baseline JSON file.')
+    arg_parser.add_argument('--save-baseline', action='store_true', help='Save the results as the baseline instead of comparing with it.')
+    arg_parser.add_argument('--threshold', type=float, default=0.2, help='Maximum relative change of a metric before it is a regression. Default is 0.2 (20%%).')
+    arg_parser.add_argument('--output', type=Path, default=None, help='Also write the results to this JSON file.')
+    args = arg_parser.parse_args()
+
+    start = time.perf_counter()
+    preload()
+    set_cache_size(0)  # Measure the parser and the converter, not the address cache
+    print(f'Preload: {time.perf_counter() - start:.2f} s')
+
+    cases = [case for case in build_cases(args.datasets) if args.filter in case[0]]
+    results = {}
+    print(f"{'Case':<52} | {'Items/s':>10} | {'p50 (µs)':>10} | {'p99 (µs)':>10} | {'Peak (KB)':>10} | {'Errors':>6}")
+    print('-' * 114)
+    for name, items, run in cases:
+        metrics = results[name] = measure(items, run, args.repeat, args.min_time)
+        print(f"{name:<52} | {metrics['throughput']:>10,.0f} | {metrics['p50_us']:>10,.1f} | {metrics['p99_us']:>10,.1f} | {metrics['peak_kb']:>10,.1f} | {metrics['errors']:>6}")
+
+    report = {'metadata': metadata(), 'threshold': args.threshold, 'cases': results}
+    regressions = {}
+    if args.save_baseline:
+        if args.baseline.exists() and args.filter:
+            # Update the filtered cases only
+            saved = json.loads(args.baseline.read_text(encoding='utf-8'))
+            report['cases'] = {**saved['cases'], **results}
+        args.baseline.write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f'Baseline saved to {args.baseline}')
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        base_meta = baseline['metadata']
+        print(f"\nBaseline: commit {base_meta['commit'] or '?'} of {base_meta['date']}, Python {base_meta['python']}")
+        if (base_meta['python'], base_meta['platform']) != (report['metadata']['python'], report['metadata']['platform']):
+            print('Warning: the baseline was saved with another Python version or platform.')
+        regressions = compare(results, baseline['cases'], args.threshold)
+        if regressions:
+            print(f'Measuring {len(regressions)} cases over the threshold again')
+            runs = {name: (items, run) for name, items, run in cases}
+            for name in regressions:
+                results[name] = best_of(results[name], measure(*runs[name], args.repeat, args.min_time))
+            regressions = compare({name: results[name] for name in regressions}, baseline['cases'], args.threshold)
+        for case, messages in regressions.items():
+            print(f"REGRESSION {case}: {', '.join(messages)}")
+        print(f'{len(regressions)} regressions over {args.threshold:.0%} in {len(results)} cases')
+    else:
+        print(f'\nNo baseline at {args.baseline}, run with --save-baseline to save one.')
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,77 @@
+'''
+New ward choice of divided old wards: precomputed square bounds and haversine distances, against the shapely polygon
+and geopy geodesic of every candidate. Checks both choose the same new ward for points around every divided old ward
+(the centroid of each candidate, and random points up to ~15 km away), then compares their speed.
+
+Usage:
+    python scripts/benchmarking/divided_ward_benchmark.py
+    python scripts/benchmarking/divided_ward_benchmark.py --points 50
+'''
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits.converter import converter_2025
+from vietnamadminunits.converter.converter_2025 import choose_divided_ward
+from vietnamadminunits.parser.utils import check_point_in_polygon, find_nearest_point
+
+
+def choose_divided_ward_polygon(new_wards: list, old_point: tuple):
+    # choose_divided_ward() before the precomputed bounds
+    containing_points = []
+    new_ward_points = []
+    for ward in new_wards:
+        new_point = (ward['newWardLat'], ward['newWardLon'])
+        new_ward_points.append(new_point)
+        if check_point_in_polygon(point=old_point, polygon_center=new_point, polygon_area_km2=ward['newWardAreaKm2']):
+            containing_points.append(new_point)
+
+    nearest_point = find_nearest_point(a_point=old_point, list_of_b_points=new_ward_points)
+    default_ward_point = containing_points[0] if len(containing_points) == 1 else nearest_point
+    return next((ward['newWardKey'] for ward in new_wards if (ward['newWardLat'], ward['newWardLon']) == default_ward_point), None)
+
+
+def load_cases(points: int):
+    converter_2025.load_data()
+    rng = random.Random(0)
+    cases = []
+    for province_key, table in converter_2025.DICT_PROVINCE_WARD_DIVIDED.items():
+        bounds_table = converter_2025.INDEX_PROVINCE_WARD_DIVIDED_BOUNDS[province_key]
+        for old_key, new_wards in table.items():
+            if not new_wards:
+                continue
+            centers = [(w['newWardLat'], w['newWardLon']) for w in new_wards]
+            old_points = centers + [
+                (lat + rng.uniform(-0.15, 0.15), lon + rng.uniform(-0.15, 0.15))
+                for lat, lon in (rng.choice(centers) for _ in range(points))
+            ]
+            cases += [(new_wards, bounds_table[old_key], p) for p in old_points]
+    return cases
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--points', type=int, default=20, help='Random points per divided old ward.')
+    args = arg_parser.parse_args()
+
+    cases = load_cases(args.points)
+
+    start = time.perf_counter()
+    before = [choose_divided_ward_polygon(new_wards, p) for new_wards, _, p in cases]
+    before_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    after = [choose_divided_ward(new_wards, bounds, old_point=p) for new_wards, bounds, p in cases]
+    after_time = time.perf_counter() - start
+
+    mismatches = sum(a != b for a, b in zip(before, after))
+    print(f'{len(cases)} points, {mismatches} different choices')
+    print(f'Polygon + geodesic: {before_time / len(cases) * 1e6:>8.1f} µs per point')
+    print(f'Bounds + haversine: {after_time / len(cases) * 1e6:>8.1f} µs per point ({before_time / after_time:.0f}x)')
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,77 @@
+'''
+Memory per forked worker, with and without `vietnamadminunits.preload()` in the parent process.
+
+Each worker parses the Shopee dataset in both modes, runs a full garbage collection, then reports its RSS, PSS
+(shared pages divided by the number of processes sharing them) and private (copied) memory from
+`/proc/self/smaps_rollup`. Linux only.
+
+Usage:
+    python scripts/benchmarking/fork_memory.py --workers 8
+    python scripts/benchmarking/fork_memory.py --workers 8 --no-preload
+    python scripts/benchmarking/fork_memory.py --workers 8 --no-freeze
+'''
+import argparse
+import csv
+import gc
+import multiprocessing
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+import vietnamadminunits
+from vietnamadminunits import parse_address
+
+DATA_DIR = ROOT_DIR / 'scripts/module_testing/data'
+
+
+def read_memory_mb():
+    '''
+    :return: Dictionary of `{field: MB}` for `Rss`, `Pss`, `Private_Clean`, `Private_Dirty` of the current process.
+    '''
+    memory = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            field, _, value = line.partition(':')
+            if field in ['Rss', 'Pss', 'Private_Clean', 'Private_Dirty']:
+                memory[field] = int(value.split()[0]) / 1024
+    return memory
+
+
+def work(addresses: list):
+    for address in addresses:
+        parse_address(address, mode='LEGACY', level=3)
+        try:
+            parse_address(address, mode='FROM_2025', level=2)
+        except Exception:
+            pass
+    gc.collect()
+    return read_memory_mb()
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--workers', type=int, default=4)
+    arg_parser.add_argument('--no-preload', action='store_true', help='Do not call preload() before forking.')
+    arg_parser.add_argument('--no-freeze', action='store_true', help='Call preload(freeze=False) before forking.')
+    args = arg_parser.parse_args()
+
+    with open(DATA_DIR / 'shopee_admin_units.csv', encoding='utf-8') as f:
+        addresses = [', '.join(row[c] for c in ['ward', 'district', 'province'] if row[c]) for row in csv.DictReader(f)]
+
+    if not args.no_preload:
+        vietnamadminunits.preload(freeze=not args.no_freeze)
+    print(f"Parent after {'no preload' if args.no_preload else 'preload'}: {read_memory_mb()}")
+
+    context = multiprocessing.get_context('fork')
+    with context.Pool(args.workers) as pool:
+        # One pass over the dataset per task
+        results = pool.map(work, [addresses] * args.workers, chunksize=1)
+
+    print(f"{'Worker':<6} | {'RSS (MB)':>9} | {'PSS (MB)':>9} | {'Private (MB)':>12}")
+    print('-' * 45)
+    for i, memory in enumerate(results):
+        private = memory['Private_Clean'] + memory['Private_Dirty']
+        print(f"{i:<6} | {memory['Rss']:>9.1f} | {memory['Pss']:>9.1f} | {private:>12.1f}")
+    print(f"{'Mean':<6} | {sum(m['Rss'] for m in results) / len(results):>9.1f} | {sum(m['Pss'] for m in results) / len(results):>9.1f} | {sum(m['Private_Clean'] + m['Private_Dirty'] for m in results) / len(results):>12.1f}")
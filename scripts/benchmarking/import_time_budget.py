@@ -0,0 +1,63 @@
+'''
+Fail (exit code 1) if `import vietnamadminunits` gets slower than a budget, or loads data or heavy libraries.
+
+Usage:
+    python scripts/benchmarking/import_time_budget.py
+    python scripts/benchmarking/import_time_budget.py --budget-ms 80 --runs 10
+'''
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+
+# Nothing of these should be loaded by `import vietnamadminunits` alone.
+HEAVY_MODULES = ['shapely', 'geopy', 'numpy', 'pandas', 'distributed', 'dask']
+CHECK_LAZY = f'''
+import sys
+import vietnamadminunits
+from vietnamadminunits.parser import parser_legacy, parser_from_2025
+from vietnamadminunits.converter import converter_2025
+
+print([m for m in {HEAVY_MODULES!r} if m in sys.modules])
+print([m.__name__ for m in (parser_legacy, parser_from_2025, converter_2025) if m._data_loaded])
+'''
+
+
+def measure_import_us():
+    '''
+    :return: Cumulative import time of `vietnamadminunits` in microseconds, from `python -X importtime`.
+    '''
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import vietnamadminunits'], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+    # Lines look like `import time:   self [us] | cumulative | imported package`, top-level packages have no indent
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split('|')
+        if name == ' vietnamadminunits':
+            return int(cumulative)
+    raise RuntimeError('vietnamadminunits was not found in the -X importtime output')
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--budget-ms', type=float, default=100, help='Maximum cumulative import time of vietnamadminunits.')
+    arg_parser.add_argument('--runs', type=int, default=5, help='Number of runs, the fastest one is compared with the budget.')
+    args = arg_parser.parse_args()
+
+    errors = []
+
+    import_ms = min(measure_import_us() for _ in range(args.runs)) / 1000
+    print(f'import vietnamadminunits: {import_ms:.1f} ms (budget {args.budget_ms:.1f} ms)')
+    if import_ms > args.budget_ms:
+        errors.append(f'Import time {import_ms:.1f} ms is over the budget of {args.budget_ms:.1f} ms')
+
+    result = subprocess.run([sys.executable, '-c', CHECK_LAZY], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+    heavy_modules, loaded_data = result.stdout.splitlines()
+    if heavy_modules != '[]':
+        errors.append(f'Heavy modules imported: {heavy_modules}')
+    if loaded_data != '[]':
+        errors.append(f'Data loaded at import: {loaded_data}')
+
+    for error in errors:
+        print(f'FAILED: {error}')
+    sys.exit(1 if errors else 0)
@@ -0,0 +1,66 @@
+'''
+locate_many() on random points over Vietnam. Checks every ward location is located to its own ward (except wards
+whose location is inside the square of exactly one other ward), and that the nearest wards found for a sample of the
+points within `EXACT_DISTANCE_KM` of a ward are the nearest by great-circle distance over every ward, then reports the throughput of
+`locate_indexes_2025()` (NumPy arrays only) and `locate_many()` (AdminUnit objects).
+
+Usage:
+    python scripts/benchmarking/locate_benchmark.py
+    python scripts/benchmarking/locate_benchmark.py --points 5000000
+'''
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits import locate_many
+from vietnamadminunits.locator import locator_2025
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--points', type=int, default=1000000, help='Number of random points.')
+    args = arg_parser.parse_args()
+
+    start = time.perf_counter()
+    locator_2025.load_data()
+    print(f'Load data and build indexes: {time.perf_counter() - start:.2f} s')
+
+    units = locator_2025.WARD_UNITS
+    located = locate_many([u.latitude for u in units], [u.longitude for u in units])
+    others = [(u, l) for u, l in zip(units, located) if l.ward_code != u.ward_code]
+    print(f'{len(units)} ward locations, {len(others)} located to another ward')
+    for unit, other in others:
+        print(f'    {unit.get_address()} -> {other.get_address()}')
+
+    rng = np.random.default_rng(0)
+    latitudes = rng.uniform(8.5, 23.4, args.points)
+    longitudes = rng.uniform(102.1, 109.5, args.points)
+
+    # Nearest wards against a brute-force search by great-circle distance
+    sample = 5000
+    ward_indexes = np.arange(len(units))
+    nearest = locator_2025.nearest_ward_indexes(latitudes[:sample], longitudes[:sample])
+    checked = mismatches = 0
+    for latitude, longitude, index in zip(latitudes[:sample], longitudes[:sample], nearest):
+        distances = locator_2025.haversine_km_many(np.full(len(units), latitude), np.full(len(units), longitude), ward_indexes)
+        if distances.min() <= locator_2025.EXACT_DISTANCE_KM:
+            checked += 1
+            mismatches += distances[index] > distances.min()
+    print(f'{checked} nearest wards, {mismatches} farther than the nearest by great-circle distance')
+
+    start = time.perf_counter()
+    locator_2025.locate_indexes_2025(latitudes, longitudes)
+    indexes_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    locate_many(latitudes, longitudes)
+    units_time = time.perf_counter() - start
+
+    print(f'locate_indexes_2025(): {args.points / indexes_time:>10,.0f} points/s ({args.points / indexes_time * 60 / 1e6:.1f}M points/min)')
+    print(f'locate_many():         {args.points / units_time:>10,.0f} points/s ({args.points / units_time * 60 / 1e6:.1f}M points/min)')
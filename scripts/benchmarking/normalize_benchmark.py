@@ -0,0 +1,92 @@
+'''
+Speed of `key_normalize()` and `unicode_normalize()` against their regex/unidecode reference implementations,
+after checking both give the same output on every keyword of the package data and every address of the test datasets.
+
+Usage:
+    python scripts/benchmarking/normalize_benchmark.py
+'''
+import csv
+import json
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits.parser.utils import key_normalize, key_normalize_regex, unicode_normalize
+
+DATA_DIR = ROOT_DIR / 'scripts/module_testing/data'
+PACKAGE_DATA_DIR = ROOT_DIR / 'vietnamadminunits/data'
+
+KEY_ARGS = [
+    {'keep': []},
+    {'keep': [',']},
+    {'keep': [','], 'decode': False},
+]
+
+
+def unicode_normalize_regex(text):
+    # unicode_normalize() before the translate table
+    if isinstance(text, str):
+        text = unicodedata.normalize('NFC', text)
+        text = text.replace("’", "'").replace("‘", "'").replace("“", '"').replace("”", '"')
+        text = text.replace('-', ' - ')
+        text = re.sub(r'\s+', ' ', text)
+        text = re.sub(r'\'\s+', "'", text)
+        return text.strip()
+    return text
+
+
+def load_corpus():
+    strings = set()
+
+    def walk(value):
+        if isinstance(value, str):
+            strings.add(value)
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                strings.add(k)
+                walk(v)
+        elif isinstance(value, list):
+            for v in value:
+                walk(v)
+
+    for path in PACKAGE_DATA_DIR.glob('*.json'):
+        with open(path, encoding='utf-8') as f:
+            walk(json.load(f))
+    for path in DATA_DIR.glob('*.csv'):
+        with open(path, encoding='utf-8') as f:
+            for row in csv.reader(f):
+                strings.add(', '.join(row))
+                strings.update(row)
+    return sorted(strings)
+
+
+def timeit(func, texts, **kwargs):
+    start = time.perf_counter()
+    for text in texts:
+        func(text, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    corpus = load_corpus()
+
+    mismatches = sum(unicode_normalize(t) != unicode_normalize_regex(t) for t in corpus)
+    for kwargs in KEY_ARGS:
+        mismatches += sum(key_normalize(t, **kwargs) != key_normalize_regex(t, **kwargs) for t in corpus)
+    print(f'{len(corpus)} strings, {mismatches} mismatches')
+    if mismatches:
+        sys.exit(1)
+
+    print(f"{'Function':<20} | {'Args':<32} | {'Regex (µs)':>10} | {'Table (µs)':>10} | {'Speedup':>7}")
+    print('-' * 92)
+    rows = [('unicode_normalize', unicode_normalize_regex, unicode_normalize, {})]
+    rows += [('key_normalize', key_normalize_regex, key_normalize, kwargs) for kwargs in KEY_ARGS]
+    for name, reference, func, kwargs in rows:
+        before = timeit(reference, corpus, **kwargs) / len(corpus) * 1e6
+        after = timeit(func, corpus, **kwargs) / len(corpus) * 1e6
+        print(f"{name:<20} | {str(kwargs):<32} | {before:>10.2f} | {after:>10.2f} | {before / after:>6.1f}x")
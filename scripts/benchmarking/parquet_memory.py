@@ -0,0 +1,68 @@
+'''
+Peak memory of standardizing a Parquet file with `standardize_parquet()` (one row group at a time) against reading it
+whole with pandas, `standardize_admin_unit_columns()`, then writing it back. The Shopee test dataset is repeated to
+the requested number of rows. Each run is a separate process, its peak RSS is read from `getrusage()`. Requires pyarrow.
+
+Usage:
+    python scripts/benchmarking/parquet_memory.py
+    python scripts/benchmarking/parquet_memory.py --rows 5000000 --row-group-size 100000
+'''
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+DATA_DIR = ROOT_DIR / 'scripts/module_testing/data'
+
+RUN_PANDAS = '''
+import pandas as pd
+from vietnamadminunits.pandas import standardize_admin_unit_columns
+df = pd.read_parquet(SOURCE)
+df = standardize_admin_unit_columns(df, province='province', district='district', ward='ward', parse_mode='LEGACY', show_progress=False)
+df.to_parquet(DESTINATION, index=False)
+'''
+
+RUN_PARQUET = '''
+from vietnamadminunits.pandas.parquet import standardize_parquet
+standardize_parquet(SOURCE, DESTINATION, province='province', district='district', ward='ward', parse_mode='LEGACY', show_progress=False)
+'''
+
+
+def run(code: str, source: Path, destination: Path):
+    # Peak RSS of a child process: RUSAGE_CHILDREN is the maximum over the waited children, so run the smallest first
+    code = f'import sys; sys.path.insert(0, {ROOT_DIR.as_posix()!r})\nSOURCE, DESTINATION = {source.as_posix()!r}, {destination.as_posix()!r}\n' + code
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check=True)
+    return time.perf_counter() - start, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--rows', type=int, default=2000000, help='Number of rows of the Parquet file.')
+    arg_parser.add_argument('--row-group-size', type=int, default=100000, help='Rows per row group of the Parquet file.')
+    args = arg_parser.parse_args()
+
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    df = pd.read_csv(DATA_DIR / 'shopee_admin_units.csv')
+    df = df.sample(n=args.rows, replace=True, random_state=0).reset_index(drop=True)
+    df['id'] = range(len(df))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source, destination = Path(tmp) / 'source.parquet', Path(tmp) / 'destination.parquet'
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), source, row_group_size=args.row_group_size)
+        del df
+
+        print(f'{args.rows:,} rows, {args.row_group_size:,} rows per row group')
+        seconds, peak = run(RUN_PARQUET, source, destination)
+        print(f'standardize_parquet():                      {seconds:>6.1f} s, peak RSS {peak:>7.0f} MB')
+        seconds, peak = run(RUN_PANDAS, source, destination)
+        print(f'pandas + standardize_admin_unit_columns():  {seconds:>6.1f} s, peak RSS {peak:>7.0f} MB')
@@ -0,0 +1,74 @@
+'''
+Per-address latency of `parse_address()` on the Shopee/TikTok test datasets.
+
+Usage:
+    python scripts/benchmarking/parser_benchmark.py
+    python scripts/benchmarking/parser_benchmark.py --cold   # Clear the pattern registry before every address (old behavior)
+    python scripts/benchmarking/parser_benchmark.py --engine REGEX
+    python scripts/benchmarking/parser_benchmark.py --keep-street
+'''
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits import parse_address, set_cache_size
+from vietnamadminunits.parser import MatchEngine, set_match_engine
+from vietnamadminunits.parser.patterns import PATTERN_REGISTRY
+
+DATA_DIR = ROOT_DIR / 'scripts/module_testing/data'
+
+
+def load_addresses(file_name: str, columns: list):
+    with open(DATA_DIR / file_name, encoding='utf-8') as f:
+        return [', '.join(row[c] for c in columns if row[c]) for row in csv.DictReader(f)]
+
+
+def benchmark(addresses: list, mode: str, level: int, cold: bool=False, keep_street: bool=False):
+    PATTERN_REGISTRY.clear()
+    latencies = []
+    errors = 0
+    for address in addresses:
+        if cold:
+            PATTERN_REGISTRY.clear()
+        start = time.perf_counter()
+        try:
+            parse_address(address, mode=mode, level=level, keep_street=keep_street)
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return {
+        'errors': errors,
+        'mean_us': sum(latencies) / len(latencies) * 1e6,
+        'p50_us': latencies[len(latencies) // 2] * 1e6,
+        'p99_us': latencies[int(len(latencies) * 0.99)] * 1e6,
+    }
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--cold', action='store_true', help='Clear the pattern registry before every address.')
+    arg_parser.add_argument('--engine', default=MatchEngine.TRIE.value, choices=MatchEngine.available(value=True), help='Keyword match engine.')
+    arg_parser.add_argument('--keep-street', action='store_true', help='Extract the street of every address.')
+    args = arg_parser.parse_args()
+    set_match_engine(args.engine)
+    set_cache_size(0)  # Measure the parser, not the address cache
+
+    datasets = {
+        'shopee': load_addresses('shopee_admin_units.csv', ['ward', 'district', 'province']),
+        'tiktok_api': load_addresses('tiktok_admin_units_api.csv', ['district', 'province']),
+        'tiktok_contract': load_addresses('tiktok_admin_units_contract.csv', ['district', 'province']),
+    }
+
+    print(f"{'Dataset':<16} | {'Mode':<9} | {'Level':<5} | {'Mean (µs)':>10} | {'p50 (µs)':>10} | {'p99 (µs)':>10} | {'Errors':>6}")
+    print('-' * 85)
+    for name, addresses in datasets.items():
+        for mode, levels in [('LEGACY', [1, 2, 3]), ('FROM_2025', [1, 2])]:
+            for level in levels:
+                result = benchmark(addresses, mode=mode, level=level, cold=args.cold, keep_street=args.keep_street)
+                print(f"{name:<16} | {mode:<9} | {level:<5} | {result['mean_us']:>10.1f} | {result['p50_us']:>10.1f} | {result['p99_us']:>10.1f} | {result['errors']:>6}")
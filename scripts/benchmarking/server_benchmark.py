@@ -0,0 +1,98 @@
+'''
+Latency and throughput of the HTTP server (`vietnamadminunits.server`) on the Shopee test dataset: single-address
+requests from concurrent keep-alive clients, then one streamed NDJSON batch request. The server runs in a thread of
+this process, the results are checked against `parse_address()` and `/stats` is printed at the end.
+
+Usage:
+    python scripts/benchmarking/server_benchmark.py
+    python scripts/benchmarking/server_benchmark.py --workers 4 --clients 8 --requests 5000
+'''
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlencode
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits import parse_address
+from vietnamadminunits.server import create_server
+
+from parser_benchmark import load_addresses
+
+
+def request(connection: http.client.HTTPConnection, method: str, path: str, body=None) -> dict:
+    connection.request(method, path, body=body)
+    response = connection.getresponse()
+    return json.loads(response.read())
+
+
+def run_client(port: int, addresses: list) -> list:
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    try:
+        return [request(connection, 'GET', '/parse?' + urlencode({'address': a, 'mode': 'LEGACY'})) for a in addresses]
+    finally:
+        connection.close()
+
+
+def run_batch(port: int, addresses: list) -> list:
+    # Chunked request body, streamed from a generator
+    lines = (json.dumps(a, ensure_ascii=False).encode('utf-8') + b'\n' for a in addresses)
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    try:
+        connection.request('POST', '/parse/batch?mode=LEGACY', body=lines, encode_chunked=True)
+        return [json.loads(line) for line in connection.getresponse().read().splitlines()]
+    finally:
+        connection.close()
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--workers', type=int, default=None, help='Worker processes of the server. Default is the number of CPUs.')
+    arg_parser.add_argument('--clients', type=int, default=4, help='Concurrent clients of the single-address requests.')
+    arg_parser.add_argument('--requests', type=int, default=2000, help='Number of single-address requests.')
+    arg_parser.add_argument('--batch', type=int, default=100000, help='Addresses of the batch request.')
+    args = arg_parser.parse_args()
+
+    addresses = load_addresses('shopee_admin_units.csv', ['ward', 'district', 'province'])
+    expected = {}
+    for address in set(addresses):
+        try:
+            expected[address] = parse_address(address, mode='LEGACY').to_dict()
+        except Exception:
+            pass
+
+    server = create_server(port=0, workers=args.workers, quiet=True)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f'Server on port {port} with {server.workers} workers')
+
+    # SINGLE-ADDRESS REQUESTS
+    singles = (addresses * (args.requests // len(addresses) + 1))[:args.requests]
+    parts = [singles[i::args.clients] for i in range(args.clients)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.clients) as executor:
+        results = list(executor.map(run_client, [port] * args.clients, parts))
+    seconds = time.perf_counter() - start
+    mismatches = sum(r != expected[a] for part, rs in zip(parts, results) for a, r in zip(part, rs) if a in expected)
+    print(f'GET /parse:        {args.requests:>9,} requests, {args.clients} clients, {args.requests / seconds:>8,.0f} requests/s, {mismatches} mismatches')
+
+    # BATCH REQUEST
+    batch = (addresses * (args.batch // len(addresses) + 1))[:args.batch]
+    start = time.perf_counter()
+    results = run_batch(port, batch)
+    seconds = time.perf_counter() - start
+    mismatches = sum(r != expected[a] for a, r in zip(batch, results) if a in expected)
+    print(f'POST /parse/batch: {len(results):>9,} addresses, {args.batch / seconds:>8,.0f} addresses/s, {mismatches} mismatches')
+
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    print(json.dumps(request(connection, 'GET', '/stats'), indent=2))
+    connection.close()
+
+    server.shutdown()
+    server.server_close()
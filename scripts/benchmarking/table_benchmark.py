@@ -0,0 +1,66 @@
+'''
+`parse_addresses_table()` against `parse_addresses()` followed by one attribute pass per column, on the Shopee test
+dataset with every address repeated (shuffled). Checks both give the same values, then compares their speed.
+
+Usage:
+    python scripts/benchmarking/table_benchmark.py
+    python scripts/benchmarking/table_benchmark.py --repeat 50 --output arrow
+'''
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits import parse_addresses, set_cache_size
+from vietnamadminunits.pandas import parse_addresses_table
+from vietnamadminunits.pandas.table import default_columns, COLUMN_TYPES
+
+from parser_benchmark import load_addresses
+
+
+def clean(value, column):
+    # Same representation for both tables: None for missing values, int for codes
+    if value is None or value is pd.NA or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return int(value) if COLUMN_TYPES[column] == 'int' else value
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--repeat', type=int, default=20, help='How many times each address appears.')
+    arg_parser.add_argument('--output', default='pandas', choices=['pandas', 'arrow'])
+    args = arg_parser.parse_args()
+    set_cache_size(0)  # Measure the parser, not the address cache
+
+    addresses = load_addresses('shopee_admin_units.csv', ['ward', 'district', 'province']) * args.repeat
+    random.Random(0).shuffle(addresses)
+    columns = default_columns(district=True)
+    parse_addresses(addresses[:100], mode='LEGACY', level=3)  # Load the data
+
+    start = time.perf_counter()
+    units = parse_addresses(addresses, mode='LEGACY', level=3)
+    objects_table = pd.DataFrame({column: [getattr(unit, column) for unit in units] for column in columns})
+    objects_time = time.perf_counter() - start
+    del units
+
+    start = time.perf_counter()
+    table = parse_addresses_table(addresses, mode='LEGACY', level=3, output=args.output)
+    table_time = time.perf_counter() - start
+
+    mismatches = sum(
+        clean(a, column) != clean(b, column)
+        for column in columns
+        for a, b in zip(table[column].to_pylist() if args.output == 'arrow' else table[column].tolist(), objects_table[column].tolist())
+    )
+    print(f'{len(addresses):,} addresses, {len(columns)} columns, {mismatches} different values')
+    print(f'AdminUnit objects + getattr: {objects_time:>6.2f} s')
+    print(f'parse_addresses_table():     {table_time:>6.2f} s ({objects_time / table_time:.1f}x)')
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,28 @@
+'''
+Build the binary snapshots of the module data: `vietnamadminunits/data/*.snapshot`.
+
+A snapshot holds the lookup tables and keyword indexes derived from a JSON file, so they do not have to be parsed and
+built on every process start. Run this script again after changing a JSON file in `vietnamadminunits/data`, or the
+module falls back to the JSON file (with a warning) because the snapshot checksum no longer matches.
+
+Usage:
+    python scripts/generating_module_data/s10_generating_snapshot_data.py
+'''
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits.parser import parser_legacy, parser_from_2025
+from vietnamadminunits.converter import converter_2025
+from vietnamadminunits.parser.snapshot import write_snapshot
+
+
+if __name__ == '__main__':
+    for module in [parser_legacy, parser_from_2025, converter_2025]:
+        with open(module.DATA_FILE, 'r') as f:
+            data = module.build_data(json.load(f))
+        write_snapshot(module.SNAPSHOT_FILE, module.DATA_FILE, data, province_tables=module.PROVINCE_TABLES)
+        print(f'{module.SNAPSHOT_FILE.name}: {module.SNAPSHOT_FILE.stat().st_size / 1e6:.2f} MB (JSON: {module.DATA_FILE.stat().st_size / 1e6:.2f} MB)')
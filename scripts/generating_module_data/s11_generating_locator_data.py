@@ -0,0 +1,51 @@
+'''
+Build `vietnamadminunits/data/locator_2025.json`, the data of `vietnamadminunits.locate()`.
+
+For every 34-province ward of `parser_from_2025.json`, it stores the ward area from
+`data/processed/2025_34-province-3221-ward_with_location.csv` and the bounds of the square of that area centered on the
+ward location (none if the area is unknown), the same square the converter uses to choose between the new wards of
+a divided old ward.
+
+Usage:
+    python scripts/generating_module_data/s11_generating_locator_data.py
+'''
+import csv
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits.parser.utils import square_bounds
+
+WARD_FILE = ROOT_DIR / 'data/processed/2025_34-province-3221-ward_with_location.csv'
+PARSER_FILE = ROOT_DIR / 'vietnamadminunits/data/parser_from_2025.json'
+LOCATOR_FILE = ROOT_DIR / 'vietnamadminunits/data/locator_2025.json'
+
+
+if __name__ == '__main__':
+    with open(WARD_FILE, encoding='utf-8') as f:
+        area_by_code = {int(row['wardCode']): float(row['wardAreaKm2']) if row['wardAreaKm2'] else None for row in csv.DictReader(f)}
+
+    with open(PARSER_FILE, encoding='utf-8') as f:
+        parser_data = json.load(f)
+
+    wards = []
+    # Ward keys of the parser: accented keys only for the wards whose unaccented names collide in a province
+    for table in ['DICT_PROVINCE_WARD_NO_ACCENTED', 'DICT_PROVINCE_WARD_ACCENTED']:
+        for province_key, province_wards in parser_data[table].items():
+            for ward_key, ward in province_wards.items():
+                area_km2 = area_by_code[int(ward['wardCode'])]
+                # A few wards have no area: no square, they are only found as the nearest ward
+                bounds = square_bounds((ward['wardLat'], ward['wardLon']), area_km2) if area_km2 else [None] * 4
+                wards.append([province_key, ward_key, area_km2, *bounds])
+
+    assert len(wards) == len(area_by_code), 'Every ward of the CSV must be in parser_from_2025.json'
+
+    with open(LOCATOR_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'COLUMNS': ['provinceKey', 'wardKey', 'wardAreaKm2', 'south', 'west', 'north', 'east'],
+            'WARDS': wards,
+        }, f, ensure_ascii=False)
+    print(f'{LOCATOR_FILE.name}: {len(wards)} wards, {LOCATOR_FILE.stat().st_size / 1e6:.2f} MB')
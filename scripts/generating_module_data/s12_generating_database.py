@@ -0,0 +1,111 @@
+'''
+Build `vietnamadminunits/data/dataset.db`, the SQLite database of `vietnamadminunits.database`.
+
+Tables:
+    admin_units          One row per 34-province ward, from `data/processed/2025_34-province-3221-ward_with_location.csv`,
+                         with the province and ward keys of `parser_from_2025.json`.
+    admin_units_legacy   One row per 63-province ward, from the lookup tables of `parser_legacy.json`, and one row with
+                         NULL ward columns per district without wards.
+
+The database is opened read-only and immutable by the package, so rebuild it rather than modify it in place.
+
+Usage:
+    python scripts/generating_module_data/s12_generating_database.py
+'''
+import csv
+import json
+import sqlite3
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+
+WARD_FILE = ROOT_DIR / 'data/processed/2025_34-province-3221-ward_with_location.csv'
+PARSER_FROM_2025_FILE = ROOT_DIR / 'vietnamadminunits/data/parser_from_2025.json'
+PARSER_LEGACY_FILE = ROOT_DIR / 'vietnamadminunits/data/parser_legacy.json'
+DATABASE_FILE = ROOT_DIR / 'vietnamadminunits/data/dataset.db'
+
+# {column: SQLite type}, in table order. Codes are integers in both tables, as the code columns of `parse_addresses_table()`.
+ADMIN_UNITS_COLUMNS = {
+    'province': 'TEXT', 'ward': 'TEXT', 'provinceShort': 'TEXT', 'wardShort': 'TEXT', 'wardType': 'TEXT',
+    'provinceCode': 'INTEGER', 'provinceLat': 'REAL', 'provinceLon': 'REAL',
+    'wardCode': 'INTEGER', 'wardLat': 'REAL', 'wardLon': 'REAL', 'wardAreaKm2': 'REAL',
+    'provinceKey': 'TEXT', 'wardKey': 'TEXT',
+}
+ADMIN_UNITS_LEGACY_COLUMNS = {
+    'province': 'TEXT', 'district': 'TEXT', 'ward': 'TEXT',
+    'provinceShort': 'TEXT', 'districtShort': 'TEXT', 'wardShort': 'TEXT', 'districtType': 'TEXT', 'wardType': 'TEXT',
+    'provinceCode': 'INTEGER', 'provinceLat': 'REAL', 'provinceLon': 'REAL',
+    'districtCode': 'INTEGER', 'districtLat': 'REAL', 'districtLon': 'REAL',
+    'wardCode': 'INTEGER', 'wardLat': 'REAL', 'wardLon': 'REAL',
+    'provinceKey': 'TEXT', 'districtKey': 'TEXT', 'wardKey': 'TEXT',
+}
+CONVERTERS = {'TEXT': str, 'INTEGER': int, 'REAL': float}
+
+
+def admin_units_rows() -> list:
+    with open(PARSER_FROM_2025_FILE, encoding='utf-8') as f:
+        parser_data = json.load(f)
+
+    # (provinceCode, wardCode) -> keys. Accented keys only exist for the wards whose unaccented names collide.
+    keys = {}
+    for table in ['DICT_PROVINCE_WARD_NO_ACCENTED', 'DICT_PROVINCE_WARD_ACCENTED', 'DICT_PROVINCE_WARD_SHORT_ACCENTED']:
+        for province_key, wards in parser_data[table].items():
+            province_code = int(parser_data['DICT_PROVINCE'][province_key]['provinceCode'])
+            for ward_key, ward in wards.items():
+                keys.setdefault((province_code, int(ward['wardCode'])), (province_key, ward_key))
+
+    rows = []
+    with open(WARD_FILE, encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            row['provinceKey'], row['wardKey'] = keys[(int(row['provinceCode']), int(row['wardCode']))]
+            rows.append(row)
+    return rows
+
+
+def admin_units_legacy_rows() -> list:
+    with open(PARSER_LEGACY_FILE, encoding='utf-8') as f:
+        parser_data = json.load(f)
+
+    # The 3 ward tables split the wards by the variant of their keyword, a few wards are in 2 of them. Districts
+    # without wards (island districts) have one placeholder ward of NaN values: a row with NULL ward columns.
+    rows = {}
+    for table in ['DICT_PROVINCE_DISTRICT_WARD_NO_ACCENTED', 'DICT_PROVINCE_DISTRICT_WARD_ACCENTED', 'DICT_PROVINCE_DISTRICT_WARD_SHORT_ACCENTED']:
+        for province_key, districts in parser_data[table].items():
+            province = parser_data['DICT_PROVINCE'][province_key]
+            for district_key, wards in districts.items():
+                district = parser_data['DICT_PROVINCE_DISTRICT'][province_key][district_key]
+                for ward_key, ward in wards.items():
+                    ward = {k: None if v != v else v for k, v in ward.items()}  # NaN -> None
+                    code = (district['districtCode'], ward['wardCode'] or '')
+                    if code not in rows:
+                        rows[code] = {
+                            **province, **district, **ward,
+                            'provinceKey': province_key, 'districtKey': district_key, 'wardKey': ward_key if ward['wardCode'] else None,
+                        }
+    return [rows[code] for code in sorted(rows)]  # Official order
+
+
+def write_table(conn: sqlite3.Connection, table: str, columns: dict, rows: list):
+    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    definitions = ', '.join(f'"{column}" {type_}' for column, type_ in columns.items())
+    conn.execute(f'CREATE TABLE "{table}" ({definitions})')
+    values = [
+        tuple(None if row[c] in [None, ''] else CONVERTERS[t](row[c]) for c, t in columns.items())
+        for row in rows
+    ]
+    conn.executemany(f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(columns))})', values)
+    print(f'{table}: {len(values):,} rows')
+
+
+if __name__ == '__main__':
+    DATABASE_FILE.unlink(missing_ok=True)
+    with sqlite3.connect(DATABASE_FILE) as conn:
+        write_table(conn, 'admin_units', ADMIN_UNITS_COLUMNS, admin_units_rows())
+        write_table(conn, 'admin_units_legacy', ADMIN_UNITS_LEGACY_COLUMNS, admin_units_legacy_rows())
+    conn.close()
+
+    # Compact the file, it is shipped with the package
+    conn = sqlite3.connect(DATABASE_FILE)
+    conn.execute('VACUUM')
+    conn.close()
+    print(f'{DATABASE_FILE.relative_to(ROOT_DIR)}: {DATABASE_FILE.stat().st_size / 1e6:.1f} MB')
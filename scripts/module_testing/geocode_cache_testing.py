@@ -0,0 +1,79 @@
+'''
+Check the keys of the persistent geocode cache: addresses differing only by accents are cached apart, while case,
+spacing and Unicode composition variants share one entry. Also checks that the converter only persists the results
+of geocoders with a `cache_namespace`, each under its own namespace.
+
+Usage:
+    python scripts/module_testing/geocode_cache_testing.py
+'''
+import sys
+import tempfile
+import unicodedata
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits.converter import Geocoder, GeocodeCache, set_geocode_cache, geocode
+from vietnamadminunits.parser import parse_address_legacy
+
+DISTINCT = [
+    ('12 Lê Lợi, Phường Hòa Thuận, Quận Hải Châu', '12 Lê Lôi, Phường Hoà Thuân, Quận Hải Châu'),
+    ('Phường Hương Vân, Thị xã Hương Trà', 'Phường Hương Văn, Thị xã Hương Trà'),
+]
+SAME = [
+    ('12 Lê Lợi, Phường Hòa Thuận', '12  lê lợi , PHƯỜNG HÒA THUẬN'),
+    ('12 Lê Lợi, Phường Hòa Thuận', unicodedata.normalize('NFD', '12 Lê Lợi, Phường Hòa Thuận')),
+]
+
+ADDRESS = '12 Lê Lợi, Phường Hòa Thuận Tây, Quận Hải Châu, Thành phố Đà Nẵng'
+
+
+class StubGeocoder(Geocoder):
+    def __init__(self, point, cache_namespace=None):
+        self.point = point
+        self.cache_namespace = cache_namespace
+
+    def geocode(self, unit):
+        return self.point
+
+
+def check_namespaces(cache: GeocodeCache) -> list:
+    '''
+    :return: List of failed checks of the converter's use of the cache.
+    '''
+    set_geocode_cache(cache)
+    unit = parse_address_legacy(ADDRESS, keep_street=True, level=3)
+    failed = []
+
+    cache.clear()
+    geocode(unit, StubGeocoder((1.0, 2.0)))
+    if cache.info().currsize:
+        failed.append('a geocoder without cache_namespace was persisted')
+
+    geocode(unit, StubGeocoder((1.0, 2.0), cache_namespace='a'))
+    point = geocode(unit, StubGeocoder((3.0, 4.0), cache_namespace='b'))
+    if point != (3.0, 4.0):
+        failed.append(f'geocoder b got the point {point} of geocoder a')
+    point = geocode(unit, StubGeocoder((5.0, 6.0), cache_namespace='a'))
+    if point != (1.0, 2.0):
+        failed.append(f'geocoder a did not get its cached point, got {point}')
+    return failed
+
+
+if __name__ == '__main__':
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = GeocodeCache(path=Path(tmp) / 'geocode.sqlite3')
+        for expected, pairs in [('distinct', DISTINCT), ('same', SAME)]:
+            for a, b in pairs:
+                cache.clear()
+                cache.put(a, (1.0, 2.0))
+                result = 'same' if cache.get(b) is not None else 'distinct'
+                failed += result != expected
+                print(f"{'OK' if result == expected else 'FAIL':<4}  {expected}: {a!r} / {b!r}")
+        for failure in check_namespaces(cache):
+            failed += 1
+            print(f'FAIL  {failure}')
+    print(f'{failed} checks failed' if failed else 'OK')
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,77 @@
+'''
+Check `locate_many()` on points far from every ward: (0, 0) geocodes, random points over the world and invalid
+coordinates. They get a ward (or `None` with `max_distance_km`), and the peak memory of the spatial queries stays
+bounded. Also checks the nearest wards of points near Vietnam against a brute-force great-circle search, for the
+points within `EXACT_DISTANCE_KM` of a ward.
+
+Usage:
+    python scripts/module_testing/locate_testing.py
+'''
+import sys
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+from vietnamadminunits import locate_many
+from vietnamadminunits.locator import locator_2025
+
+MAX_PEAK_MB = 200
+
+
+def brute_force_mismatches(latitudes, longitudes) -> tuple:
+    '''
+    :return: `(checked, mismatches)`: number of points within `EXACT_DISTANCE_KM` of a ward, and number of them whose
+        ward location is farther than the nearest one by great-circle distance.
+    '''
+    ward_indexes = np.arange(len(locator_2025.WARD_UNITS))
+    nearest = locator_2025.nearest_ward_indexes(latitudes, longitudes)
+    checked = mismatches = 0
+    for latitude, longitude, index in zip(latitudes, longitudes, nearest):
+        distances = locator_2025.haversine_km_many(np.full(len(ward_indexes), latitude), np.full(len(ward_indexes), longitude), ward_indexes)
+        if distances.min() <= locator_2025.EXACT_DISTANCE_KM:
+            checked += 1
+            mismatches += distances[index] > distances.min()
+    return checked, mismatches
+
+
+if __name__ == '__main__':
+    locator_2025.load_data()
+    rng = np.random.default_rng(0)
+    failed = []
+
+    # FAR POINTS
+    n = 20000
+    latitudes = np.concatenate([np.zeros(n), rng.uniform(-90, 90, n), [np.nan, 0.0, np.inf]])
+    longitudes = np.concatenate([np.zeros(n), rng.uniform(-180, 180, n), [0.0, np.nan, 0.0]])
+
+    tracemalloc.start()
+    units = locate_many(latitudes, longitudes)
+    peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    print(f'{len(units)} far points located, peak memory {peak_mb:.0f} MB')
+    if peak_mb > MAX_PEAK_MB:
+        failed.append(f'peak memory {peak_mb:.0f} MB > {MAX_PEAK_MB} MB')
+    if any(u is None for u in units[:2 * n]) or any(u is not None for u in units[2 * n:]):
+        failed.append('far points without a ward, or invalid points with one')
+
+    units = locate_many(latitudes, longitudes, max_distance_km=100)
+    outside = sum(u is not None for u in units[:n])
+    print(f'{outside} (0, 0) points within 100 km of a ward')
+    if outside:
+        failed.append('(0, 0) points located with max_distance_km=100')
+
+    # NEAR POINTS
+    sample = 5000
+    checked, mismatches = brute_force_mismatches(rng.uniform(7.5, 24.5, sample), rng.uniform(101.5, 110.5, sample))
+    print(f'{checked} points near Vietnam, {mismatches} not located to the nearest ward by great-circle distance')
+    if mismatches:
+        failed.append(f'{mismatches} nearest wards mismatched')
+
+    for failure in failed:
+        print(f'FAIL  {failure}')
+    print('OK' if not failed else f'{len(failed)} checks failed')
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,62 @@
+'''
+Check that `standardize_parquet()` writes the same rows as `standardize_admin_unit_columns()` on the test datasets,
+for every combination of parse or convert mode and `inplace`. Requires pyarrow.
+
+Usage:
+    python scripts/module_testing/parquet_testing.py
+'''
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, ROOT_DIR.as_posix())
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from vietnamadminunits.pandas import standardize_admin_unit_columns, standardize_parquet
+
+DATA_DIR = ROOT_DIR / 'scripts/module_testing/data'
+CASES = [
+    dict(parse_mode='LEGACY'),
+    dict(parse_mode='LEGACY', inplace=True),
+    dict(parse_mode='LEGACY', short_name=False),
+    dict(convert_mode='CONVERT_2025'),
+    dict(convert_mode='CONVERT_2025', inplace=True),
+]
+
+
+def compare(df: pd.DataFrame, source: Path, destination: Path, **kwargs) -> list:
+    '''
+    :return: List of differences between the two outputs, empty if they are the same.
+    '''
+    expected = standardize_admin_unit_columns(df, province='province', district='district', ward='ward', show_progress=False, **kwargs)
+    standardize_parquet(source, destination, province='province', district='district', ward='ward', show_progress=False, **kwargs)
+    result = pq.read_table(destination).to_pandas()
+
+    if list(result.columns) != list(expected.columns):
+        return [f'columns {list(result.columns)} != {list(expected.columns)}']
+    differences = []
+    for column in expected.columns:
+        a = result[column].astype(object).where(result[column].notna(), None).tolist()
+        b = expected[column].astype(object).where(expected[column].notna(), None).tolist()
+        mismatches = sum(x != y for x, y in zip(a, b))
+        if mismatches:
+            differences.append(f'{column}: {mismatches} different rows')
+    return differences
+
+
+if __name__ == '__main__':
+    df = pd.read_csv(DATA_DIR / 'shopee_admin_units.csv', dtype=str)
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        source, destination = Path(tmp) / 'source.parquet', Path(tmp) / 'destination.parquet'
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), source, row_group_size=5000)
+        for kwargs in CASES:
+            differences = compare(df, source, destination, **kwargs)
+            failed += bool(differences)
+            print(f"{'FAIL' if differences else 'OK':<4}  {kwargs}" + ''.join(f'\n      {d}' for d in differences))
+    print(f'{len(CASES) - failed} of {len(CASES)} cases match')
+    sys.exit(1 if failed else 0)
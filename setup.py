@@ -17,7 +17,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     package_data={
-        "vietnamadminunits": ["data/*.json", "data/*.db"],
+        "vietnamadminunits": ["data/*.json", "data/*.snapshot", "data/*.db"],
     },
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -28,8 +28,11 @@ setup(
         "Natural Language :: Vietnamese"
     ],
     python_requires='>=3.7',
+    entry_points={
+        "console_scripts": ["vietnamadminunits=vietnamadminunits.cli:main"],
+    },
     install_requires=[
-        "shapely",
+        "shapely>=2.0",
         "geopy",
         "unidecode",
         "tqdm"
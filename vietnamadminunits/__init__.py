@@ -1,2 +1,29 @@
-from .parser import parse_address, ParseMode
-from .converter import convert_address, ConvertMode
\ No newline at end of file
+from .parser import parse_address, parse_addresses, ParseMode
+from .converter import convert_address, aconvert_address, aconvert_addresses, ConvertMode, CentroidGeocoder, ArcGISGeocoder, set_default_geocoder, GeocodeCache, set_geocode_cache
+from .locator import locate, locate_many, LocateMode
+from .parser.cache import cache_info, cache_clear, set_cache_size
+from .parser.profiling import profile_stages, add_stage_callback, remove_stage_callback
+import gc
+
+
+def preload(freeze: bool=True):
+    '''
+    Load every dataset, lookup table, index and keyword matcher now instead of on first use.
+
+    Call it once in the parent process before forking workers (gunicorn `--preload`, uwsgi without `lazy-apps`,
+    `multiprocessing` with the fork start method), so every worker shares the same memory pages.
+
+    :param freeze: Move every object created so far to the permanent generation of the garbage collector (`gc.freeze()`), so collections in the workers do not touch, and therefore copy, the shared pages.
+    '''
+    from .parser import parser_legacy, parser_from_2025
+    from .converter import converter_2025
+    from .locator import locator_2025
+
+    parser_legacy.preload_data()
+    parser_from_2025.preload_data()
+    converter_2025.preload_data()
+    locator_2025.preload_data()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
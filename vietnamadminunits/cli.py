@@ -0,0 +1,304 @@
+'''
+Command-line tool: parse or convert the addresses of CSV or JSONL files, streamed in chunks.
+
+Usage:
+    python -m vietnamadminunits parse addresses.csv -o parsed.csv --column address --mode LEGACY --level 3
+    python -m vietnamadminunits convert addresses.jsonl -o converted.jsonl --column ward district province
+    cat addresses.csv | python -m vietnamadminunits convert --workers 4 > converted.csv
+
+Rows are read, processed and written one chunk at a time, so memory stays constant whatever the input size. Output
+rows are the input rows, in input order, plus one column per output field (`--fields`) prefixed by `--prefix`.
+'''
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from operator import attrgetter
+from typing import List
+
+from .parser import ParseMode, parse_unique_addresses
+from .parser.cache import LRUCache
+from .parser.objects import AdminUnit
+from .parser.profiling import StageProfiler, add_stage_callback
+from .converter import ConvertMode, convert_unique_addresses, CentroidGeocoder, ArcGISGeocoder
+from .pandas.table import default_columns
+
+
+GEOCODERS = {'centroid': CentroidGeocoder, 'arcgis': ArcGISGeocoder}
+
+
+# WORKERS
+def _init_worker():
+    import gc
+    from . import preload
+    preload(freeze=False)  # Nothing to load if forked: the data is inherited from the parent
+    # Freeze without the collection of `preload()`: it would write to every inherited object, copying the shared pages
+    gc.freeze()
+
+
+def process_addresses(addresses: List[str], command: str, mode: str, level: int, keep_street: bool, fields: List[str], geocoder=None):
+    '''
+    :param addresses: List of distinct addresses.
+    :param command: `'parse'` or `'convert'`. `mode` and `level` must be valid, see `run()`.
+    :return: `(values, errors)`: values of `fields` for each address, in order, and the number of addresses that raised an error (their values are empty).
+    '''
+    def process(addresses):
+        if command == 'parse':
+            units, indexes = parse_unique_addresses(addresses, mode=mode, keep_street=keep_street, level=level)
+        else:
+            units, indexes = convert_unique_addresses(addresses, mode=mode, geocoder=geocoder)
+        getter = attrgetter(*fields) if len(fields) > 1 else (lambda unit: (getattr(unit, fields[0]),))
+        values = [getter(unit) for unit in units]
+        return [values[i] for i in indexes]
+
+    try:
+        return process(addresses), 0
+    except Exception:
+        pass
+
+    # One address of the chunk raised: process them one by one, so only that row is left empty
+    values = []
+    errors = 0
+    for address in addresses:
+        try:
+            values += process([address])
+        except Exception:
+            values.append((None,) * len(fields))
+            errors += 1
+    return values, errors
+
+
+# READERS AND WRITERS
+def detect_format(path: str, default: str='csv') -> str:
+    if path and path != '-' and os.path.splitext(path)[1].lower() in ['.jsonl', '.ndjson']:
+        return 'jsonl'
+    return default
+
+
+def read_rows(paths: List[str], input_format: str):
+    '''
+    :return: `(fieldnames, rows)`: the CSV header of the first input (`None` for JSONL) and an iterator of row dicts.
+    '''
+    import csv
+    import json
+
+    def open_input(path):
+        if path == '-':
+            return sys.stdin
+        return open(path, encoding='utf-8', newline='')
+
+    if input_format == 'jsonl':
+        def rows():
+            for path in paths:
+                f = open_input(path)
+                try:
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+                finally:
+                    if f is not sys.stdin:
+                        f.close()
+        return None, rows()
+
+    # The first header is read now, to write the output header before the first row
+    first = open_input(paths[0])
+    first_reader = csv.DictReader(first)
+    fieldnames = first_reader.fieldnames or []
+
+    def rows():
+        for i, path in enumerate(paths):
+            f = first if i == 0 else open_input(path)
+            try:
+                yield from first_reader if i == 0 else csv.DictReader(f)
+            finally:
+                if f is not sys.stdin:
+                    f.close()
+    return fieldnames, rows()
+
+
+class RowWriter:
+    '''
+    Write rows to a CSV or JSONL output as they come.
+    '''
+    def __init__(self, f, output_format: str, fieldnames: List[str]=None):
+        import csv
+        import json
+
+        self.output_format = output_format
+        self._dumps = json.dumps
+        self._f = f
+        if output_format == 'csv':
+            self._writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore', lineterminator='\n')
+            self._writer.writeheader()
+
+    def write_rows(self, rows: List[dict]):
+        if self.output_format == 'csv':
+            self._writer.writerows(rows)
+        else:
+            self._f.writelines(self._dumps(row, ensure_ascii=False) + '\n' for row in rows)
+
+
+# PIPELINE
+def chunked(iterable, size: int):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run(args) -> dict:
+    '''
+    Stream the inputs through the parser or converter to the output.
+
+    :param args: Parsed command-line arguments, see `build_arg_parser()`.
+    :return: Statistics: `rows`, `processed` (distinct addresses parsed or converted), `errors` (distinct addresses that raised an error, left empty), `seconds`.
+    '''
+    mode = (args.mode or (ParseMode.latest().value if args.command == 'parse' else ConvertMode.CONVERT_2025.value)).upper()
+    available = ParseMode.available(value=True) if args.command == 'parse' else ConvertMode.available(value=True)
+    if mode not in available:
+        raise ValueError(f"Invalid mode. Available modes are {available}.")
+    if args.command == 'parse' and args.level:
+        # Checked once here: in the stream, an error is an address error and only empties its row
+        levels = [1, 2] if mode == ParseMode.FROM_2025.value else [1, 2, 3]
+        if args.level not in levels:
+            raise ValueError(f'Invalid level. Available levels of {mode} mode are {levels}.')
+    fields = args.fields or default_columns(district=args.command == 'parse' and mode == ParseMode.LEGACY.value)
+    unknown = [f for f in fields if f not in AdminUnit.FIELDS]
+    if unknown:
+        raise ValueError(f'Invalid fields {unknown}. Available fields are {list(AdminUnit.FIELDS)}.')
+    prefix = args.prefix if args.prefix is not None else 'parsed_' if args.command == 'parse' else 'converted_'
+    output_columns = [f'{prefix}{field}' for field in fields]
+    geocoder = GEOCODERS[args.geocoder]() if args.command == 'convert' else None
+
+    paths = args.inputs or ['-']
+    input_format = args.format or detect_format(paths[0])
+    output_format = args.output_format or (detect_format(args.output, default=input_format) if args.output else input_format)
+    fieldnames, rows = read_rows(paths, input_format)
+    missing_columns = [column for column in args.column if fieldnames is not None and column not in fieldnames]
+    if missing_columns:
+        raise ValueError(f'Columns {missing_columns} are not in the input. Available columns are {fieldnames}.')
+
+    def address_of(row):
+        return ', '.join(str(row.get(column) or '') for column in args.column)
+
+    task = dict(command=args.command, mode=mode, level=args.level, keep_street=not args.no_street, fields=fields, geocoder=geocoder)
+    cache = LRUCache(maxsize=args.cache_size)  # Rolling deduplication across chunks
+    stats = {'rows': 0, 'processed': 0, 'errors': 0, 'seconds': 0.0}
+    start = time.perf_counter()
+
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output and args.output != '-' else sys.stdout
+    try:
+        writer = RowWriter(out, output_format, (fieldnames or []) + output_columns)
+
+        def submit(chunk):
+            # Split a chunk of rows into its addresses, cached values and distinct addresses still to process
+            addresses = [address_of(row) for row in chunk]
+            values = {}
+            missing = []
+            for address in dict.fromkeys(addresses):
+                cached = cache.get(address)
+                if cached is None:
+                    missing.append(address)
+                else:
+                    values[address] = cached
+            return chunk, addresses, values, missing
+
+        def finish(chunk, addresses, values, missing, result):
+            missing_values, errors = result
+            for address, address_values in zip(missing, missing_values):
+                values[address] = address_values
+                cache.put(address, address_values)
+            for row, address in zip(chunk, addresses):
+                row.update(zip(output_columns, values[address]))
+            writer.write_rows(chunk)
+            stats['rows'] += len(chunk)
+            stats['processed'] += len(missing)
+            stats['errors'] += errors
+
+        chunks = map(submit, chunked(rows, args.chunksize))
+        if args.workers == 1:
+            for chunk, addresses, values, missing in chunks:
+                finish(chunk, addresses, values, missing, process_addresses(missing, **task) if missing else ([], 0))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            from . import preload
+
+            workers = args.workers if args.workers > 0 else os.cpu_count() or 1
+            # Load the data in this process first: forked workers then start with it and share its memory pages
+            preload(freeze=False)
+            # At most 2 chunks per worker in flight, written in input order
+            pending = deque()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                for chunk, addresses, values, missing in chunks:
+                    pending.append((chunk, addresses, values, missing, executor.submit(process_addresses, missing, **task)))
+                    while len(pending) > 2 * workers or (pending and pending[0][-1].done()):
+                        *item, future = pending.popleft()
+                        finish(*item, future.result())
+                while pending:
+                    *item, future = pending.popleft()
+                    finish(*item, future.result())
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
+        stats['seconds'] = time.perf_counter() - start
+
+    return stats
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(prog='python -m vietnamadminunits', description='Parse or convert the addresses of CSV or JSONL files.')
+    arg_parser.add_argument('command', choices=['parse', 'convert'], help='parse: standardize addresses. convert: convert old (63-province) addresses to the new (34-province) system.')
+    arg_parser.add_argument('inputs', nargs='*', help='Input CSV or JSONL files (.jsonl, .ndjson), - for stdin. Default is stdin.')
+    arg_parser.add_argument('-o', '--output', help='Output file, - for stdout. Default is stdout.')
+    arg_parser.add_argument('--format', choices=['csv', 'jsonl'], help='Input format. Default is from the first input file extension, else csv.')
+    arg_parser.add_argument('--output-format', choices=['csv', 'jsonl'], help='Output format. Default is from the output file extension, else the input format.')
+    arg_parser.add_argument('-c', '--column', nargs='+', default=['address'], help='Address column, or columns joined with commas, e.g. ward district province. Default is address.')
+    arg_parser.add_argument('-m', '--mode', help=f'parse: {ParseMode.available(value=True)}, default {ParseMode.latest().value}. convert: {ConvertMode.available(value=True)}.')
+    arg_parser.add_argument('-l', '--level', type=int, default=0, help='parse: level, see parse_address(). Default is the highest level of the mode.')
+    arg_parser.add_argument('--no-street', action='store_true', help='parse: do not keep the street.')
+    arg_parser.add_argument('--geocoder', choices=list(GEOCODERS), default='centroid', help='convert: geocoder of divided wards. Default is centroid (offline).')
+    arg_parser.add_argument('-f', '--fields', nargs='+', help='AdminUnit fields to output. Default is every field except address and the keys.')
+    arg_parser.add_argument('--prefix', help='Prefix of the output columns. Default is parsed_ or converted_.')
+    arg_parser.add_argument('--chunksize', type=int, default=10000, help='Rows read, processed and written at a time. Default is 10000.')
+    arg_parser.add_argument('--cache-size', type=int, default=100000, help='Distinct addresses remembered across chunks, to process repeated addresses once. Default is 100000.')
+    arg_parser.add_argument('-j', '--workers', type=int, default=1, help='Worker processes, -1 for all CPUs. Default is 1, no worker process.')
+    arg_parser.add_argument('--profile', action='store_true', help='Report the time spent in each parser stage on stderr. Requires --workers 1.')
+    arg_parser.add_argument('-q', '--quiet', action='store_true', help='Do not report the throughput on stderr.')
+    return arg_parser
+
+
+def main(argv: List[str]=None):
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if args.chunksize < 1:
+        arg_parser.error('--chunksize must be a positive integer')
+    if args.workers == 0 or args.workers < -1:
+        arg_parser.error('--workers must be a positive integer, or -1 to use all CPUs')
+    if args.profile and args.workers != 1:
+        arg_parser.error('--profile requires --workers 1, the stages of worker processes are not timed')
+
+    profiler = StageProfiler()
+    if args.profile:
+        add_stage_callback(profiler.record)
+    try:
+        stats = run(args)
+    except BrokenPipeError:
+        # Output closed early, e.g. piped to `head`: stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    except (ValueError, OSError) as e:
+        arg_parser.exit(1, f'{arg_parser.prog}: error: {e}\n')
+
+    if not args.quiet:
+        rate = stats['rows'] / stats['seconds'] if stats['seconds'] else 0
+        errors = f", {stats['errors']:,} errors" if stats['errors'] else ''
+        print(f"{stats['rows']:,} rows ({stats['processed']:,} distinct addresses processed{errors}) in {stats['seconds']:.2f} s, {rate:,.0f} rows/s", file=sys.stderr)
+    if args.profile:
+        profiler.print_report(file=sys.stderr)
@@ -1,6 +1,11 @@
-from .converter_2025 import convert_address_2025
+from .converter_2025 import convert_address_2025, start_conversion, finish_conversion, geocode
+from .geocoders import Geocoder, CentroidGeocoder, ArcGISGeocoder, set_default_geocoder, get_default_geocoder, geocoder_key
+from .geocode_cache import GeocodeCache, set_geocode_cache, get_geocode_cache
+from ..parser.cache import ADDRESS_CACHE, cache_enabled
+from ..parser.utils import unicode_normalize
 from enum import Enum
-from typing import Union
+from typing import Union, Iterable
+import copy
 
 
 class ConvertMode(Enum):
@@ -14,16 +19,170 @@ class ConvertMode(Enum):
         return attrs
 
 
-def convert_address(address: str, mode: Union[str, ConvertMode]=ConvertMode.CONVERT_2025):
+def convert_address(address: str, mode: Union[str, ConvertMode]=ConvertMode.CONVERT_2025, geocoder: Geocoder=None):
     '''
     Converts an address written in the **old (63-province)** structure into an `AdminUnit` object using the **new (34-province)** system.
 
     :param address: The best structure is `(street), ward, district, province`. Don't worry too much about case or accenting.
     :param mode: One of the `ConvertMode` values. Currently, only `'CONVERT_2025'` is supported.
+    :param geocoder: Object with a `geocode(unit)` method, used to choose between the new wards of a divided old ward when the address has a street. Default is `get_default_geocoder()`, the offline `CentroidGeocoder()`.
     :return: AdminUnit object.
     '''
 
     if mode in [ConvertMode.CONVERT_2025, ConvertMode.CONVERT_2025.value]:
-        return convert_address_2025(address)
+        convert, start, finish = convert_address_2025, start_conversion, finish_conversion
     else:
-        raise Exception(f"Invalid mode. Available modes are {ConvertMode.available(value=True)}.")
\ No newline at end of file
+        raise Exception(f"Invalid mode. Available modes are {ConvertMode.available(value=True)}.")
+
+    if geocoder is None:
+        geocoder = get_default_geocoder()
+
+    address = unicode_normalize(address)
+    identity = geocoder_key(geocoder)
+    if not cache_enabled() or not isinstance(address, str) or identity is None:
+        return convert(address, geocoder=geocoder)
+
+    cache_key = ('CONVERT', ConvertMode(mode).value, identity, address)
+    unit = ADDRESS_CACHE.get(cache_key)
+    if unit is None:
+        conversion = start(address)
+        old_point = geocode(conversion.old_unit, geocoder) if conversion.needs_geocoding else None
+        unit = finish(conversion, old_point=old_point)
+        if cacheable(conversion, old_point):
+            ADDRESS_CACHE.put(cache_key, unit)
+    return unit
+
+
+def cacheable(conversion, old_point: tuple) -> bool:
+    '''
+    :return: `False` if the old ward is divided and the address could not be located, e.g. the geocoder failed or
+        timed out: its result is the default new ward, it is not cached so the address is located again next time.
+    '''
+    return not (conversion.needs_geocoding and old_point is None)
+
+
+def convert_unique_addresses(addresses: Iterable[str], mode: Union[str, ConvertMode]=ConvertMode.CONVERT_2025, geocoder: Geocoder=None):
+    '''
+    Convert each distinct address once, without building a result per input address.
+
+    :param addresses: Iterable of addresses.
+    :param mode: One of the `ConvertMode` values. Currently, only `'CONVERT_2025'` is supported.
+    :param geocoder: Object with a `geocode(unit)` method. Default is `get_default_geocoder()`.
+    :return: `(units, indexes)`: list of AdminUnit objects, one per distinct normalized address, and the index in `units` of each input address.
+    '''
+
+    if mode in [ConvertMode.CONVERT_2025, ConvertMode.CONVERT_2025.value]:
+        convert = convert_address_2025
+    else:
+        raise Exception(f"Invalid mode. Available modes are {ConvertMode.available(value=True)}.")
+
+    if geocoder is None:
+        geocoder = get_default_geocoder()
+
+    addresses = list(addresses)
+    normalized = {address: unicode_normalize(address) for address in dict.fromkeys(addresses)}
+
+    units = []
+    positions = {}
+    for address in dict.fromkeys(normalized.values()):
+        positions[address] = len(units)
+        units.append(convert(address, geocoder=geocoder))
+
+    return units, [positions[normalized[address]] for address in addresses]
+
+
+# ASYNC API
+# asyncio is imported inside the functions, so it is only loaded by asyncio users.
+async def aconvert_address(address: str, mode: Union[str, ConvertMode]=ConvertMode.CONVERT_2025, geocoder: Geocoder=None, timeout: float=None, executor=None, semaphore=None):
+    '''
+    Async `convert_address()`. Parsing and lookups run in `executor`, so they do not block the event loop.
+    Geocoding (divided old ward with a street) runs in `executor` too, at most `semaphore` at a time.
+
+    :param address: The best structure is `(street), ward, district, province`. Don't worry too much about case or accenting.
+    :param mode: One of the `ConvertMode` values. Currently, only `'CONVERT_2025'` is supported.
+    :param geocoder: Object with a `geocode(unit)` method. Default is `get_default_geocoder()`.
+    :param timeout: Seconds to wait for the geocoder. On timeout, the default new ward is used as if the address could not be located.
+    :param executor: `concurrent.futures.Executor` to run in. Default is the event loop's default executor.
+    :param semaphore: `asyncio.Semaphore` limiting concurrent geocoder calls, to share one limit between calls.
+    :return: AdminUnit object.
+    '''
+    import asyncio
+
+    if mode in [ConvertMode.CONVERT_2025, ConvertMode.CONVERT_2025.value]:
+        start, finish = start_conversion, finish_conversion
+    else:
+        raise Exception(f"Invalid mode. Available modes are {ConvertMode.available(value=True)}.")
+
+    if geocoder is None:
+        geocoder = get_default_geocoder()
+
+    address = unicode_normalize(address)
+    cache_key = None
+    identity = geocoder_key(geocoder)
+    if cache_enabled() and isinstance(address, str) and identity is not None:
+        cache_key = ('CONVERT', ConvertMode(mode).value, identity, address)
+        unit = ADDRESS_CACHE.get(cache_key)
+        if unit is not None:
+            return unit
+
+    loop = asyncio.get_running_loop()
+    conversion = await loop.run_in_executor(executor, start, address)
+
+    old_point = None
+    if conversion.needs_geocoding:
+        if getattr(geocoder, 'offline', False):
+            old_point = geocode(conversion.old_unit, geocoder)
+        else:
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                # The geocoder call keeps running in its thread after a timeout, its result is only ignored
+                old_point = await asyncio.wait_for(loop.run_in_executor(executor, geocode, conversion.old_unit, geocoder), timeout)
+            except asyncio.TimeoutError:
+                old_point = None
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+
+    unit = await loop.run_in_executor(executor, finish, conversion, old_point)
+    if cache_key is not None and cacheable(conversion, old_point):
+        ADDRESS_CACHE.put(cache_key, unit)
+    return unit
+
+
+async def aconvert_addresses(addresses: Iterable[str], mode: Union[str, ConvertMode]=ConvertMode.CONVERT_2025, geocoder: Geocoder=None, concurrency: int=10, timeout: float=None, executor=None) -> list:
+    '''
+    Async `convert_address()` of many addresses, geocoding up to `concurrency` addresses at a time.
+
+    :param addresses: Iterable of addresses.
+    :param mode: One of the `ConvertMode` values. Currently, only `'CONVERT_2025'` is supported.
+    :param geocoder: Object with a `geocode(unit)` method. Default is `get_default_geocoder()`.
+    :param concurrency: Maximum number of concurrent geocoder calls.
+    :param timeout: Seconds to wait for the geocoder, per address. See `aconvert_address()`.
+    :param executor: `concurrent.futures.Executor` to run in. Default is the event loop's default executor.
+    :return: List of AdminUnit objects, in input order. Repeated addresses are converted once and get distinct copies.
+    '''
+    import asyncio
+
+    if concurrency < 1:
+        raise ValueError('concurrency must be a positive integer')
+
+    addresses = list(addresses)
+    unique_addresses = list(dict.fromkeys(addresses))
+    semaphore = asyncio.Semaphore(concurrency)
+    units = await asyncio.gather(*[
+        aconvert_address(address, mode=mode, geocoder=geocoder, timeout=timeout, executor=executor, semaphore=semaphore)
+        for address in unique_addresses
+    ])
+    units = dict(zip(unique_addresses, units))
+
+    results = []
+    used = set()
+    for address in addresses:
+        unit = units[address]
+        if id(unit) in used:
+            unit = copy.copy(unit)
+        else:
+            used.add(id(unit))
+        results.append(unit)
+    return results
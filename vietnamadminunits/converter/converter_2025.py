@@ -1,44 +1,171 @@
 import json
 import sys
 from pathlib import Path
-import re
-
-from distributed.comm.inproc import new_address
+import threading
+from time import perf_counter
 
 MODULE_DIR = Path(__file__).parent.parent
 
 if __name__ == '__main__':
     sys.path.append(MODULE_DIR.as_posix())
-    from parser import parse_address, ParseMode
+    from parser import parse_address_legacy, parse_address_from_2025
     from parser.objects import AdminUnit
-    from parser.utils import get_geo_location, check_point_in_polygon, find_nearest_point
+    from parser.utils import square_bounds, point_in_bounds, find_nearest_point_fast, build_keyword_index
+    from parser.snapshot import read_snapshot
+    from parser import profiling
+    sys.path.append(Path(__file__).parent.as_posix())
+    from geocoders import Geocoder, get_default_geocoder
+    sys.path.append(MODULE_DIR.parent.as_posix())
+    from vietnamadminunits.converter.geocode_cache import get_geocode_cache  # Its relative imports need the package
 
 else:
-    from ..parser import parse_address, ParseMode
+    from ..parser import parse_address_legacy, parse_address_from_2025
     from ..parser.objects import AdminUnit
-    from ..parser.utils import get_geo_location, check_point_in_polygon, find_nearest_point
+    from ..parser.utils import square_bounds, point_in_bounds, find_nearest_point_fast, build_keyword_index
+    from ..parser.snapshot import read_snapshot
+    from ..parser import profiling
+    from .geocoders import Geocoder, get_default_geocoder
+    from .geocode_cache import get_geocode_cache
 
 
 # LOAD DATA
-with open(MODULE_DIR / 'data/converter_2025.json', 'r') as f:
-    converter_data = json.load(f)
-
-
-DICT_PROVINCE = converter_data['DICT_PROVINCE']
-DICT_PROVINCE_WARD_NO_DIVIDED = converter_data['DICT_PROVINCE_WARD_NO_DIVIDED']
-DICT_PROVINCE_WARD_DIVIDED = converter_data['DICT_PROVINCE_WARD_DIVIDED']
-
-
-# MAIN FUNCTION
-def convert_address_2025(address: str):
-
-    new_ward_key = None
-
-    # Parse old address to old admin unit
-    old_unit = parse_address(address, mode=ParseMode.LEGACY, keep_street=True, level=3)
+# The data is loaded on the first conversion (or first access to one of `DATA_NAMES`), not when the package is imported.
+DATA_FILE = MODULE_DIR / 'data/converter_2025.json'
+SNAPSHOT_FILE = MODULE_DIR / 'data/converter_2025.snapshot'  # Built from DATA_FILE by scripts/generating_module_data/s10_generating_snapshot_data.py
+DATA_NAMES = [
+    'converter_data',
+    'DICT_PROVINCE', 'DICT_PROVINCE_WARD_NO_DIVIDED', 'DICT_PROVINCE_WARD_DIVIDED',
+    'INDEX_PROVINCE', 'INDEX_PROVINCE_WARD_NO_DIVIDED', 'INDEX_PROVINCE_WARD_DIVIDED_BOUNDS',
+]
+# {province_key: table} tables, stored per province in the snapshot
+PROVINCE_TABLES = [
+    'DICT_PROVINCE_WARD_NO_DIVIDED',
+    'DICT_PROVINCE_WARD_DIVIDED',
+    'INDEX_PROVINCE_WARD_NO_DIVIDED',
+    'INDEX_PROVINCE_WARD_DIVIDED_BOUNDS',
+]
+_data_lock = threading.Lock()
+_data_loaded = False
+
+
+def build_data(converter_data: dict) -> dict:
+    '''
+    Build the lookup tables and old key -> new key indexes from `converter_2025.json`.
+
+    :param converter_data: Content of `converter_2025.json`.
+    :return: Dictionary of `{name: table}` for every name in `DATA_NAMES` except `converter_data`.
+    '''
+    data = {name: converter_data[name] for name in DATA_NAMES if name.startswith('DICT_')}
+
+    data['INDEX_PROVINCE'] = build_keyword_index(data['DICT_PROVINCE'])
+    data['INDEX_PROVINCE_WARD_NO_DIVIDED'] = {p: build_keyword_index(v) for p, v in data['DICT_PROVINCE_WARD_NO_DIVIDED'].items()}
+
+    # (south, west, north, east) of the square around each new ward of a divided old ward, in the order of DICT_PROVINCE_WARD_DIVIDED
+    data['INDEX_PROVINCE_WARD_DIVIDED_BOUNDS'] = {
+        p: {k: [square_bounds((w['newWardLat'], w['newWardLon']), w['newWardAreaKm2']) for w in new_wards] for k, new_wards in v.items()}
+        for p, v in data['DICT_PROVINCE_WARD_DIVIDED'].items()
+    }
+    return data
+
+
+def load_data():
+    '''
+    Load the lookup tables as module globals, only on the first call.
+    They are read from `SNAPSHOT_FILE`, or built from `converter_2025.json` if the snapshot is missing or stale.
+    '''
+    global _data_loaded
+    if _data_loaded:
+        return
+    with _data_lock:
+        if not _data_loaded:
+            data = read_snapshot(SNAPSHOT_FILE, DATA_FILE, [name for name in DATA_NAMES if name != 'converter_data'])
+            if data is None:
+                with open(DATA_FILE, 'r') as f:
+                    data = build_data(json.load(f))
+            data['converter_data'] = {name: data[name] for name in DATA_NAMES if name.startswith('DICT_')}
+            globals().update(data)
+            _data_loaded = True
+
+
+def preload_data():
+    '''
+    Load every lookup table now, instead of on first use.
+    '''
+    load_data()
+    for name in PROVINCE_TABLES:
+        for _ in globals()[name].values():  # Unpickle every province of the snapshot tables
+            pass
+
+
+def __getattr__(name):
+    if name in DATA_NAMES:
+        load_data()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def geocode(unit: AdminUnit, geocoder: Geocoder):
+    '''
+    Locate an old admin unit, from the persistent geocode cache if the geocoder has a `cache_namespace`.
+
+    :param unit: Old `AdminUnit`, street included.
+    :param geocoder: Object with a `geocode(unit)` method.
+    :return: `(latitude, longitude)`, or `None`.
+    '''
+    start = perf_counter() if profiling.CALLBACKS else None
+
+    namespace = getattr(geocoder, 'cache_namespace', None)
+    cache = get_geocode_cache() if namespace else None
+    if cache is None:
+        point = geocoder.geocode(unit)
+    else:
+        address = unit.get_address()
+        point = cache.get(address, namespace)
+        if point is None:
+            point = geocoder.geocode(unit)
+            if point:
+                cache.put(address, point, namespace)
+
+    if start is not None:
+        profiling.lap('geocode', start)
+    return point
+
+
+# CONVERSION STAGES
+# A conversion is split in 3 stages, so callers can run the geocoding stage on their own (e.g. concurrently):
+# `start_conversion()` (lookups), `geocode()` if `needs_geocoding`, then `finish_conversion()`.
+class PendingConversion:
+    def __init__(self, old_unit: AdminUnit, new_province_key: str=None, new_ward_key: str=None, new_wards: list=None, new_ward_bounds: list=None):
+        self.old_unit = old_unit
+        self.new_province_key = new_province_key
+        self.new_ward_key = new_ward_key
+        self.new_wards = new_wards  # New wards of a divided old ward, `None` if the old ward is not divided
+        self.new_ward_bounds = new_ward_bounds  # Square bounds of `new_wards`
+
+    @property
+    def needs_geocoding(self):
+        return self.new_wards is not None and bool(self.old_unit.street)
+
+
+def start_conversion(address: str) -> PendingConversion:
+    '''
+    Parse the old address and find its new province and, if the old ward is not divided, its new ward.
+
+    :param address: Old address.
+    :return: PendingConversion object.
+    '''
+
+    load_data()
+
+    # Parse old address to old admin unit. Not through `parse_address()`: only the conversion result is cached.
+    old_unit = parse_address_legacy(address, keep_street=True, level=3)
+
+    profile = profiling.CALLBACKS  # Time the lookups, only if profiling is enabled (the parser times its own stages)
+    if profile:
+        start = perf_counter()
 
     # Get new province key and old province_district_ward key
-    new_province_key = next((k for k, v in DICT_PROVINCE.items() if old_unit.province_key and old_unit.province_key in v), None)
+    conversion = PendingConversion(old_unit, new_province_key=INDEX_PROVINCE.get(old_unit.province_key))
 
     special_zone = ['huyenbachlongvi', 'huyenconco', 'huyenhoangsa', 'huyenlyson', 'huyencondao']
 
@@ -48,54 +175,85 @@ def convert_address_2025(address: str):
         old_province_district_ward_key = f"{old_unit.province_key}_{old_unit.district_key}_{old_unit.ward_key if old_unit.ward_key else ''}"
 
         # Priority find new ward key in no-divided dict
-        DICT_WARD_NO_DIVIDED = DICT_PROVINCE_WARD_NO_DIVIDED[new_province_key]
-        new_ward_key = next((k for k, v in DICT_WARD_NO_DIVIDED.items() if old_province_district_ward_key and old_province_district_ward_key in v), None)
-
-
-        # Find new ward key if old ward is divided
-        if not new_ward_key:
-            new_wards = DICT_PROVINCE_WARD_DIVIDED.get(new_province_key, {}).get(old_province_district_ward_key, [])
-
-            # Priority use default new ward if address is not provided
-            if not old_unit.street:
-                new_ward_key = next((ward['newWardKey'] for ward in new_wards if ward['isDefaultNewWard']), None)
-
-            # If address is provided, get old location and compare to each new ward polygon and point to choose the best new ward
-            else:
-                old_location = get_geo_location(old_unit.get_address())
-                old_point = (old_location.latitude, old_location.longitude)
-
-                containing_points = []
-                new_ward_points = []
-
-                for ward in new_wards:
-                    new_point = (ward['newWardLat'], ward['newWardLon'])
-                    new_ward_points.append(new_point)
-                    is_contain = check_point_in_polygon(point=old_point, polygon_center=new_point, polygon_area_km2=ward['newWardAreaKm2'])
-                    if is_contain:
-                        containing_points.append(new_point)
-
-
-                nearest_point = find_nearest_point(a_point=old_point, list_of_b_points=new_ward_points)
-
-                if len(containing_points) == 1:
-                    default_ward_point = containing_points[0]
-                else:
-                    default_ward_point = nearest_point
-
-                new_ward_key = next((ward['newWardKey'] for ward in new_wards if (ward['newWardLat'], ward['newWardLon']) == default_ward_point), None)
-
+        conversion.new_ward_key = INDEX_PROVINCE_WARD_NO_DIVIDED[conversion.new_province_key].get(old_province_district_ward_key)
+
+        # Find new wards if old ward is divided
+        if not conversion.new_ward_key:
+            conversion.new_wards = DICT_PROVINCE_WARD_DIVIDED.get(conversion.new_province_key, {}).get(old_province_district_ward_key, [])
+            conversion.new_ward_bounds = INDEX_PROVINCE_WARD_DIVIDED_BOUNDS.get(conversion.new_province_key, {}).get(old_province_district_ward_key, [])
+
+    if profile:
+        profiling.lap('conversion', start)
+    return conversion
+
+
+def choose_divided_ward(new_wards: list, new_ward_bounds: list, old_point: tuple=None):
+    '''
+    :param new_wards: New wards of a divided old ward.
+    :param new_ward_bounds: (south, west, north, east) of the square around each new ward.
+    :param old_point: (latitude, longitude) of the old address, `None` if unknown.
+    :return: Key of the new ward containing, or nearest to, `old_point`. The default new ward if `old_point` is `None`.
+    '''
+
+    # Priority use default new ward if address is not provided, or cannot be located
+    if not old_point:
+        return next((ward['newWardKey'] for ward in new_wards if ward['isDefaultNewWard']), None)
+
+    # Compare old location to each new ward square and point to choose the best new ward
+    new_ward_points = [(ward['newWardLat'], ward['newWardLon']) for ward in new_wards]
+    containing_points = [p for p, bounds in zip(new_ward_points, new_ward_bounds) if point_in_bounds(old_point, bounds)]
+
+    if len(containing_points) == 1:
+        default_ward_point = containing_points[0]
+    else:
+        default_ward_point = find_nearest_point_fast(a_point=old_point, list_of_b_points=new_ward_points)
+
+    return next((ward['newWardKey'] for ward in new_wards if (ward['newWardLat'], ward['newWardLon']) == default_ward_point), None)
+
+
+def finish_conversion(conversion: PendingConversion, old_point: tuple=None) -> AdminUnit:
+    '''
+    :param conversion: PendingConversion object.
+    :param old_point: (latitude, longitude) of the old address if `conversion.needs_geocoding`.
+    :return: New AdminUnit object.
+    '''
+    profile = profiling.CALLBACKS
+    if profile:
+        start = perf_counter()
+
+    old_unit = conversion.old_unit
+    new_province_key = conversion.new_province_key
+    new_ward_key = conversion.new_ward_key
+    if conversion.new_wards is not None:
+        new_ward_key = choose_divided_ward(conversion.new_wards, conversion.new_ward_bounds, old_point=old_point)
 
     # Convert to new admin unit
     new_address_components = [i for i in (old_unit.street, new_ward_key, new_province_key) if i]
     new_address = ','.join(new_address_components)
 
     level = 2 if new_ward_key else 1
-    new_unit = parse_address(new_address, mode=ParseMode.FROM_2025, keep_street=True, level=level)
+    if profile:
+        profiling.lap('conversion', start)
+    new_unit = parse_address_from_2025(new_address, keep_street=True, level=level)
 
     return new_unit
 
 
+# MAIN FUNCTION
+def convert_address_2025(address: str, geocoder: Geocoder=None):
+    '''
+    :param address: Old address.
+    :param geocoder: Geocoder used to choose between the new wards of a divided old ward. Default is `get_default_geocoder()`.
+    :return: AdminUnit object.
+    '''
+
+    if geocoder is None:
+        geocoder = get_default_geocoder()
+
+    conversion = start_conversion(address)
+    old_point = geocode(conversion.old_unit, geocoder) if conversion.needs_geocoding else None
+    return finish_conversion(conversion, old_point=old_point)
+
 
 if __name__ == '__main__':
     print(convert_address_2025(''))
\ No newline at end of file
@@ -0,0 +1,206 @@
+import os
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import Optional, Tuple
+
+# sqlite3 and csv are imported inside the methods, so they are only loaded when a geocoder with a `cache_namespace` is used.
+
+if __name__ == '__main__':
+    import sys
+    sys.path.append(Path(__file__).parent.parent.as_posix())
+    from parser.utils import key_normalize, unicode_normalize
+else:
+    from ..parser.utils import key_normalize, unicode_normalize
+
+
+GeocodeCacheInfo = namedtuple('GeocodeCacheInfo', ['hits', 'misses', 'maxsize', 'currsize', 'path'])
+
+DEFAULT_TTL = 30 * 24 * 3600  # 30 days
+DEFAULT_MAXSIZE = 1000000
+EVICT_EVERY = 1000  # Check the size limit every EVICT_EVERY writes
+
+
+def default_cache_dir() -> Path:
+    '''
+    :return: `VIETNAMADMINUNITS_CACHE_DIR` if set, else `vietnamadminunits` in the user cache directory.
+    '''
+    cache_dir = os.environ.get('VIETNAMADMINUNITS_CACHE_DIR')
+    if cache_dir:
+        return Path(cache_dir)
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'vietnamadminunits'
+
+
+def address_key(address: str, namespace: str='') -> str:
+    '''
+    :param address: Address, e.g. `AdminUnit.get_address()`.
+    :param namespace: `cache_namespace` of the geocoder, so geocoders do not share their results.
+    :return: Cache key of the address in the namespace, so case, spacing and Unicode composition variants share one entry. Accents are
+        kept: names differing only by tone are different places, e.g. Phường Hương Vân and Phường Hương Văn.
+    '''
+    return f"{namespace}|{key_normalize(unicode_normalize(address), keep=[','], decode=False)}"
+
+
+class GeocodeCache:
+    '''
+    Persistent `{address: (latitude, longitude)}` cache in a SQLite file, shared by every thread and process using it.
+    Each geocoder stores its results under its own `cache_namespace`.
+
+    Entries expire `ttl` seconds after they are written. Past `maxsize` entries, the least recently read ones are
+    evicted. Only found locations are stored, so addresses that could not be located are tried again.
+    '''
+    def __init__(self, path=None, ttl: float=DEFAULT_TTL, maxsize: int=DEFAULT_MAXSIZE):
+        '''
+        :param path: SQLite file. Default is `geocode.sqlite3` in `default_cache_dir()`.
+        :param ttl: Seconds an entry stays valid, `None` for no expiry.
+        :param maxsize: Maximum number of entries.
+        '''
+        self.path = Path(path) if path else default_cache_dir() / 'geocode.sqlite3'
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        # One connection per thread and process: sqlite3 connections cannot be shared across threads or forks
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            import sqlite3
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path.as_posix(), timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS geocode (
+                    key TEXT PRIMARY KEY,
+                    latitude REAL NOT NULL,
+                    longitude REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            ''')
+            connection.execute('CREATE INDEX IF NOT EXISTS geocode_accessed_at ON geocode (accessed_at)')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, address: str, namespace: str='') -> Optional[Tuple[float, float]]:
+        '''
+        :param address: Address.
+        :param namespace: `cache_namespace` of the geocoder.
+        :return: Cached `(latitude, longitude)`, or `None` if missing or expired.
+        '''
+        key = address_key(address, namespace)
+        now = time.time()
+        connection = self._connection()
+        row = connection.execute('SELECT latitude, longitude, created_at FROM geocode WHERE key = ?', (key,)).fetchone()
+        if row is None or (self.ttl is not None and now - row[2] > self.ttl):
+            with self._lock:
+                self.misses += 1
+            return None
+        connection.execute('UPDATE geocode SET accessed_at = ? WHERE key = ?', (now, key))
+        with self._lock:
+            self.hits += 1
+        return row[0], row[1]
+
+    def put(self, address: str, point: Tuple[float, float], namespace: str=''):
+        '''
+        :param address: Address.
+        :param point: `(latitude, longitude)`.
+        :param namespace: `cache_namespace` of the geocoder.
+        '''
+        self.put_many([(address, point)], namespace)
+
+    def put_many(self, items, namespace: str=''):
+        '''
+        :param items: Iterable of `(address, (latitude, longitude))`.
+        :param namespace: `cache_namespace` of the geocoder.
+        '''
+        now = time.time()
+        rows = [(address_key(address, namespace), point[0], point[1], now, now) for address, point in items]
+        connection = self._connection()
+        connection.executemany('INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?, ?)', rows)
+        with self._lock:
+            self._writes += len(rows)
+            evict = self._writes >= EVICT_EVERY or len(rows) > 1
+            if evict:
+                self._writes = 0
+        if evict:
+            self.evict()
+
+    def evict(self):
+        '''
+        Delete the expired entries, then the least recently read ones past `maxsize`.
+        '''
+        connection = self._connection()
+        if self.ttl is not None:
+            connection.execute('DELETE FROM geocode WHERE created_at < ?', (time.time() - self.ttl,))
+        connection.execute('''
+            DELETE FROM geocode WHERE key IN (
+                SELECT key FROM geocode ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+        ''', (self.maxsize,))
+
+    def load_csv(self, path, address: str='address', latitude: str='latitude', longitude: str='longitude', namespace: str='arcgis'):
+        '''
+        Fill the cache from a CSV export, e.g. of a previous geocoding job.
+
+        :param path: CSV file.
+        :param address: Address column name.
+        :param latitude: Latitude column name.
+        :param longitude: Longitude column name.
+        :param namespace: `cache_namespace` of the geocoder the locations are used for. Default is `ArcGISGeocoder`'s.
+        :return: Number of loaded rows.
+        '''
+        import csv
+
+        with open(path, encoding='utf-8', newline='') as f:
+            items = [
+                (row[address], (float(row[latitude]), float(row[longitude])))
+                for row in csv.DictReader(f)
+                if row[address] and row[latitude] and row[longitude]
+            ]
+        self.put_many(items, namespace)
+        return len(items)
+
+    def clear(self):
+        '''
+        Delete every entry and reset the statistics.
+        '''
+        self._connection().execute('DELETE FROM geocode')
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def info(self) -> GeocodeCacheInfo:
+        currsize = self._connection().execute('SELECT COUNT(*) FROM geocode').fetchone()[0]
+        return GeocodeCacheInfo(self.hits, self.misses, self.maxsize, currsize, self.path)
+
+
+# Used by the converter for geocoders with a `cache_namespace`. Created on first use, so no file is written until then.
+_geocode_cache = None
+_geocode_cache_enabled = True
+
+
+def set_geocode_cache(cache: Optional[GeocodeCache]):
+    '''
+    Choose the persistent cache consulted by `convert_address()` before calling a geocoder with a `cache_namespace`.
+
+    :param cache: `GeocodeCache` object, or `None` to disable the cache. Default is `GeocodeCache()`.
+    '''
+    global _geocode_cache, _geocode_cache_enabled
+    _geocode_cache = cache
+    _geocode_cache_enabled = cache is not None
+
+
+def get_geocode_cache() -> Optional[GeocodeCache]:
+    '''
+    :return: The `GeocodeCache` in use, or `None` if disabled.
+    '''
+    global _geocode_cache
+    if _geocode_cache is None and _geocode_cache_enabled:
+        _geocode_cache = GeocodeCache()
+    return _geocode_cache
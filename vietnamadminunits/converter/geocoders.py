@@ -0,0 +1,122 @@
+import time
+from typing import Optional, Tuple
+
+
+# A geocoder is any object with a `geocode(unit)` method taking the parsed old `AdminUnit` (street included) and
+# returning its `(latitude, longitude)`, or `None` if it cannot locate it. The converter uses it to choose between the
+# new wards of a divided old ward, and falls back to the default new ward on `None`.
+
+
+class Geocoder:
+    '''
+    Base class of the geocoders accepted by `convert_address()`.
+    '''
+    offline = False  # Offline geocoders are called in the event loop by `aconvert_address()`, not in a thread
+    cache_namespace = None  # Name of the results in the persistent geocode cache, `None` to not persist them
+
+    def geocode(self, unit) -> Optional[Tuple[float, float]]:
+        '''
+        :param unit: Old `AdminUnit` parsed from the address, street included.
+        :return: `(latitude, longitude)`, or `None` if the address cannot be located.
+        '''
+        raise NotImplementedError
+
+
+class CentroidGeocoder(Geocoder):
+    '''
+    Offline geocoder: locate an address at the centroid of its old ward, from the package data. No network request.
+    '''
+    offline = True
+
+    def geocode(self, unit) -> Optional[Tuple[float, float]]:
+        if unit.latitude is None or unit.longitude is None:
+            return None
+        return unit.latitude, unit.longitude
+
+
+class ArcGISGeocoder(Geocoder):
+    '''
+    Online geocoder: locate the full address (street included) with the ArcGIS service of `geopy`.
+    Network errors are retried with an exponential backoff, then the address is treated as not found.
+    '''
+    cache_namespace = 'arcgis'
+
+    def __init__(self, timeout: float=5, retries: int=2, backoff: float=0.5, **kwargs):
+        '''
+        :param timeout: Seconds to wait for each request.
+        :param retries: Number of retries after a failed request.
+        :param backoff: Seconds to wait before the first retry, doubled for each following retry.
+        :param kwargs: Other arguments of `geopy.geocoders.ArcGIS`.
+        '''
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.kwargs = kwargs
+        self._geolocator = None
+
+    def __getstate__(self):
+        # Picklable for worker processes, the geopy client is created again on first use
+        return {**self.__dict__, '_geolocator': None}
+
+    def geocode(self, unit) -> Optional[Tuple[float, float]]:
+        from geopy.exc import GeopyError
+
+        if self._geolocator is None:
+            from geopy.geocoders import ArcGIS
+            self._geolocator = ArcGIS(timeout=self.timeout, **self.kwargs)
+
+        for attempt in range(self.retries + 1):
+            try:
+                location = self._geolocator.geocode(unit.get_address())
+                return (location.latitude, location.longitude) if location else None
+            except GeopyError:
+                if attempt < self.retries:
+                    time.sleep(self.backoff * 2 ** attempt)
+        return None
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def geocoder_key(geocoder):
+    '''
+    Identity of the results of a geocoder, for the `convert_address()` cache: geocoders of the same class and public
+    attributes share their cached results.
+
+    :param geocoder: Object with a `geocode(unit)` method.
+    :return: Hashable `(class, attributes)`, or `None` if an attribute is not hashable: its results are not cached.
+    '''
+    attributes = tuple(sorted((k, _freeze(v)) for k, v in getattr(geocoder, '__dict__', {}).items() if not k.startswith('_')))
+    key = (type(geocoder).__module__, type(geocoder).__qualname__, attributes)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+_default_geocoder = CentroidGeocoder()
+
+
+def set_default_geocoder(geocoder: Geocoder):
+    '''
+    Choose the geocoder used by `convert_address()` when none is passed.
+
+    :param geocoder: Object with a `geocode(unit)` method, e.g. `CentroidGeocoder()` (default) or `ArcGISGeocoder()`.
+    '''
+    global _default_geocoder
+    if not callable(getattr(geocoder, 'geocode', None)):
+        raise ValueError('The geocoder must have a geocode(unit) method.')
+    _default_geocoder = geocoder
+
+
+def get_default_geocoder() -> Geocoder:
+    '''
+    :return: The geocoder used by `convert_address()` when none is passed.
+    '''
+    return _default_geocoder
@@ -1 +1 @@
-from .main import get_data, query
\ No newline at end of file
+from .main import get_data, iter_data, query
\ No newline at end of file
@@ -1,38 +1,127 @@
 import sqlite3
+import threading
 from pathlib import Path
 
 MODULE_DIR = Path(__file__).parent.parent
+DATABASE_FILE = MODULE_DIR / 'data/dataset.db'
+TABLES = ['admin_units', 'admin_units_legacy']
 
-def query(sql: str):
+# One read-only connection per thread: sqlite3 connections must not be shared between threads, and each one keeps its
+# own cache of prepared statements, reused by every query with the same SQL string.
+_local = threading.local()
+_columns = {}  # {table: list of columns}, the database is immutable
+
+
+# CONNECTION
+def get_connection() -> sqlite3.Connection:
+    '''
+    :return: Read-only connection to the database of this thread, opened on the first call.
+    '''
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        if not DATABASE_FILE.exists():
+            raise FileNotFoundError(f'Database file not found: {DATABASE_FILE}')
+        # Immutable: no locks, no change detection, the file is only replaced by reinstalling the package
+        conn = _local.conn = sqlite3.connect(f'{DATABASE_FILE.as_uri()}?mode=ro&immutable=1', uri=True, cached_statements=256)
+    return conn
+
+
+def get_columns(table: str) -> list:
+    '''
+    :param table: Table name, see `TABLES`.
+    :return: Column names of the table, in table order.
+    '''
+    if table not in TABLES:
+        raise ValueError(f'Invalid table. Available tables are {TABLES}.')
+    columns = _columns.get(table)
+    if columns is None:
+        columns = _columns[table] = [r[1] for r in get_connection().execute(f'PRAGMA table_info("{table}")')]
+    return columns
+
+
+def build_select(fields, table: str, limit: int) -> tuple:
+    '''
+    :return: `(sql, params)` of a `SELECT DISTINCT` with validated, quoted identifiers.
+    '''
+    columns = get_columns(table)
+
+    if isinstance(fields, str):
+        fields = [f.strip() for f in fields.split(',')]
+    fields = list(fields)
+    if fields == ['*']:
+        fields = columns
+    invalid = [f for f in fields if f not in columns]
+    if not fields or invalid:
+        raise ValueError(f'Invalid fields {invalid}. Available fields of {table} are {columns}.')
+
+    sql = f'''SELECT DISTINCT {', '.join(f'"{f}"' for f in fields)} FROM "{table}"'''
+    params = ()
+    if limit:
+        sql += ' LIMIT ?'
+        params = (int(limit),)
+    return sql, params
+
+
+# MAIN FUNCTION
+def query(sql: str, params=()):
     '''
     Retrieve administrative unit data from the database.
 
-    :param sql: SQL string
+    :param sql: SQL string, with `?` or `:name` placeholders for the values of `params`.
+    :param params: Sequence or dictionary of the values of the placeholders.
     :return: Data as a list of JSON-like dictionaries. It is compatible with `pd.DataFrame`.
     '''
-    with sqlite3.connect(MODULE_DIR / 'data/dataset.db') as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        result = cursor.execute(sql)
-        records = [dict(r) for r in result.fetchall()]
-        return records
+    cursor = get_connection().execute(sql, params)
+    columns = [d[0] for d in cursor.description or []]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
 
 def get_data(fields='*', table: str='admin_units', limit: int=None):
     '''
     Retrieve administrative unit data from the database.
 
-    :param fields: Column name(s) to retrieve.
+    :param fields: Column name(s) to retrieve, `'*'`, a list or a comma-separated string.
     :param table: Table name, either `'admin_units'` (34 provinces) or `'admin_units_legacy'` (legacy 63 provinces).
+    :param limit: Maximum number of rows. Default is every row.
     :return: Data as a list of JSON-like dictionaries. It is compatible with `pd.DataFrame`.
     '''
-    if isinstance(fields, list):
-        fields = ','.join(fields)
-    sql = f'SELECT DISTINCT {fields} FROM [{table}]'
-    if limit:
-        sql += f' LIMIT {limit}'
-    records = query(sql)
-    return records
+    sql, params = build_select(fields, table, limit)
+    return query(sql, params)
+
+
+def iter_data(fields='*', table: str='admin_units', limit: int=None, batch_size: int=1000):
+    '''
+    Retrieve administrative unit data from the database, one row at a time. Rows are fetched by batches, so the memory
+    does not grow with the size of the table.
+
+    :param fields: Column name(s) to retrieve, `'*'`, a list or a comma-separated string.
+    :param table: Table name, either `'admin_units'` (34 provinces) or `'admin_units_legacy'` (legacy 63 provinces).
+    :param limit: Maximum number of rows. Default is every row.
+    :param batch_size: Number of rows fetched from the database at once.
+    :return: Generator of JSON-like dictionaries, in the order of `get_data()`.
+    '''
+    # RAISE, on the call rather than on the first row
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError('Invalid batch_size. It must be a positive integer.')
+    sql, params = build_select(fields, table, limit)
+    return _iter_rows(sql, params, batch_size)
+
+
+def _iter_rows(sql: str, params: tuple, batch_size: int):
+    # A cursor of its own, other queries of the thread can run while the generator is paused
+    cursor = get_connection().cursor()
+    try:
+        cursor.execute(sql, params)
+        columns = [d[0] for d in cursor.description]
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
+    finally:
+        cursor.close()
 
 
 if __name__ == '__main__':
-    print(get_data(fields='*', table='admin_units'))
\ No newline at end of file
+    print(get_data(fields='*', table='admin_units'))
@@ -0,0 +1,49 @@
+from .locator_2025 import locate_2025, locate_many_2025, locate_indexes_2025
+from enum import Enum
+from typing import Union
+
+
+class LocateMode(Enum):
+    FROM_2025 = "FROM_2025"  # 34-province wards
+
+    @classmethod
+    def available(cls, value=False):
+        attrs = list(cls)
+        if value:
+            attrs = [a.value for a in attrs]
+        return attrs
+
+
+def _get_locator(mode):
+    if mode in [LocateMode.FROM_2025, LocateMode.FROM_2025.value]:
+        return locate_2025, locate_many_2025
+    raise Exception(f"Invalid mode. Available modes are {LocateMode.available(value=True)}.")
+
+
+def locate(latitude: float, longitude: float, mode: Union[str, LocateMode]=LocateMode.FROM_2025, max_distance_km: float=None):
+    '''
+    Find the administrative unit of a point (reverse geocoding), offline.
+
+    The point belongs to the ward whose square (of the ward area, centered on the ward location) contains it. A point
+    inside several squares or none belongs to the ward with the nearest location.
+
+    :param latitude: Latitude of the point.
+    :param longitude: Longitude of the point.
+    :param mode: One of the `LocateMode` values. Currently, only `'FROM_2025'` is supported.
+    :param max_distance_km: Return `None` for a point inside no square and farther than this from every ward location, e.g. a point outside Vietnam. Default is no limit.
+    :return: AdminUnit object, or `None`.
+    '''
+    return _get_locator(mode)[0](latitude, longitude, max_distance_km=max_distance_km)
+
+
+def locate_many(latitudes, longitudes, mode: Union[str, LocateMode]=LocateMode.FROM_2025, max_distance_km: float=None) -> list:
+    '''
+    `locate()` of many points at once, much faster than one call per point.
+
+    :param latitudes: Array-like of latitudes, e.g. a list, a NumPy array or a pandas Series.
+    :param longitudes: Array-like of longitudes, same length as `latitudes`.
+    :param mode: One of the `LocateMode` values. Currently, only `'FROM_2025'` is supported.
+    :param max_distance_km: See `locate()`.
+    :return: List of AdminUnit objects (or `None`), in input order.
+    '''
+    return _get_locator(mode)[1](latitudes, longitudes, max_distance_km=max_distance_km)
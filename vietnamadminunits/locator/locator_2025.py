@@ -0,0 +1,292 @@
+import copy
+import json
+import math
+import threading
+from pathlib import Path
+
+if __name__ == '__main__':
+    import sys
+    sys.path.append(Path(__file__).parent.parent.as_posix())
+    from parser import parser_from_2025
+    from parser.objects import AdminUnit
+    from parser.utils import EARTH_RADIUS_KM
+else:
+    from ..parser import parser_from_2025
+    from ..parser.objects import AdminUnit
+    from ..parser.utils import EARTH_RADIUS_KM
+
+# numpy and shapely are imported inside the functions, so they are only loaded when a point is located.
+
+MODULE_DIR = Path(__file__).parent.parent
+
+
+# LOAD DATA
+# The data and spatial indexes are built on the first lookup, not when the package is imported.
+DATA_FILE = MODULE_DIR / 'data/locator_2025.json'  # Built by scripts/generating_module_data/s11_generating_locator_data.py
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+# Candidate nearest wards are searched in the Mercator projection (x = longitude, y = mercator_y(latitude), both in
+# degrees), then ranked by great-circle distance. Mercator is conformal: a distance at latitude `lat` is scaled by
+# `1 / cos(lat)` in every direction, so the nearest wards in the projection are the nearest ones up to the small
+# change of scale over the latitudes between the point and the wards.
+MAX_LATITUDE = 89.0
+# Slack on the projected search radius for the great circles bulging toward the poles, beyond the latitudes bounded
+CURVATURE_MARGIN = 1.01
+# Points farther than this from the nearest ward in the projection get that ward, without ranking the other candidates
+# by great-circle distance: far from the wards (e.g. a (0, 0) geocode), the search radius would hold every ward.
+EXACT_DISTANCE_KM = 20.0
+CHUNK_SIZE = 100000  # Points located at once, to bound the memory of the spatial queries
+
+WARD_UNITS = None  # AdminUnit of every ward, in the order of the data file
+WARD_POINTS = None  # STRtree of the ward locations in the Mercator projection
+WARD_LOCATIONS = None  # (latitudes, longitudes) of the ward locations, in radians
+WARD_SQUARES = None  # STRtree of the ward squares
+WARD_SQUARE_INDEXES = None  # Ward index of every square of WARD_SQUARES
+_data_lock = threading.Lock()
+_data_loaded = False
+
+
+def build_ward_unit(province_key: str, ward_key: str) -> AdminUnit:
+    '''
+    :param province_key: Province key of `parser_from_2025`.
+    :param ward_key: Ward key of `parser_from_2025`.
+    :return: The AdminUnit `parse_address()` gives for this ward.
+    '''
+    province = parser_from_2025.DICT_PROVINCE[province_key]
+    ward = parser_from_2025.DICT_PROVINCE_WARD_NO_ACCENTED[province_key].get(ward_key) or parser_from_2025.DICT_PROVINCE_WARD_ACCENTED[province_key][ward_key]
+    return AdminUnit(
+        province=province['province'],
+        ward=ward['ward'],
+        short_province=province['provinceShort'],
+        short_ward=ward['wardShort'],
+        ward_type=ward['wardType'],
+        province_code=province['provinceCode'],
+        ward_code=ward['wardCode'],
+        latitude=ward['wardLat'],
+        longitude=ward['wardLon'],
+        province_key=province_key,
+        ward_key=ward_key,
+    )
+
+
+def mercator_y(latitudes):
+    '''
+    :param latitudes: `numpy.ndarray` of latitudes.
+    :return: `numpy.ndarray` of the Mercator y coordinates, in degrees.
+    '''
+    import numpy as np
+
+    latitudes = np.radians(np.clip(latitudes, -MAX_LATITUDE, MAX_LATITUDE))
+    return np.degrees(np.log(np.tan(np.pi / 4 + latitudes / 2)))
+
+
+def load_data():
+    '''
+    Load the ward data and build the spatial indexes, only on the first call.
+    '''
+    global WARD_UNITS, WARD_POINTS, WARD_LOCATIONS, WARD_SQUARES, WARD_SQUARE_INDEXES, _data_loaded
+    if _data_loaded:
+        return
+    with _data_lock:
+        if _data_loaded:
+            return
+        import numpy as np
+        import shapely
+
+        parser_from_2025.load_data()
+        with open(DATA_FILE, 'r') as f:
+            wards = json.load(f)['WARDS']
+
+        units = [build_ward_unit(province_key, ward_key) for province_key, ward_key, *_ in wards]
+        lats = np.array([u.latitude for u in units])
+        lons = np.array([u.longitude for u in units])
+        squares = [(i, w[3:]) for i, w in enumerate(wards) if w[2]]
+
+        WARD_POINTS = shapely.STRtree(shapely.points(lons, mercator_y(lats)))
+        WARD_LOCATIONS = (np.radians(lats), np.radians(lons))
+        WARD_SQUARES = shapely.STRtree(shapely.box(*np.array([[west, south, east, north] for _, (south, west, north, east) in squares]).T))
+        WARD_SQUARE_INDEXES = np.array([i for i, _ in squares])
+        WARD_UNITS = units
+        _data_loaded = True
+
+
+def preload_data():
+    '''
+    Load the ward data and build the spatial indexes now, instead of on first use.
+    '''
+    load_data()
+
+
+def scale_ratio(latitudes, window):
+    '''
+    Largest ratio of the Mercator scales of two latitudes within `window` degrees of each point.
+
+    :param latitudes: `numpy.ndarray` of latitudes.
+    :param window: `numpy.ndarray` or number of degrees.
+    :return: `numpy.ndarray` of `cos(latitude nearest the equator) / cos(latitude farthest from it)` in each window.
+    '''
+    import numpy as np
+
+    south = np.clip(latitudes - window, -MAX_LATITUDE, MAX_LATITUDE)
+    north = np.clip(latitudes + window, -MAX_LATITUDE, MAX_LATITUDE)
+    nearest = np.where((south <= 0) & (north >= 0), 0.0, np.minimum(np.abs(south), np.abs(north)))
+    farthest = np.maximum(np.abs(south), np.abs(north))
+    return np.cos(np.radians(nearest)) / np.cos(np.radians(farthest))
+
+
+def haversine_km_many(latitudes, longitudes, ward_indexes):
+    '''
+    :param latitudes: `numpy.ndarray` of latitudes.
+    :param longitudes: `numpy.ndarray` of longitudes.
+    :param ward_indexes: `numpy.ndarray` of ward indexes, same length as `latitudes`.
+    :return: `numpy.ndarray` of the great-circle distances in km between each point and its ward location.
+    '''
+    import numpy as np
+
+    lat1, lon1 = np.radians(latitudes), np.radians(longitudes)
+    lat2, lon2 = WARD_LOCATIONS[0][ward_indexes], WARD_LOCATIONS[1][ward_indexes]
+    h = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(h)))
+
+
+def nearest_ward_indexes(latitudes, longitudes, max_distance_km: float=None):
+    '''
+    Find the ward with the nearest location of many points, by great-circle (haversine) distance.
+
+    The distance to the nearest ward in the projection, times the change of scale around the point, is a radius that
+    contains the nearest ward by great-circle distance. Every ward within that radius is then ranked by great-circle
+    distance. Points farther than `EXACT_DISTANCE_KM` from every ward get the nearest ward in the projection.
+
+    :param latitudes: `numpy.ndarray` of latitudes.
+    :param longitudes: `numpy.ndarray` of longitudes, same length as `latitudes`.
+    :param max_distance_km: Points farther than this from every ward location get no ward.
+    :return: `numpy.ndarray` of ward indexes, `-1` for no ward.
+    '''
+    import numpy as np
+    import shapely
+
+    indexes = np.full(len(latitudes), -1, dtype=np.int64)
+    projected = shapely.points(longitudes, mercator_y(latitudes))
+
+    max_distance = None
+    if max_distance_km is not None:
+        # A ward within max_distance_km is within as many degrees of latitude, where the scale is at most this
+        max_degrees = max_distance_km / KM_PER_DEGREE
+        farthest = min(np.abs(latitudes).max() + max_degrees, MAX_LATITUDE)
+        max_distance = max_degrees / math.cos(math.radians(farthest)) * CURVATURE_MARGIN
+    (found, found_wards), distances = WARD_POINTS.query_nearest(projected, max_distance=max_distance, all_matches=False, return_distance=True)
+    found_km = haversine_km_many(latitudes[found], longitudes[found], found_wards)
+    exact = found_km <= EXACT_DISTANCE_KM
+
+    # A ward within the radius is within as many degrees of latitude (the scale is at least 1): start with a window
+    # of twice the distance, widened to the radius where the scale changes faster, near the poles
+    exact_points, distances = found[exact], distances[exact]
+    exact_latitudes = latitudes[exact_points]
+    radius = distances * scale_ratio(exact_latitudes, 2 * distances) * CURVATURE_MARGIN
+    wide = radius > 2 * distances
+    radius[wide] = distances[wide] * scale_ratio(exact_latitudes[wide], 2 * MAX_LATITUDE) * CURVATURE_MARGIN
+    candidate_indexes, ward_indexes = WARD_POINTS.query(projected[exact_points], predicate='dwithin', distance=radius + 1e-9)
+    point_indexes = exact_points[candidate_indexes]
+    distances_km = haversine_km_many(latitudes[point_indexes], longitudes[point_indexes], ward_indexes)
+
+    # Far points: the nearest ward in the projection is their only candidate
+    point_indexes = np.concatenate([point_indexes, found[~exact]])
+    ward_indexes = np.concatenate([ward_indexes, found_wards[~exact]])
+    distances_km = np.concatenate([distances_km, found_km[~exact]])
+
+    if not len(point_indexes):
+        return indexes
+
+    # Nearest candidate of each point. Candidates are grouped by point, in the order of the points.
+    if np.any(point_indexes[1:] < point_indexes[:-1]):
+        order = np.argsort(point_indexes, kind='stable')
+        point_indexes, ward_indexes, distances_km = point_indexes[order], ward_indexes[order], distances_km[order]
+    starts = np.flatnonzero(np.r_[True, point_indexes[1:] != point_indexes[:-1]])
+    group_minimums = np.repeat(np.minimum.reduceat(distances_km, starts), np.diff(np.r_[starts, len(point_indexes)]))
+    nearest = np.flatnonzero(distances_km == group_minimums)
+    nearest = nearest[np.r_[True, point_indexes[nearest][1:] != point_indexes[nearest][:-1]]]  # First of ties
+    if max_distance_km is not None:
+        nearest = nearest[distances_km[nearest] <= max_distance_km]
+    indexes[point_indexes[nearest]] = ward_indexes[nearest]
+    return indexes
+
+
+def locate_chunk(latitudes, longitudes, max_distance_km: float=None):
+    '''
+    :param latitudes: `numpy.ndarray` of latitudes, at most `CHUNK_SIZE`.
+    :param longitudes: `numpy.ndarray` of longitudes, same length as `latitudes`.
+    :param max_distance_km: See `locate_indexes_2025()`.
+    :return: `numpy.ndarray` of ward indexes, `-1` for no ward.
+    '''
+    import numpy as np
+    import shapely
+
+    indexes = np.full(len(latitudes), -1, dtype=np.int64)
+    valid = np.flatnonzero(np.isfinite(latitudes) & np.isfinite(longitudes))
+
+    # Points inside exactly one square (edges excluded, as the converter's shapely `contains()`)
+    point_indexes, square_indexes = WARD_SQUARES.query(shapely.points(longitudes[valid], latitudes[valid]), predicate='within')
+    counts = np.bincount(point_indexes, minlength=len(valid))
+    single = counts == 1
+    indexes[valid[point_indexes[single[point_indexes]]]] = WARD_SQUARE_INDEXES[square_indexes[single[point_indexes]]]
+
+    # Other points: nearest ward location
+    rest = valid[~single]
+    if len(rest):
+        indexes[rest] = nearest_ward_indexes(latitudes[rest], longitudes[rest], max_distance_km=max_distance_km)
+
+    return indexes
+
+
+def locate_indexes_2025(latitudes, longitudes, max_distance_km: float=None):
+    '''
+    Find the ward of many points, as indexes of `WARD_UNITS`.
+
+    A point inside the square of exactly one ward (the square of the ward area centered on the ward location) belongs
+    to that ward. Any other point belongs to the ward with the nearest location, by great-circle distance (see
+    `nearest_ward_indexes()` for the points far from every ward). Points are located by chunks of `CHUNK_SIZE`.
+
+    :param latitudes: Array-like of latitudes.
+    :param longitudes: Array-like of longitudes, same length as `latitudes`.
+    :param max_distance_km: Points farther than this from every ward location (and inside no square) get no ward.
+    :return: `numpy.ndarray` of ward indexes, `-1` for no ward.
+    '''
+    import numpy as np
+
+    load_data()
+
+    latitudes = np.asarray(latitudes, dtype=float).ravel()
+    longitudes = np.asarray(longitudes, dtype=float).ravel()
+    if latitudes.shape != longitudes.shape:
+        raise ValueError('latitudes and longitudes must have the same length')
+
+    indexes = np.full(len(latitudes), -1, dtype=np.int64)
+    for start in range(0, len(latitudes), CHUNK_SIZE):
+        chunk = slice(start, start + CHUNK_SIZE)
+        indexes[chunk] = locate_chunk(latitudes[chunk], longitudes[chunk], max_distance_km=max_distance_km)
+    return indexes
+
+
+def locate_2025(latitude: float, longitude: float, max_distance_km: float=None):
+    '''
+    :param latitude: Latitude of the point.
+    :param longitude: Longitude of the point.
+    :param max_distance_km: See `locate_indexes_2025()`.
+    :return: AdminUnit object of the 34-province ward of the point, or `None`.
+    '''
+    index = locate_indexes_2025([latitude], [longitude], max_distance_km=max_distance_km)[0]
+    return None if index < 0 else copy.copy(WARD_UNITS[index])
+
+
+def locate_many_2025(latitudes, longitudes, max_distance_km: float=None) -> list:
+    '''
+    :param latitudes: Array-like of latitudes.
+    :param longitudes: Array-like of longitudes, same length as `latitudes`.
+    :param max_distance_km: See `locate_indexes_2025()`.
+    :return: List of AdminUnit objects (or `None`), in input order.
+    '''
+    indexes = locate_indexes_2025(latitudes, longitudes, max_distance_km=max_distance_km)
+    return [None if i < 0 else copy.copy(WARD_UNITS[i]) for i in indexes.tolist()]
+
+
+if __name__ == '__main__':
+    print(locate_2025(10.8224, 106.65))
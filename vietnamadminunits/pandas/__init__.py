@@ -1 +1,3 @@
-from .main import standardize_admin_unit_columns, convert_address_column
\ No newline at end of file
+from .main import standardize_admin_unit_columns, convert_address_column
+from .table import parse_addresses_table, convert_addresses_table
+from .parquet import standardize_parquet
@@ -1,10 +1,104 @@
-from ..parser import parse_address, ParseMode
+from ..parser import parse_address, parse_addresses, ParseMode
 from ..converter import convert_address, ConvertMode
+from .table import column_values
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
 import warnings
 from typing import Union
 from tqdm import tqdm
 
-def standardize_admin_unit_columns(df, province: str, district: str=None, ward: str=None, parse_mode: Union[str, ParseMode]=ParseMode.latest(), convert_mode: Union[str, ConvertMode]=None, inplace=False, prefix: str='standardized_', suffix :str='', short_name: bool=True, show_progress: bool=True):
+
+# PARALLEL EXECUTION
+def _init_worker():
+    import gc
+    from .. import preload
+    preload(freeze=False)  # Nothing to load if forked: the data is inherited from the parent
+    # Freeze without the collection of `preload()`: it would write to every inherited object, copying the shared pages
+    gc.freeze()
+
+
+def _parse_chunk(addresses: list, mode: Union[str, ParseMode], level: int):
+    return parse_addresses(addresses, mode=mode, level=level, keep_street=False)
+
+
+def _convert_chunk(addresses: list, mode: Union[str, ConvertMode]):
+    return [convert_address(address=x, mode=mode) for x in addresses]
+
+
+def _convert_chunk_to_address(addresses: list, mode: Union[str, ConvertMode], short_name: bool):
+    return [convert_address(address=x, mode=mode).get_address(short_name=short_name) for x in addresses]
+
+
+def _parallel_apply(values: list, chunk_func, n_jobs: int, chunksize: int, show_progress: bool, desc: str):
+    '''
+    Apply `chunk_func` to chunks of `values` in a process pool. Every worker loads the data once when it starts.
+
+    :param values: List of addresses.
+    :param chunk_func: Picklable function mapping a list of addresses to a list of results.
+    :param n_jobs: Number of worker processes, `-1` to use all CPUs.
+    :param chunksize: Number of addresses sent to a worker at a time.
+    :param show_progress: Show progress bar.
+    :param desc: Progress bar description.
+    :return: List of results, in the order of `values`.
+    '''
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    chunks = [values[i:i + chunksize] for i in range(0, len(values), chunksize)]
+
+    # Load the data in this process first: forked workers then start with it and share its memory pages
+    from .. import preload
+    preload(freeze=False)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(chunks)) or 1, initializer=_init_worker) as executor:
+        with tqdm(total=len(values), desc=desc, disable=not show_progress) as progress_bar:
+            for chunk_results in executor.map(chunk_func, chunks):  # map() yields in submission order
+                results.extend(chunk_results)
+                progress_bar.update(len(chunk_results))
+    return results
+
+
+def _check_parallel_params(n_jobs: int, chunksize: int):
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError('n_jobs must be a positive integer, or -1 to use all CPUs')
+    if chunksize < 1:
+        raise ValueError('chunksize must be a positive integer')
+
+
+def _check_admin_unit_params(province: str, district: str, ward: str, parse_mode: Union[str, ParseMode], convert_mode: Union[str, ConvertMode]):
+    if not province:
+        raise ValueError('The name of the province column must be provided')
+
+    if convert_mode:
+        if not district or not ward:
+            warnings.warn('The names of the District or Ward columns are not provided. Therefore, only the Province level will be converted.', UserWarning)
+    else:
+        if parse_mode in [ParseMode.FROM_2025, ParseMode.FROM_2025.value] and district:
+            warnings.warn('FROM_2025 mode is not support with the district level.', UserWarning)
+
+        if parse_mode in [ParseMode.LEGACY, ParseMode.LEGACY.value] and ward and not district:
+            raise ValueError('The name of the district column must be provided in order to parse the ward data.')
+
+
+def _admin_unit_parsers(district: str, ward: str, parse_mode: Union[str, ParseMode], convert_mode: Union[str, ConvertMode]):
+    '''
+    :return: `(parser, chunk_parser)`: functions mapping an address, and a list of addresses, to AdminUnit objects.
+    '''
+    if convert_mode:
+        parser = lambda x: convert_address(address=x, mode=convert_mode)
+        chunk_parser = partial(_convert_chunk, mode=convert_mode)
+    else:
+        if parse_mode in [ParseMode.FROM_2025, ParseMode.FROM_2025.value]:
+            level = 2 if ward else 1
+        elif parse_mode in [ParseMode.LEGACY, ParseMode.LEGACY.value]:
+            level = 3 if ward else 2 if district else 1
+        parser = lambda x: parse_address(address=x, mode=parse_mode, level=level, keep_street=False)
+        chunk_parser = partial(_parse_chunk, mode=parse_mode, level=level)
+    return parser, chunk_parser
+
+
+def standardize_admin_unit_columns(df, province: str, district: str=None, ward: str=None, parse_mode: Union[str, ParseMode]=ParseMode.latest(), convert_mode: Union[str, ConvertMode]=None, inplace=False, prefix: str='standardized_', suffix :str='', short_name: bool=True, show_progress: bool=True, n_jobs: int=1, chunksize: int=1000):
     '''
     Standardizes administrative unit columns (`province`, `district`, `ward`) in a DataFrame.
 
@@ -19,6 +113,8 @@ def standardize_admin_unit_columns(df, province: str, district: str=None, ward:
     :param suffix: Add a suffix to the column names if `inplace=False`.
     :param short_name: Use short or full names for standardized administrative units.
     :param show_progress: Show progress bar.
+    :param n_jobs: Number of worker processes used to standardize the unique administrative units, `-1` to use all CPUs. Default is `1`, no worker process.
+    :param chunksize: Number of unique administrative units sent to a worker process at a time if `n_jobs` is not `1`. No worker process is started if there is only one chunk.
 
     :return: `pandas.DataFrame` object.
     '''
@@ -27,19 +123,8 @@ def standardize_admin_unit_columns(df, province: str, district: str=None, ward:
     admin_unit_columns = [l for l in [ward, district, province] if l]  # Remove None
 
     # RAISE
-    if not province:
-        raise ValueError('The name of the province column must be provided')
-
-    if convert_mode:
-        if not district or not ward:
-            warnings.warn('The names of the District or Ward columns are not provided. Therefore, only the Province level will be converted.', UserWarning)
-    else:
-        if parse_mode in [ParseMode.FROM_2025, ParseMode.FROM_2025.value] and district:
-            warnings.warn('FROM_2025 mode is not support with the district level.', UserWarning)
-
-        if parse_mode in [ParseMode.LEGACY, ParseMode.LEGACY.value] and ward and not district:
-            raise ValueError('The name of the district column must be provided in order to parse the ward data.')
-
+    _check_admin_unit_params(province, district, ward, parse_mode, convert_mode)
+    _check_parallel_params(n_jobs, chunksize)
 
 
     # INITIATIVE VARS
@@ -55,17 +140,13 @@ def standardize_admin_unit_columns(df, province: str, district: str=None, ward:
 
 
     # PARSE ADDRESS TO NEW ADMIN UNIT
-    if convert_mode:
-        parser = lambda x: convert_address(address=x, mode=convert_mode)
-    else:
-        if parse_mode in [ParseMode.FROM_2025, ParseMode.FROM_2025.value]:
-            level = 2 if ward else 1
-        elif parse_mode in [ParseMode.LEGACY, ParseMode.LEGACY.value]:
-            level = 3 if ward else 2 if district else 1
-        parser = lambda x: parse_address(address=x, mode=parse_mode, level=level, keep_street=False)
+    parser, chunk_parser = _admin_unit_parsers(district, ward, parse_mode, convert_mode)
 
 
-    if show_progress:
+    if n_jobs != 1 and len(df_address) > chunksize:  # A single chunk is faster without a pool
+        df_address['admin_unit'] = _parallel_apply(df_address['address'].tolist(), chunk_parser, n_jobs=n_jobs, chunksize=chunksize,
+                                                   show_progress=show_progress, desc="Standardizing unique administrative units")
+    elif show_progress:
         tqdm.pandas(desc="Standardizing unique administrative units")
         df_address['admin_unit'] = df_address['address'].progress_apply(parser)
     else:
@@ -73,6 +154,7 @@ def standardize_admin_unit_columns(df, province: str, district: str=None, ward:
 
 
     # SPLIT ADMIN UNIT TO COLUMNS
+    target_cols = {}
     for col_type, col_name in zip(['province', 'district', 'ward'], [province, district, ward]):
         if not col_name:
             continue
@@ -80,8 +162,12 @@ def standardize_admin_unit_columns(df, province: str, district: str=None, ward:
             continue  # skip if in convert_mode mode
 
         attr = f"{'short_' if short_name else ''}{col_type}"
-        target_col = col_name if inplace else f"{prefix}{col_name}{suffix}"
-        df_address[target_col] = df_address['admin_unit'].apply(lambda x: getattr(x, attr) if x else None)
+        target_cols[col_name if inplace else f"{prefix}{col_name}{suffix}"] = attr
+
+    # All columns in one pass over the units, as object columns with None for missing values
+    values = column_values(df_address['admin_unit'].tolist(), list(dict.fromkeys(target_cols.values())))
+    for target_col, attr in target_cols.items():
+        df_address[target_col] = values[attr]  # Positional, df_address keeps the index of df
 
 
     # ADD NEW ADMIN UNIT COLUMNS TO DF
@@ -103,7 +189,7 @@ def standardize_admin_unit_columns(df, province: str, district: str=None, ward:
     return df
 
 
-def convert_address_column(df, address: str, convert_mode: Union[str, ConvertMode]=ConvertMode.CONVERT_2025, inplace=False, prefix: str='converted_', suffix :str='', short_name: bool=True, show_progress: bool=True):
+def convert_address_column(df, address: str, convert_mode: Union[str, ConvertMode]=ConvertMode.CONVERT_2025, inplace=False, prefix: str='converted_', suffix :str='', short_name: bool=True, show_progress: bool=True, n_jobs: int=1, chunksize: int=1000):
     '''
     Convert an address column in a DataFrame.
 
@@ -115,9 +201,13 @@ def convert_address_column(df, address: str, convert_mode: Union[str, ConvertMod
     :param suffix: Add a suffix to the column names if `inplace=False`.
     :param short_name: Use short or full names for administrative unit in address.
     :param show_progress: Show progress bar.
+    :param n_jobs: Number of worker processes used to convert the unique addresses, `-1` to use all CPUs. Default is `1`, no worker process.
+    :param chunksize: Number of unique addresses sent to a worker process at a time if `n_jobs` is not `1`. No worker process is started if there is only one chunk.
     :return: `pandas.DataFrame` object.
     '''
 
+    _check_parallel_params(n_jobs, chunksize)
+
     def convert_and_get_address(x):
         admin_unit = convert_address(address=x, mode=convert_mode)
         return admin_unit.get_address(short_name=short_name)
@@ -130,7 +220,11 @@ def convert_address_column(df, address: str, convert_mode: Union[str, ConvertMod
     df_address = df[[address]].drop_duplicates()
 
     # CONVERT ADDRESS
-    if show_progress:
+    if n_jobs != 1 and len(df_address) > chunksize:  # A single chunk is faster without a pool
+        chunk_converter = partial(_convert_chunk_to_address, mode=convert_mode, short_name=short_name)
+        df_address['new_address'] = _parallel_apply(df_address[address].fillna('').tolist(), chunk_converter, n_jobs=n_jobs, chunksize=chunksize,
+                                                    show_progress=show_progress, desc="Converting unique addresses")
+    elif show_progress:
         tqdm.pandas(desc="Converting unique addresses")
         df_address['new_address'] = df_address[address].fillna('').progress_apply(convert_and_get_address)
     else:
@@ -0,0 +1,112 @@
+from ..parser import ParseMode
+from ..parser.cache import LRUCache
+from ..converter import ConvertMode
+from .main import _check_admin_unit_params, _admin_unit_parsers
+from typing import Union
+from tqdm import tqdm
+
+
+# pyarrow is imported inside the function, so it is only required by Parquet users.
+
+def standardize_parquet(source, destination, province: str, district: str=None, ward: str=None, parse_mode: Union[str, ParseMode]=ParseMode.latest(), convert_mode: Union[str, ConvertMode]=None, inplace=False, prefix: str='standardized_', suffix :str='', short_name: bool=True, batch_size: int=None, cache_size: int=100000, show_progress: bool=True, **writer_kwargs) -> int:
+    '''
+    Standardizes administrative unit columns (`province`, `district`, `ward`) of a Parquet file, like
+    `standardize_admin_unit_columns()`, one row group at a time: memory is bounded by the size of a row group, not of the file.
+
+    Each batch standardizes its distinct `(ward, district, province)` values only, and the standardized columns are
+    written dictionary-encoded.
+
+    :param source: Input Parquet file, path or file object.
+    :param destination: Output Parquet file, path or file object.
+    :param province: Province column name.
+    :param district: District column name.
+    :param ward: Ward column name.
+    :param parse_mode: One of the `ParseMode` values. Use `'LEGACY'` for the 63-province format (pre-merger), or `'FROM_2025'` for the new 34-province format. Default is `ParseMode.latest()`.
+    :param convert_mode: One of the `ConvertMode` values. Currently, only `'CONVERT_2025'` is supported.
+    :param inplace: Replace the original columns with standardized values instead of adding new ones.
+    :param prefix: Add a prefix to the column names if `inplace=False`.
+    :param suffix: Add a suffix to the column names if `inplace=False`.
+    :param short_name: Use short or full names for standardized administrative units.
+    :param batch_size: Rows per batch. Default is `None`, one batch per row group of `source`.
+    :param cache_size: Distinct administrative units remembered across batches, so they are standardized once.
+    :param show_progress: Show progress bar.
+    :param writer_kwargs: Other arguments of `pyarrow.parquet.ParquetWriter`, e.g. `compression='zstd'`.
+    :return: Number of rows written.
+    '''
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError('standardize_parquet() requires pyarrow: pip install pyarrow')
+
+    # INITIATIVE VARS
+    admin_unit_columns = [l for l in [ward, district, province] if l]  # Remove None
+
+    # RAISE
+    _check_admin_unit_params(province, district, ward, parse_mode, convert_mode)
+    if batch_size is not None and batch_size < 1:
+        raise ValueError('batch_size must be a positive integer')
+
+    _, chunk_parser = _admin_unit_parsers(district, ward, parse_mode, convert_mode)
+
+    # Output columns: {column name: AdminUnit attribute}
+    target_cols = {}
+    for col_type, col_name in zip(['province', 'district', 'ward'], [province, district, ward]):
+        if not col_name:
+            continue
+        if col_type == 'district' and convert_mode:
+            continue  # skip if in convert_mode mode
+        target_cols[col_name if inplace else f"{prefix}{col_name}{suffix}"] = f"{'short_' if short_name else ''}{col_type}"
+    attrs = list(target_cols.values())
+
+    parquet_file = pq.ParquetFile(source)
+    dictionary_type = pa.dictionary(pa.int32(), pa.string())
+    schema = parquet_file.schema_arrow
+    for target_col in target_cols:
+        field = pa.field(target_col, dictionary_type)
+        index = schema.get_field_index(target_col) if inplace else -1
+        schema = schema.set(index, field) if index >= 0 else schema.append(field)
+    if inplace:
+        # Drop the original columns without a standardized one, as standardize_admin_unit_columns(): the district in convert_mode
+        for column in admin_unit_columns:
+            if column not in target_cols and schema.get_field_index(column) >= 0:
+                schema = schema.remove(schema.get_field_index(column))
+
+    if batch_size:
+        batches = (pa.Table.from_batches([batch]) for batch in parquet_file.iter_batches(batch_size=batch_size))
+    else:
+        batches = (parquet_file.read_row_group(i) for i in range(parquet_file.num_row_groups))
+
+    cache = LRUCache(maxsize=cache_size)  # {address: attribute values}, across batches
+    rows = 0
+    with pq.ParquetWriter(destination, schema, **writer_kwargs) as writer, \
+            tqdm(total=parquet_file.metadata.num_rows, desc='Standardizing administrative units', unit='rows', disable=not show_progress) as progress_bar:
+        for table in batches:
+            # CREATE ADDRESS COLUMN, same as standardize_admin_unit_columns(): ',' + ward + ',' + district + ',' + province
+            parts = [pc.fill_null(table[column].cast(pa.string()), '') for column in admin_unit_columns]
+            address = pc.binary_join_element_wise('', *parts, ',').combine_chunks()
+            encoded = pc.dictionary_encode(address)  # Distinct addresses of the batch and the index of each row
+
+            # PARSE DISTINCT ADDRESSES
+            distinct = encoded.dictionary.to_pylist()
+            values = [cache.get(a) for a in distinct]
+            missing = [i for i, v in enumerate(values) if v is None]
+            if missing:
+                units = chunk_parser([distinct[i] for i in missing])
+                for i, unit in zip(missing, units):
+                    values[i] = tuple(getattr(unit, attr) for attr in attrs)
+                    cache.put(distinct[i], values[i])
+
+            # ADD STANDARDIZED COLUMNS, dictionary-encoded: the distinct names once, and an index per row
+            for position, target_col in enumerate(target_cols):
+                names = pa.array([v[position] for v in values], type=pa.string()).dictionary_encode()
+                column = pa.DictionaryArray.from_arrays(pc.take(names.indices, encoded.indices), names.dictionary)
+                index = table.schema.get_field_index(target_col) if inplace else -1
+                table = table.set_column(index, target_col, column) if index >= 0 else table.append_column(target_col, column)
+
+            writer.write_table(table.select(schema.names).cast(schema))
+            rows += table.num_rows
+            progress_bar.update(table.num_rows)
+
+    return rows
@@ -0,0 +1,145 @@
+from ..parser import parse_unique_addresses, ParseMode
+from ..parser.objects import AdminUnit
+from ..converter import convert_unique_addresses, ConvertMode, Geocoder
+from operator import attrgetter
+from typing import Union, Iterable, List
+
+
+# numpy, pandas and pyarrow are imported inside the functions, so only the one of the chosen output is loaded.
+
+# Column type of every AdminUnit field: codes as integers, locations as floats, everything else as strings
+COLUMN_TYPES = {
+    field: 'int' if field.endswith('_code') else 'float' if field in ['latitude', 'longitude'] else 'str'
+    for field in AdminUnit.FIELDS
+}
+OUTPUTS = ['pandas', 'arrow']
+# pandas dtypes of the column types: nullable extension dtypes (`pd.NA`), or numpy dtypes (`None` in object columns)
+PANDAS_DTYPES = {
+    'nullable': {'int': 'Int32', 'float': 'float64', 'str': 'string'},
+    'object': {'int': 'object', 'float': 'float64', 'str': 'object'},
+}
+
+
+def default_columns(district: bool) -> List[str]:
+    '''
+    :param district: Include the district columns.
+    :return: Every AdminUnit field except `address` and the keys.
+    '''
+    return [
+        field for field in AdminUnit.FIELDS
+        if field != 'address' and not field.endswith('_key') and (district or 'district' not in field)
+    ]
+
+
+def check_columns(columns: List[str]):
+    unknown = [c for c in columns if c not in COLUMN_TYPES]
+    if unknown:
+        raise ValueError(f'Invalid columns {unknown}. Available columns are {list(AdminUnit.FIELDS)}.')
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):  # None, NaN
+        return None
+
+
+def column_values(units: List[AdminUnit], columns: List[str]) -> dict:
+    '''
+    :param units: List of AdminUnit objects.
+    :param columns: AdminUnit fields, see `COLUMN_TYPES`.
+    :return: `{column: list of values}`, in the order of `units`. Codes are converted to `int`.
+    '''
+    # One attribute pass over the units, values grouped by column
+    getter = attrgetter(*columns) if len(columns) > 1 else (lambda unit: (getattr(unit, columns[0]),))
+    by_column = list(zip(*map(getter, units))) if units else [()] * len(columns)
+    return {
+        column: [_to_int(v) for v in values] if COLUMN_TYPES[column] == 'int' else list(values)
+        for column, values in zip(columns, by_column)
+    }
+
+
+def build_table(units: List[AdminUnit], indexes: List[int], columns: List[str], output: str='pandas', dtypes: str='nullable'):
+    '''
+    Build a table with one row per index: row `i` holds the `columns` of `units[indexes[i]]`.
+
+    Each column is built once from the distinct units, then gathered to the rows in a single vectorized `take()`, so
+    there is no object per row and no attribute access per row.
+
+    :param units: List of AdminUnit objects.
+    :param indexes: Index in `units` of each row.
+    :param columns: AdminUnit fields to output, see `COLUMN_TYPES`.
+    :param output: `'pandas'` for a `pandas.DataFrame`, or `'arrow'` for a `pyarrow.Table`.
+    :param dtypes: pandas column dtypes, see `PANDAS_DTYPES`: `'nullable'` for `Int32`, `float64` and `string` columns, missing values are `pd.NA`. `'object'` for `object` columns (`float64` for locations), missing values are `None`.
+    :return: `pandas.DataFrame` or `pyarrow.Table` object.
+    '''
+    columns = list(columns)
+    check_columns(columns)
+    if output not in OUTPUTS:
+        raise ValueError(f'Invalid output. Available outputs are {OUTPUTS}.')
+    if dtypes not in PANDAS_DTYPES:
+        raise ValueError(f'Invalid dtypes. Available dtypes are {list(PANDAS_DTYPES)}.')
+
+    values = column_values(units, columns)
+
+    if output == 'arrow':
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("output='arrow' requires pyarrow: pip install pyarrow")
+
+        types = {'int': pa.int32(), 'float': pa.float64(), 'str': pa.string()}
+        indexes = pa.array(indexes, type=pa.int64())
+        return pa.table({
+            column: pa.array(values[column], type=types[COLUMN_TYPES[column]]).take(indexes)
+            for column in columns
+        })
+
+    import numpy as np
+    import pandas as pd
+
+    column_dtypes = PANDAS_DTYPES[dtypes]
+    indexes = np.asarray(indexes, dtype=np.intp)
+    frame = {}
+    for column in columns:
+        dtype = column_dtypes[COLUMN_TYPES[column]]
+        # Series with an explicit dtype: pandas would otherwise infer `str` for object columns of strings
+        frame[column] = pd.Series(pd.array(values[column], dtype=dtype).take(indexes), dtype=dtype, copy=False)
+    return pd.DataFrame(frame)
+
+
+def parse_addresses_table(addresses: Iterable[str], mode: Union[str, ParseMode]=ParseMode.latest(), keep_street: bool=True, level: int=0, columns: List[str]=None, output: str='pandas', dtypes: str='nullable'):
+    '''
+    Parse many addresses to a table, one row per address in input order, without an AdminUnit object per row.
+
+    :param addresses: Iterable of addresses, e.g. a list or a `pandas.Series`.
+    :param mode: One of the `ParseMode` values. See `parse_address()`.
+    :param keep_street: See `parse_address()`.
+    :param level: See `parse_address()`.
+    :param columns: AdminUnit fields to output. Default is every field except `address` and the keys, and the district fields in `'LEGACY'` mode only.
+    :param output: `'pandas'` for a `pandas.DataFrame`, or `'arrow'` for a `pyarrow.Table`.
+    :param dtypes: pandas column dtypes: `'nullable'` (`Int32`, `float64`, `string`, missing values are `pd.NA`) or `'object'` (missing values are `None`). Ignored with `output='arrow'`.
+    :return: `pandas.DataFrame` or `pyarrow.Table` object. Codes are integer columns, latitude and longitude are float columns, the others are string columns.
+    '''
+    units, indexes = parse_unique_addresses(addresses, mode=mode, keep_street=keep_street, level=level)
+    if columns is None:
+        columns = default_columns(district=mode in [ParseMode.LEGACY, ParseMode.LEGACY.value])
+    return build_table(units, indexes, columns, output=output, dtypes=dtypes)
+
+
+def convert_addresses_table(addresses: Iterable[str], mode: Union[str, ConvertMode]=ConvertMode.CONVERT_2025, geocoder: Geocoder=None, columns: List[str]=None, output: str='pandas', dtypes: str='nullable'):
+    '''
+    Convert many addresses to a table, one row per address in input order, without an AdminUnit object per row.
+
+    :param addresses: Iterable of addresses, e.g. a list or a `pandas.Series`.
+    :param mode: One of the `ConvertMode` values. Currently, only `'CONVERT_2025'` is supported.
+    :param geocoder: Object with a `geocode(unit)` method. Default is `get_default_geocoder()`.
+    :param columns: AdminUnit fields to output. Default is every field except `address`, the keys and the district fields.
+    :param output: `'pandas'` for a `pandas.DataFrame`, or `'arrow'` for a `pyarrow.Table`.
+    :param dtypes: pandas column dtypes, see `parse_addresses_table()`.
+    :return: `pandas.DataFrame` or `pyarrow.Table` object. See `parse_addresses_table()`.
+    '''
+    units, indexes = convert_unique_addresses(addresses, mode=mode, geocoder=geocoder)
+    if columns is None:
+        columns = default_columns(district=False)
+    return build_table(units, indexes, columns, output=output, dtypes=dtypes)
@@ -1,7 +1,13 @@
-from .parser_from_2025 import parse_address_from_2025
-from .parser_legacy import parse_address_legacy
+from .parser_from_2025 import parse_address_from_2025, parse_normalized_address_from_2025
+from .parser_legacy import parse_address_legacy, parse_normalized_address_legacy
+from .matcher import MatchEngine, set_match_engine, get_match_engine
+from .utils import unicode_normalize, key_normalize
+from .cache import ADDRESS_CACHE, cache_enabled
+from . import profiling
 from enum import Enum
-from typing import Union
+from typing import Union, Iterable
+from time import perf_counter
+import copy
 
 class ParseMode(Enum):
     LEGACY = "LEGACY"
@@ -32,9 +38,115 @@ def parse_address(address: str, mode: Union[str, ParseMode]=ParseMode.latest(),
 
     if mode in [ParseMode.FROM_2025, ParseMode.FROM_2025.value]:
         level = 2 if not level else level
-        return parse_address_from_2025(address, keep_street=keep_street, level=level)
+        parse = parse_normalized_address_from_2025
     elif mode in [ParseMode.LEGACY, ParseMode.LEGACY.value]:
         level = 3 if not level else level
-        return parse_address_legacy(address, keep_street=keep_street, level=level)
+        parse = parse_normalized_address_legacy
     else:
-        raise ValueError(f"Invalid mode. Available modes are {ParseMode.available(value=True)}.")
\ No newline at end of file
+        raise ValueError(f"Invalid mode. Available modes are {ParseMode.available(value=True)}.")
+
+    if profiling.CALLBACKS:
+        start = perf_counter()
+        address = unicode_normalize(address)
+        profiling.lap('normalize', start)
+    else:
+        address = unicode_normalize(address)
+    if not cache_enabled() or not isinstance(address, str):
+        return parse(address, keep_street=keep_street, level=level)
+
+    cache_key = ('PARSE', ParseMode(mode).value, level, bool(keep_street), address)
+    unit = ADDRESS_CACHE.get(cache_key)
+    if unit is None:
+        unit = parse(address, keep_street=keep_street, level=level)
+        ADDRESS_CACHE.put(cache_key, unit)
+    return unit
+
+def parse_unique_addresses(addresses: Iterable[str], mode: Union[str, ParseMode]=ParseMode.latest(), keep_street: bool=True, level: int=0):
+    '''
+    Parse each distinct address once, without building a result per input address. Addresses are parsed grouped by
+    their last part (usually the province), so the keyword matchers of a province are reused while they are hot.
+
+    :param addresses: Iterable of addresses.
+    :param mode: One of the `ParseMode` values. See `parse_address()`.
+    :param keep_street: See `parse_address()`.
+    :param level: See `parse_address()`.
+    :return: `(units, indexes)`: list of AdminUnit objects, one per distinct normalized address, and the index in `units` of each input address.
+    '''
+
+    if mode in [ParseMode.FROM_2025, ParseMode.FROM_2025.value]:
+        level = 2 if not level else level
+        if level not in [1, 2]:
+            raise ValueError('Level must be 1, or 2')
+        parse = parse_normalized_address_from_2025
+    elif mode in [ParseMode.LEGACY, ParseMode.LEGACY.value]:
+        level = 3 if not level else level
+        if level not in [1, 2, 3]:
+            raise ValueError('Level must be 1, 2, or 3')
+        parse = parse_normalized_address_legacy
+    else:
+        raise ValueError(f"Invalid mode. Available modes are {ParseMode.available(value=True)}.")
+
+    addresses = list(addresses)
+    profile = profiling.CALLBACKS
+    if profile:
+        start = perf_counter()
+
+    # Normalize each distinct input once, then deduplicate again on the normalized form
+    normalized = {address: unicode_normalize(address) for address in dict.fromkeys(addresses)}
+
+    # Address keys keep commas and key_normalize() maps characters one by one, so the key of an address is the
+    # join of the keys of its parts. Wards, districts and provinces repeat a lot, so their keys are shared.
+    part_keys = {}
+    part_keys_accented = {}
+
+    def address_keys(address):
+        parts = address.split(',')
+        for part in parts:
+            if part not in part_keys:
+                part_keys[part] = key_normalize(part, keep=[','])
+                part_keys_accented[part] = key_normalize(part, keep=[','], decode=False)
+        return ','.join(part_keys[p] for p in parts), ','.join(part_keys_accented[p] for p in parts)
+
+    # Group by the last part of the address, usually the province, to reuse its matchers while they are hot
+    groups = {}
+    for address in dict.fromkeys(normalized.values()):
+        keys = address_keys(address)
+        groups.setdefault(keys[0].rsplit(',', 1)[-1], []).append((address, keys))
+    if profile:
+        profiling.lap('normalize', start)
+
+    units = []
+    positions = {}
+    for group in groups.values():
+        for address, (address_key, address_key_accented) in group:
+            positions[address] = len(units)
+            units.append(parse(address, keep_street=keep_street, level=level,
+                               address_key=address_key, address_key_accented=address_key_accented))
+
+    return units, [positions[normalized[address]] for address in addresses]
+
+
+def parse_addresses(addresses: Iterable[str], mode: Union[str, ParseMode]=ParseMode.latest(), keep_street: bool=True, level: int=0) -> list:
+    '''
+    Parse many addresses at once. Same result as `[parse_address(a, ...) for a in addresses]`, but faster:
+    each distinct address is normalized and parsed once (see `parse_unique_addresses()`).
+
+    :param addresses: Iterable of addresses.
+    :param mode: One of the `ParseMode` values. See `parse_address()`.
+    :param keep_street: See `parse_address()`.
+    :param level: See `parse_address()`.
+    :return: List of AdminUnit objects, in input order. Repeated addresses get equal but distinct objects.
+    '''
+
+    units, indexes = parse_unique_addresses(addresses, mode=mode, keep_street=keep_street, level=level)
+
+    results = []
+    used = set()
+    for index in indexes:
+        unit = units[index]
+        if index in used:
+            unit = copy.copy(unit)
+        else:
+            used.add(index)
+        results.append(unit)
+    return results
@@ -0,0 +1,99 @@
+import copy
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    '''
+    Thread-safe least-recently-used cache of `AdminUnit` objects.
+
+    Values are copied in and out, so callers can modify the objects they get without corrupting the cache.
+    '''
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        '''
+        :param key: Hashable key.
+        :return: A copy of the cached value, or `None`.
+        '''
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+        return copy.copy(value)
+
+    def put(self, key, value):
+        '''
+        :param key: Hashable key.
+        :param value: Value to cache, a copy of it is stored.
+        '''
+        if self.maxsize <= 0:
+            return
+        value = copy.copy(value)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+# Shared by `parse_address()` and `convert_address()`. The default size can be overridden with the
+# `VIETNAMADMINUNITS_CACHE_SIZE` environment variable, `0` disables the cache.
+ADDRESS_CACHE = LRUCache(maxsize=int(os.environ.get('VIETNAMADMINUNITS_CACHE_SIZE', 10000)))
+
+
+def cache_enabled() -> bool:
+    return ADDRESS_CACHE.maxsize > 0
+
+
+def set_cache_size(maxsize: int):
+    '''
+    Set the maximum number of results kept by the `parse_address()` and `convert_address()` cache.
+    The least recently used results are evicted first.
+
+    :param maxsize: Maximum number of cached results, `0` to disable the cache. Default is `10000`.
+    '''
+    if not isinstance(maxsize, int) or maxsize < 0:
+        raise ValueError('maxsize must be a non-negative integer')
+    ADDRESS_CACHE.resize(maxsize)
+
+
+def cache_info() -> CacheInfo:
+    '''
+    :return: `CacheInfo(hits, misses, maxsize, currsize)` of the `parse_address()` and `convert_address()` cache.
+    '''
+    return ADDRESS_CACHE.info()
+
+
+def cache_clear():
+    '''
+    Empty the `parse_address()` and `convert_address()` cache and reset its statistics.
+    '''
+    ADDRESS_CACHE.clear()
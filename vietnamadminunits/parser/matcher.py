@@ -0,0 +1,115 @@
+import os
+import re
+from enum import Enum
+from typing import Union
+
+
+class MatchEngine(Enum):
+    REGEX = "REGEX"  # One big alternation pattern, matched by the `re` engine
+    TRIE = "TRIE"  # Keyword trie, matched in a single pass over the address key
+
+    @classmethod
+    def available(cls, value=False):
+        attrs = list(cls)
+        if value:
+            attrs = [a.value for a in attrs]
+        return attrs
+
+
+class RegexMatcher:
+    '''
+    Find keywords with one alternation pattern. Longer keywords come first so they win over their own prefixes.
+    '''
+    def __init__(self, keywords: list):
+        keywords = sorted(keywords, key=len, reverse=True)
+        self.pattern = re.compile('|'.join(re.escape(k) for k in keywords), flags=re.IGNORECASE)
+
+    def find_last(self, text: str):
+        '''
+        :param text: Address key.
+        :return: The last keyword found in `text`, or `None`.
+        '''
+        return next((m.group() for m in reversed(list(self.pattern.finditer(text)))), None)
+
+
+class TrieMatcher:
+    '''
+    Find keywords with a character trie.
+
+    Scanning is the same as `RegexMatcher`: from left to right, take the longest keyword starting at each position,
+    then continue after it. Only the last keyword is kept, so no match object is created. Address keys are already
+    lowercase, so keywords are matched as is.
+    '''
+    END = ''  # Key of the keyword end marker, never a character of the text
+
+    def __init__(self, keywords: list):
+        self.root = {}
+        for keyword in keywords:
+            if not keyword:
+                continue
+            node = self.root
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[self.END] = True
+
+    def find_last(self, text: str):
+        '''
+        :param text: Address key.
+        :return: The last keyword found in `text`, or `None`.
+        '''
+        root = self.root
+        END = self.END
+        last_start = last_end = 0
+        i = 0
+        n = len(text)
+        while i < n:
+            node = root.get(text[i])
+            if node is None:
+                i += 1
+                continue
+
+            end = i + 1 if END in node else 0
+            j = i + 1
+            while j < n:
+                node = node.get(text[j])
+                if node is None:
+                    break
+                j += 1
+                if END in node:
+                    end = j
+
+            if end:
+                last_start, last_end = i, end
+                i = end
+            else:
+                i += 1
+
+        return text[last_start:last_end] if last_end else None
+
+
+MATCHERS = {
+    MatchEngine.REGEX: RegexMatcher,
+    MatchEngine.TRIE: TrieMatcher,
+}
+
+# Default engine, can be overridden with the `VIETNAMADMINUNITS_MATCH_ENGINE` environment variable.
+_match_engine = MatchEngine(os.environ.get('VIETNAMADMINUNITS_MATCH_ENGINE', MatchEngine.TRIE.value).upper())
+
+
+def set_match_engine(engine: Union[str, MatchEngine]):
+    '''
+    Choose the engine used to find province, district and ward keywords in addresses.
+
+    :param engine: One of the `MatchEngine` values, `'TRIE'` (default) or `'REGEX'`.
+    '''
+    global _match_engine
+    if engine not in MatchEngine.available() + MatchEngine.available(value=True):
+        raise ValueError(f"Invalid engine. Available engines are {MatchEngine.available(value=True)}.")
+    _match_engine = MatchEngine(engine)
+
+
+def get_match_engine() -> MatchEngine:
+    '''
+    :return: The `MatchEngine` in use.
+    '''
+    return _match_engine
@@ -1,4 +1,24 @@
+from operator import attrgetter
+
+
 class AdminUnit:
+    '''
+    Administrative unit parsed or converted from an address.
+
+    Attributes are stored in `__slots__` instead of a per-instance `__dict__`, so batch jobs keeping millions of units
+    use several times less memory.
+    '''
+    # Data fields, in the order of `__init__()`, `to_tuple()` and `to_dict()`
+    FIELDS = (
+        'address', 'province', 'district', 'ward', 'street',
+        'short_province', 'short_district', 'short_ward',
+        'district_type', 'ward_type',
+        'province_code', 'district_code', 'ward_code',
+        'latitude', 'longitude',
+        'province_key', 'district_key', 'ward_key',
+    )
+    __slots__ = FIELDS + ('show_district',)
+
     def __init__(self,
                  address=None,
                  province=None,
@@ -52,6 +72,31 @@ class AdminUnit:
 
         self.show_district = show_district
 
+    def to_tuple(self) -> tuple:
+        '''
+        :return: Values of `FIELDS`, in order. `AdminUnit(*unit.to_tuple())` is a copy of `unit` (with `show_district=False`).
+        '''
+        return _get_fields(self)
+
+    def to_dict(self) -> dict:
+        '''
+        :return: `{field: value}` of `FIELDS`, in order.
+        '''
+        return dict(zip(AdminUnit.FIELDS, _get_fields(self)))
+
+    def __copy__(self):
+        unit = AdminUnit.__new__(AdminUnit)
+        unit.__setstate__(self.__getstate__())
+        return unit
+
+    def __getstate__(self):
+        # Compact pickles for worker processes: the values only, without the slot names
+        return self.to_tuple() + (self.show_district,)
+
+    def __setstate__(self, state):
+        for name, value in zip(AdminUnit.__slots__, state):
+            setattr(self, name, value)
+
     def get_address(self, short_name=False):
         components = [self.street,  self.short_ward, self.short_district, self.short_province] if short_name else [self.street, self.ward, self.district, self.province]
         components = [i for i in components if i]
@@ -76,4 +121,7 @@ class AdminUnit:
         for attr in attributes:
             lines.append(f"{attr:<15} | {safe_format(getattr(self, attr)):<25}")
 
-        return f"Admin Unit: {self.get_address()}\n" + '\n'.join(lines)
\ No newline at end of file
+        return f"Admin Unit: {self.get_address()}\n" + '\n'.join(lines)
+
+
+_get_fields = attrgetter(*AdminUnit.FIELDS)
@@ -1,35 +1,106 @@
 import json
 from pathlib import Path
-import re
+import threading
+from time import perf_counter
 
 if __name__ == '__main__':
-    from utils import key_normalize, extract_street, replace_from_right, unicode_normalize
+    from utils import key_normalize, extract_street, replace_from_right, unicode_normalize, build_keyword_index
     from objects import AdminUnit
+    from patterns import get_matcher
+    from snapshot import read_snapshot
+    import profiling
 else:
-    from .utils import key_normalize, extract_street, replace_from_right, unicode_normalize
+    from .utils import key_normalize, extract_street, replace_from_right, unicode_normalize, build_keyword_index
     from .objects import AdminUnit
+    from .patterns import get_matcher
+    from .snapshot import read_snapshot
+    from . import profiling
 
 # LOAD DATA
+# The data is loaded on the first parse (or first access to one of `DATA_NAMES`), not when the package is imported.
 MODULE_DIR = Path(__file__).parent.parent
-with open(MODULE_DIR / 'data/parser_from_2025.json', 'r') as f:
-    parser_data = json.load(f)
+DATA_FILE = MODULE_DIR / 'data/parser_from_2025.json'
+SNAPSHOT_FILE = MODULE_DIR / 'data/parser_from_2025.snapshot'  # Built from DATA_FILE by scripts/generating_module_data/s10_generating_snapshot_data.py
+DATA_NAMES = [
+    'parser_data',
+    'DICT_PROVINCE', 'DICT_PROVINCE_WARD_NO_ACCENTED', 'DICT_PROVINCE_WARD_ACCENTED', 'DICT_PROVINCE_WARD_SHORT_ACCENTED',
+    'DICT_UNIQUE_WARD_PROVINCE_NO_ACCENTED', 'DICT_UNIQUE_WARD_PROVINCE_ACCENTED',
+    'INDEX_PROVINCE', 'INDEX_PROVINCE_WARD_NO_ACCENTED', 'INDEX_PROVINCE_WARD_ACCENTED', 'INDEX_PROVINCE_WARD_SHORT_ACCENTED',
+    'INDEX_UNIQUE_WARD_PROVINCE_NO_ACCENTED', 'INDEX_UNIQUE_WARD_PROVINCE_ACCENTED',
+]
+# {province_key: table} tables, stored per province in the snapshot
+PROVINCE_TABLES = [
+    'DICT_PROVINCE_WARD_NO_ACCENTED',
+    'DICT_PROVINCE_WARD_ACCENTED',
+    'DICT_PROVINCE_WARD_SHORT_ACCENTED',
+    'INDEX_PROVINCE_WARD_NO_ACCENTED',
+    'INDEX_PROVINCE_WARD_ACCENTED',
+    'INDEX_PROVINCE_WARD_SHORT_ACCENTED',
+]
+_data_lock = threading.Lock()
+_data_loaded = False
+
+
+def build_data(parser_data: dict) -> dict:
+    '''
+    Build the lookup tables and keyword -> key indexes from `parser_from_2025.json`.
+
+    :param parser_data: Content of `parser_from_2025.json`.
+    :return: Dictionary of `{name: table}` for every name in `DATA_NAMES` except `parser_data`.
+    '''
+    data = {name: parser_data[name] for name in DATA_NAMES if name.startswith('DICT_')}
+
+    data['INDEX_PROVINCE'] = build_keyword_index(data['DICT_PROVINCE'], 'provinceKeywords')
+    for variant in ['NO_ACCENTED', 'ACCENTED', 'SHORT_ACCENTED']:
+        data[f'INDEX_PROVINCE_WARD_{variant}'] = {p: build_keyword_index(v, 'wardKeywords') for p, v in data[f'DICT_PROVINCE_WARD_{variant}'].items()}
+    for variant in ['NO_ACCENTED', 'ACCENTED']:
+        data[f'INDEX_UNIQUE_WARD_PROVINCE_{variant}'] = build_keyword_index(data[f'DICT_UNIQUE_WARD_PROVINCE_{variant}'], 'wardKeywords')
+    return data
+
+
+def load_data():
+    '''
+    Load the lookup tables as module globals, only on the first call.
+    They are read from `SNAPSHOT_FILE`, or built from `parser_from_2025.json` if the snapshot is missing or stale.
+    '''
+    global _data_loaded
+    if _data_loaded:
+        return
+    with _data_lock:
+        if not _data_loaded:
+            data = read_snapshot(SNAPSHOT_FILE, DATA_FILE, [name for name in DATA_NAMES if name != 'parser_data'])
+            if data is None:
+                with open(DATA_FILE, 'r') as f:
+                    data = build_data(json.load(f))
+            data['parser_data'] = {name: data[name] for name in DATA_NAMES if name.startswith('DICT_')}
+            globals().update(data)
+            _data_loaded = True
+
+
+def preload_data():
+    '''
+    Load every lookup table and build every keyword matcher of the current match engine now, instead of on first use.
+    '''
+    load_data()
+    for name in PROVINCE_TABLES:
+        for _ in globals()[name].values():  # Unpickle every province of the snapshot tables
+            pass
 
-DICT_PROVINCE = parser_data['DICT_PROVINCE']
-DICT_PROVINCE_WARD_NO_ACCENTED = parser_data['DICT_PROVINCE_WARD_NO_ACCENTED']
-DICT_PROVINCE_WARD_ACCENTED = parser_data['DICT_PROVINCE_WARD_ACCENTED']
-DICT_UNIQUE_WARD_PROVINCE_NO_ACCENTED = parser_data['DICT_UNIQUE_WARD_PROVINCE_NO_ACCENTED']
-DICT_UNIQUE_WARD_PROVINCE_ACCENTED = parser_data['DICT_UNIQUE_WARD_PROVINCE_ACCENTED']
-DICT_PROVINCE_WARD_SHORT_ACCENTED = parser_data['DICT_PROVINCE_WARD_SHORT_ACCENTED']
+    get_matcher('FROM_2025', None, None, 'PROVINCE', DICT_PROVINCE, 'provinceKeywords')
+    get_matcher('FROM_2025', None, None, 'UNIQUE_WARD_NO_ACCENTED', DICT_UNIQUE_WARD_PROVINCE_NO_ACCENTED, 'wardKeywords')
+    get_matcher('FROM_2025', None, None, 'UNIQUE_WARD_ACCENTED', DICT_UNIQUE_WARD_PROVINCE_ACCENTED, 'wardKeywords')
+    for variant in ['NO_ACCENTED', 'ACCENTED', 'SHORT_ACCENTED']:
+        for province_key, DICT_WARD in globals()[f'DICT_PROVINCE_WARD_{variant}'].items():
+            get_matcher('FROM_2025', province_key, None, variant, DICT_WARD, 'wardKeywords')
 
 
-province_keywords = sorted(sum([DICT_PROVINCE[k]['provinceKeywords'] for k in DICT_PROVINCE], []), key=len, reverse=True)
-PATTERN_PROVINCE = re.compile('|'.join(province_keywords), flags=re.IGNORECASE)
+def __getattr__(name):
+    if name in DATA_NAMES:
+        load_data()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-unique_ward_no_accented_keywords = sorted(sum([DICT_UNIQUE_WARD_PROVINCE_NO_ACCENTED[k]['wardKeywords'] for k in DICT_UNIQUE_WARD_PROVINCE_NO_ACCENTED], []), key=len, reverse=True)
-PATTERN_UNIQUE_WARD_PROVINCE_NO_ACCENTED = re.compile('|'.join(unique_ward_no_accented_keywords), flags=re.IGNORECASE)
 
-unique_ward_accented_keywords = sorted(sum([DICT_UNIQUE_WARD_PROVINCE_ACCENTED[k]['wardKeywords'] for k in DICT_UNIQUE_WARD_PROVINCE_ACCENTED], []), key=len, reverse=True)
-PATTERN_UNIQUE_WARD_PROVINCE_ACCENTED = re.compile('|'.join(unique_ward_accented_keywords), flags=re.IGNORECASE)
 
 
 
@@ -44,16 +115,41 @@ def parse_address_from_2025(address: str, keep_street :bool=True, level: int=2)
     :param level: [1,2]
     :return: AdminUnit object.
     '''
+    if profiling.CALLBACKS:
+        start = perf_counter()
+        address = unicode_normalize(address)
+        profiling.lap('normalize', start)
+    else:
+        address = unicode_normalize(address)
+    return parse_normalized_address_from_2025(address, keep_street=keep_street, level=level)
 
 
+def parse_normalized_address_from_2025(address: str, keep_street :bool=True, level: int=2, address_key: str=None, address_key_accented: str=None) -> AdminUnit:
+    '''
+    Same as `parse_address_from_2025()`, for an address already normalized by `unicode_normalize()`.
+
+    :param address_key: `key_normalize(address, keep=[','])`, if already known.
+    :param address_key_accented: `key_normalize(address, keep=[','], decode=False)`, if already known.
+    '''
+
     if level not in [1, 2]:
         raise ValueError('Level must be 1, or 2')
 
+    load_data()
+
     unit = AdminUnit()
 
-    address = unicode_normalize(address)
-    address_key = key_normalize(address, keep=[','])
-    address_key_accented = key_normalize(address, keep=[','], decode=False)
+    profile = profiling.CALLBACKS  # Time each stage, only if profiling is enabled
+    if profile:
+        lap = perf_counter()
+        keys_given = address_key is not None and address_key_accented is not None
+
+    if address_key is None:
+        address_key = key_normalize(address, keep=[','])
+    if address_key_accented is None:
+        address_key_accented = key_normalize(address, keep=[','], decode=False)
+    if profile and not keys_given:
+        lap = profiling.lap('normalize', lap)
     ward_keyword = None
     ward_key = None
     street = None
@@ -62,7 +158,7 @@ def parse_address_from_2025(address: str, keep_street :bool=True, level: int=2)
     # Find province
     # match = PATTERN_PROVINCE.search(address_key)
     # province_keyword = match.group(0) if match else None
-    province_keyword = next((m.group() for m in reversed(list(PATTERN_PROVINCE.finditer(address_key)))), None)
+    province_keyword = get_matcher('FROM_2025', None, None, 'PROVINCE', DICT_PROVINCE, 'provinceKeywords').find_last(address_key)
 
     # Xóa từ khóa ở chổ này là hợp lý (không mang xuống dưới), vì trường hợp 2 fallback ở dưới dành cho không tìm ra keyword trong address.
     if province_keyword:
@@ -70,26 +166,29 @@ def parse_address_from_2025(address: str, keep_street :bool=True, level: int=2)
         address_key_accented = replace_from_right(text=address_key, old=province_keyword, new='', for_text=address_key_accented)
         address_key = replace_from_right(text=address_key, old=province_keyword, new='')
 
-    province_key = next((k for k, v in DICT_PROVINCE.items() if province_keyword and province_keyword in [kw for kw in v['provinceKeywords']]), None)
+    province_key = INDEX_PROVINCE.get(province_keyword)
 
     if not province_key:
         # match = PATTERN_UNIQUE_WARD_PROVINCE_NO_ACCENTED.search(address_key)
         # ward_keyword = match.group(0) if match else None
-        ward_keyword = next((m.group() for m in reversed(list(PATTERN_UNIQUE_WARD_PROVINCE_NO_ACCENTED.finditer(address_key)))), None)
+        ward_keyword = get_matcher('FROM_2025', None, None, 'UNIQUE_WARD_NO_ACCENTED', DICT_UNIQUE_WARD_PROVINCE_NO_ACCENTED, 'wardKeywords').find_last(address_key)
 
-        ward_key = next((k for k, v in DICT_UNIQUE_WARD_PROVINCE_NO_ACCENTED.items() if ward_keyword and ward_keyword in [kw for kw in v['wardKeywords']]), None)
+        ward_key = INDEX_UNIQUE_WARD_PROVINCE_NO_ACCENTED.get(ward_keyword)
         if ward_key:
             province_key = DICT_UNIQUE_WARD_PROVINCE_NO_ACCENTED[ward_key]['provinceKey']
 
     if not province_key:
         # match = PATTERN_UNIQUE_WARD_PROVINCE_ACCENTED.search(address_key_accented)
         # ward_keyword = match.group(0) if match else None
-        ward_keyword = next((m.group() for m in reversed(list(PATTERN_UNIQUE_WARD_PROVINCE_ACCENTED.finditer(address_key_accented)))), None)
+        ward_keyword = get_matcher('FROM_2025', None, None, 'UNIQUE_WARD_ACCENTED', DICT_UNIQUE_WARD_PROVINCE_ACCENTED, 'wardKeywords').find_last(address_key_accented)
 
-        ward_key = next((k for k, v in DICT_UNIQUE_WARD_PROVINCE_ACCENTED.items() if ward_keyword and ward_keyword in [kw for kw in v['wardKeywords']]), None)
+        ward_key = INDEX_UNIQUE_WARD_PROVINCE_ACCENTED.get(ward_keyword)
         if ward_key:
             province_key = DICT_UNIQUE_WARD_PROVINCE_ACCENTED[ward_key]['provinceKey']
 
+    if profile:
+        lap = profiling.lap('province', lap)
+
     if not province_key:
         return unit
     else:
@@ -106,32 +205,34 @@ def parse_address_from_2025(address: str, keep_street :bool=True, level: int=2)
         DICT_WARD_NO_ACCENTED = DICT_PROVINCE_WARD_NO_ACCENTED.get(province_key)
         DICT_WARD_ACCENTED = DICT_PROVINCE_WARD_ACCENTED.get(province_key)
         DICT_WARD_SHORT_ACCENTED = DICT_PROVINCE_WARD_SHORT_ACCENTED.get(province_key)
+        INDEX_WARD_NO_ACCENTED = INDEX_PROVINCE_WARD_NO_ACCENTED.get(province_key)
+        INDEX_WARD_ACCENTED = INDEX_PROVINCE_WARD_ACCENTED.get(province_key)
+        INDEX_WARD_SHORT_ACCENTED = INDEX_PROVINCE_WARD_SHORT_ACCENTED.get(province_key)
 
-        def find_ward(address_key, DICT_WARD):
-            ward_keywords = sorted(sum([DICT_WARD[k]['wardKeywords'] for k in DICT_WARD], []), key=len, reverse=True)
-            PATTERN_WARD = re.compile('|'.join(ward_keywords), flags=re.IGNORECASE)
+        def find_ward(address_key, DICT_WARD, INDEX_WARD, variant):
+            MATCHER_WARD = get_matcher('FROM_2025', province_key, None, variant, DICT_WARD, 'wardKeywords')
 
             # match = PATTERN_WARD.search(address_key)
             # ward_keyword = match.group(0) if match else None
-            ward_keyword = next((m.group() for m in reversed(list(PATTERN_WARD.finditer(address_key)))), None)
+            ward_keyword = MATCHER_WARD.find_last(address_key)
 
             if not ward_keyword:
                 return None, None
-            ward_key = next((k for k, v in DICT_WARD.items() if ward_keyword and ward_keyword in [kw for kw in v['wardKeywords']]), None)
+            ward_key = INDEX_WARD.get(ward_keyword)
             return ward_keyword, ward_key
 
         if not ward_key and DICT_WARD_NO_ACCENTED:
-            ward_keyword, ward_key = find_ward(address_key, DICT_WARD_NO_ACCENTED)
+            ward_keyword, ward_key = find_ward(address_key, DICT_WARD_NO_ACCENTED, INDEX_WARD_NO_ACCENTED, 'NO_ACCENTED')
             if ward_key:
                 DICT_WARD = DICT_WARD_NO_ACCENTED
 
         if not ward_key and DICT_WARD_ACCENTED:
-            ward_keyword, ward_key = find_ward(address_key_accented, DICT_WARD_ACCENTED)
+            ward_keyword, ward_key = find_ward(address_key_accented, DICT_WARD_ACCENTED, INDEX_WARD_ACCENTED, 'ACCENTED')
             if ward_key:
                 DICT_WARD = DICT_WARD_ACCENTED
 
         if not ward_key and DICT_WARD_SHORT_ACCENTED:
-            ward_keyword, ward_key = find_ward(address_key_accented, DICT_WARD_SHORT_ACCENTED)
+            ward_keyword, ward_key = find_ward(address_key_accented, DICT_WARD_SHORT_ACCENTED, INDEX_WARD_SHORT_ACCENTED, 'SHORT_ACCENTED')
             if ward_key:
                 DICT_WARD = DICT_WARD_SHORT_ACCENTED
 
@@ -147,12 +248,17 @@ def parse_address_from_2025(address: str, keep_street :bool=True, level: int=2)
             # Không dùng address_key_accented bên dưới nữa nên chỉ remove cho address_key
             address_key = replace_from_right(address_key, key_normalize(ward_keyword), '')
 
+        if profile:
+            lap = profiling.lap('ward', lap)
+
 
     # Keep street
     if keep_street and (ward_key or address_key.count(',') >= 2):
         street = extract_street(address=address, address_key=address_key)
     if street:
         unit.street = street
+    if profile and keep_street:
+        profiling.lap('street', lap)
 
     return unit
 
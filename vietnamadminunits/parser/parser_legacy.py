@@ -1,47 +1,169 @@
 import json
 from pathlib import Path
 import re
+import threading
+from time import perf_counter
 
 if __name__ == '__main__':
-    from utils import key_normalize, extract_street, replace_from_right, unicode_normalize
+    from utils import key_normalize, extract_street, replace_from_right, unicode_normalize, build_keyword_index
     from objects import AdminUnit
+    from patterns import get_matcher
+    from snapshot import read_snapshot
+    import profiling
 else:
-    from .utils import key_normalize, extract_street, replace_from_right, unicode_normalize
+    from .utils import key_normalize, extract_street, replace_from_right, unicode_normalize, build_keyword_index
     from .objects import AdminUnit
+    from .patterns import get_matcher
+    from .snapshot import read_snapshot
+    from . import profiling
 
 
 # LOAD DATA
+# The data is loaded on the first parse (or first access to one of `DATA_NAMES`), not when the package is imported.
 MODULE_DIR = Path(__file__).parent.parent
-with open(MODULE_DIR / 'data/parser_legacy.json', 'r') as f:
-    parser_data = json.load(f)
+DATA_FILE = MODULE_DIR / 'data/parser_legacy.json'
+SNAPSHOT_FILE = MODULE_DIR / 'data/parser_legacy.snapshot'  # Built from DATA_FILE by scripts/generating_module_data/s10_generating_snapshot_data.py
+DATA_NAMES = [
+    'parser_data',
+    'DICT_PROVINCE', 'DICT_PROVINCE_DISTRICT', 'DICT_UNIQUE_DISTRICT_PROVINCE',
+    'DICT_PROVINCE_DISTRICT_WARD_NO_ACCENTED', 'DICT_PROVINCE_DISTRICT_WARD_ACCENTED', 'DICT_PROVINCE_DISTRICT_WARD_SHORT_ACCENTED',
+    'DICT_PROVINCE_DISTRICT_DIVIDED',
+    'INDEX_PROVINCE', 'INDEX_UNIQUE_DISTRICT_PROVINCE', 'INDEX_PROVINCE_DISTRICT',
+    'INDEX_PROVINCE_DISTRICT_WARD_NO_ACCENTED', 'INDEX_PROVINCE_DISTRICT_WARD_ACCENTED', 'INDEX_PROVINCE_DISTRICT_WARD_SHORT_ACCENTED',
+    'INDEX_PROVINCE_DISTRICT_DIVIDED', 'INDEX_PROVINCE_DISTRICT_DIVIDED_WARD',
+]
+# {province_key: table} tables, stored per province in the snapshot
+PROVINCE_TABLES = [
+    'DICT_PROVINCE_DISTRICT',
+    'DICT_PROVINCE_DISTRICT_WARD_NO_ACCENTED',
+    'DICT_PROVINCE_DISTRICT_WARD_ACCENTED',
+    'DICT_PROVINCE_DISTRICT_WARD_SHORT_ACCENTED',
+    'DICT_PROVINCE_DISTRICT_DIVIDED',
+    'INDEX_PROVINCE_DISTRICT',
+    'INDEX_PROVINCE_DISTRICT_WARD_NO_ACCENTED',
+    'INDEX_PROVINCE_DISTRICT_WARD_ACCENTED',
+    'INDEX_PROVINCE_DISTRICT_WARD_SHORT_ACCENTED',
+    'INDEX_PROVINCE_DISTRICT_DIVIDED',
+    'INDEX_PROVINCE_DISTRICT_DIVIDED_WARD',
+]
+_data_lock = threading.Lock()
+_data_loaded = False
+
+
+def build_data(parser_data: dict) -> dict:
+    '''
+    Build the lookup tables and keyword -> key indexes from `parser_legacy.json`.
+
+    :param parser_data: Content of `parser_legacy.json`.
+    :return: Dictionary of `{name: table}` for every name in `DATA_NAMES` except `parser_data`.
+    '''
+    data = {name: parser_data[name] for name in DATA_NAMES if name.startswith('DICT_')}
+
+    data['INDEX_PROVINCE'] = build_keyword_index(data['DICT_PROVINCE'], 'provinceKeywords')
+    data['INDEX_UNIQUE_DISTRICT_PROVINCE'] = build_keyword_index(data['DICT_UNIQUE_DISTRICT_PROVINCE'], 'districtKeywords')
+    data['INDEX_PROVINCE_DISTRICT'] = {p: build_keyword_index(v, 'districtKeywords') for p, v in data['DICT_PROVINCE_DISTRICT'].items()}
+    for variant in ['NO_ACCENTED', 'ACCENTED', 'SHORT_ACCENTED']:
+        data[f'INDEX_PROVINCE_DISTRICT_WARD_{variant}'] = {p: {d: build_keyword_index(v[d], 'wardKeywords') for d in v} for p, v in data[f'DICT_PROVINCE_DISTRICT_WARD_{variant}'].items()}
+    data['INDEX_PROVINCE_DISTRICT_DIVIDED'] = {p: build_keyword_index(v, 'dividedDistrictKeywords') for p, v in data['DICT_PROVINCE_DISTRICT_DIVIDED'].items()}
+    data['INDEX_PROVINCE_DISTRICT_DIVIDED_WARD'] = {p: {d: build_keyword_index(v[d]['districts'], 'wardKeywords') for d in v} for p, v in data['DICT_PROVINCE_DISTRICT_DIVIDED'].items()}
+    return data
+
+
+def load_data():
+    '''
+    Load the lookup tables as module globals, only on the first call.
+    They are read from `SNAPSHOT_FILE`, or built from `parser_legacy.json` if the snapshot is missing or stale.
+    '''
+    global _data_loaded
+    if _data_loaded:
+        return
+    with _data_lock:
+        if not _data_loaded:
+            data = read_snapshot(SNAPSHOT_FILE, DATA_FILE, [name for name in DATA_NAMES if name != 'parser_data'])
+            if data is None:
+                with open(DATA_FILE, 'r') as f:
+                    data = build_data(json.load(f))
+            data['parser_data'] = {name: data[name] for name in DATA_NAMES if name.startswith('DICT_')}
+            globals().update(data)
+            _data_loaded = True
+
+
+def preload_data():
+    '''
+    Load every lookup table and build every keyword matcher of the current match engine now, instead of on first use.
+    '''
+    load_data()
+    for name in PROVINCE_TABLES:
+        for _ in globals()[name].values():  # Unpickle every province of the snapshot tables
+            pass
+
+    get_matcher('LEGACY', None, None, 'PROVINCE', DICT_PROVINCE, 'provinceKeywords')
+    get_matcher('LEGACY', None, None, 'UNIQUE_DISTRICT', DICT_UNIQUE_DISTRICT_PROVINCE, 'districtKeywords')
+    for province_key, DICT_DISTRICT in DICT_PROVINCE_DISTRICT.items():
+        get_matcher('LEGACY', province_key, None, 'DISTRICT', DICT_DISTRICT, 'districtKeywords')
+    for province_key, DICT_DISTRICT_DIVIDED in DICT_PROVINCE_DISTRICT_DIVIDED.items():
+        get_matcher('LEGACY', province_key, None, 'DIVIDED_DISTRICT', DICT_DISTRICT_DIVIDED, 'dividedDistrictKeywords')
+        for divided_district_key, v in DICT_DISTRICT_DIVIDED.items():
+            get_matcher('LEGACY', province_key, divided_district_key, 'DIVIDED_WARD', v['districts'], 'wardKeywords')
+    for variant in ['NO_ACCENTED', 'ACCENTED', 'SHORT_ACCENTED']:
+        for province_key, DICT_DISTRICT_WARD in globals()[f'DICT_PROVINCE_DISTRICT_WARD_{variant}'].items():
+            for district_key, DICT_WARD in DICT_DISTRICT_WARD.items():
+                get_matcher('LEGACY', province_key, district_key, variant, DICT_WARD, 'wardKeywords')
+
+
+def __getattr__(name):
+    if name in DATA_NAMES:
+        load_data()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+tmp_hidden_keywords = [ # Nếu có từ khóa này nó sẽ nhầm vào các quận của Huế
+    'phuongthuanhoa', # Quận Thuận Hóa, Thành phố Huế
+    'phuongthuybieu', # Thị xã Hương Thủy, Thành phố Huế
+    'phuongthuyvan', # Thị xã Hương Thủy, Thành phố Huế
+    'phuongthuyxuan', # Thị xã Hương Thủy, Thành phố Huế
+]
+PATTERN_TMP_HIDDEN = re.compile('|'.join(re.escape(k) for k in tmp_hidden_keywords), flags=re.IGNORECASE)
 
-DICT_PROVINCE = parser_data['DICT_PROVINCE']
-DICT_PROVINCE_DISTRICT = parser_data['DICT_PROVINCE_DISTRICT']
-DICT_UNIQUE_DISTRICT_PROVINCE = parser_data['DICT_UNIQUE_DISTRICT_PROVINCE']
-DICT_PROVINCE_DISTRICT_WARD_NO_ACCENTED = parser_data['DICT_PROVINCE_DISTRICT_WARD_NO_ACCENTED']
-DICT_PROVINCE_DISTRICT_WARD_ACCENTED = parser_data['DICT_PROVINCE_DISTRICT_WARD_ACCENTED']
-DICT_PROVINCE_DISTRICT_WARD_SHORT_ACCENTED = parser_data['DICT_PROVINCE_DISTRICT_WARD_SHORT_ACCENTED']
 
-DICT_PROVINCE_DISTRICT_DIVIDED = parser_data['DICT_PROVINCE_DISTRICT_DIVIDED']
+# MAIN FUNCTION
+def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) -> AdminUnit:
+    if profiling.CALLBACKS:
+        start = perf_counter()
+        address = unicode_normalize(address)
+        profiling.lap('normalize', start)
+    else:
+        address = unicode_normalize(address)
+    return parse_normalized_address_legacy(address, keep_street=keep_street, level=level)
 
-province_keywords = sorted(sum([DICT_PROVINCE[k]['provinceKeywords'] for k in DICT_PROVINCE], []), key=len, reverse=True)
-PATTERN_PROVINCE = re.compile('|'.join(province_keywords), flags=re.IGNORECASE)
 
-unique_district_keys = sorted(sum([DICT_UNIQUE_DISTRICT_PROVINCE[k]['districtKeywords'] for k in DICT_UNIQUE_DISTRICT_PROVINCE], []), key=len, reverse=True)
-PATTERN_UNIQUE_DISTRICT = re.compile('|'.join(unique_district_keys), flags=re.IGNORECASE)
+def parse_normalized_address_legacy(address: str, keep_street :bool=True, level :int=3, address_key: str=None, address_key_accented: str=None) -> AdminUnit:
+    '''
+    Same as `parse_address_legacy()`, for an address already normalized by `unicode_normalize()`.
 
-
-# MAIN FUNCTION
-def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) -> AdminUnit:
+    :param address_key: `key_normalize(address, keep=[','])`, if already known.
+    :param address_key_accented: `key_normalize(address, keep=[','], decode=False)`, if already known.
+    '''
 
     if level not in [1, 2, 3]:
         raise ValueError('Level must be 1, 2, or 3')
 
+    load_data()
+
     unit = AdminUnit(show_district=True)
 
-    address = unicode_normalize(address)
-    address_key = key_normalize(address, keep=[','])
-    address_key_accented = key_normalize(address, keep=[','], decode=False)
+    profile = profiling.CALLBACKS  # Time each stage, only if profiling is enabled
+    if profile:
+        lap = perf_counter()
+        keys_given = address_key is not None and address_key_accented is not None
+
+    if address_key is None:
+        address_key = key_normalize(address, keep=[','])
+    if address_key_accented is None:
+        address_key_accented = key_normalize(address, keep=[','], decode=False)
+    if profile and not keys_given:
+        lap = profiling.lap('normalize', lap)
 
     district_key = None
     ward_key = None
@@ -54,7 +176,7 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
     # match = PATTERN_PROVINCE.search(address_key)
     # province_keyword = match.group(0) if match else None
     # Failed with 'Huyện Quảng Bình, Tỉnh Hà Giang' -> 'Tỉnh Quảng Bình'
-    province_keyword = next((m.group() for m in reversed(list(PATTERN_PROVINCE.finditer(address_key)))), None)
+    province_keyword = get_matcher('LEGACY', None, None, 'PROVINCE', DICT_PROVINCE, 'provinceKeywords').find_last(address_key)
 
     if province_keyword:
         # Ưu tiên address_key_accented trước vì address_key là tham số
@@ -62,16 +184,16 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
         address_key = replace_from_right(text=address_key, old=province_keyword, new='')
 
 
-    province_key = next((k for k, v in DICT_PROVINCE.items() if province_keyword and province_keyword in [kw for kw in v['provinceKeywords']]), None)
+    province_key = INDEX_PROVINCE.get(province_keyword)
 
     if not province_key:
-        district_keyword = next((m.group() for m in reversed(list(PATTERN_UNIQUE_DISTRICT.finditer(address_key)))), None)
+        district_keyword = get_matcher('LEGACY', None, None, 'UNIQUE_DISTRICT', DICT_UNIQUE_DISTRICT_PROVINCE, 'districtKeywords').find_last(address_key)
 
         if district_keyword:
             address_key_accented = replace_from_right(text=address_key, old=district_keyword, new='', for_text=address_key_accented)
             address_key = replace_from_right(text=address_key, old=district_keyword, new='')
 
-        district_key = next((k for k, v in DICT_UNIQUE_DISTRICT_PROVINCE.items() if district_keyword and district_keyword in [kw for kw in v['districtKeywords']]), None)
+        district_key = INDEX_UNIQUE_DISTRICT_PROVINCE.get(district_keyword)
 
         if district_key:
             province_key = DICT_UNIQUE_DISTRICT_PROVINCE[district_key]['provinceKey']
@@ -85,19 +207,13 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
         unit.latitude = DICT_PROVINCE[province_key]['provinceLat']
         unit.longitude = DICT_PROVINCE[province_key]['provinceLon']
 
+    if profile:
+        lap = profiling.lap('province', lap)
+
 
     # Find district
     if level in [2,3]:
 
-
-        tmp_hidden_keywords = [ # Nếu có từ khóa này nó sẽ nhầm vào các quận của Huế
-            'phuongthuanhoa', # Quận Thuận Hóa, Thành phố Huế
-            'phuongthuybieu', # Thị xã Hương Thủy, Thành phố Huế
-            'phuongthuyvan', # Thị xã Hương Thủy, Thành phố Huế
-            'phuongthuyxuan', # Thị xã Hương Thủy, Thành phố Huế
-        ]
-
-        PATTERN_TMP_HIDDEN = re.compile('|'.join(re.escape(k) for k in tmp_hidden_keywords), flags=re.IGNORECASE)
         tmp_hidden_keyword = next((m.group() for m in list(PATTERN_TMP_HIDDEN.finditer(address_key))), None) # No need to reverse because it is a ward keyword
         if tmp_hidden_keyword:
             address_key = address_key.replace(tmp_hidden_keyword, 'TMP_HIDDEN_KEYWORD')
@@ -106,16 +222,15 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
         DICT_DISTRICT = DICT_PROVINCE_DISTRICT[province_key]
         if not district_key:
             # Đây mới là phần chính
-            district_keywords = sorted(sum([DICT_DISTRICT[k]['districtKeywords'] for k in DICT_DISTRICT], []), key=len, reverse=True)
-            PATTERN_DISTRICT = re.compile('|'.join(re.escape(k) for k in district_keywords), flags=re.IGNORECASE)
+            MATCHER_DISTRICT = get_matcher('LEGACY', province_key, None, 'DISTRICT', DICT_DISTRICT, 'districtKeywords')
 
-            district_keyword = next((m.group() for m in reversed(list(PATTERN_DISTRICT.finditer(address_key)))), None)
+            district_keyword = MATCHER_DISTRICT.find_last(address_key)
 
             if district_keyword:
                 address_key_accented = replace_from_right(text=address_key, old=district_keyword, new='', for_text=address_key_accented)
                 address_key = replace_from_right(text=address_key, old=district_keyword, new='')
 
-            district_key = next((k for k, v in DICT_DISTRICT.items() if district_keyword and district_keyword in [kw for kw in v['districtKeywords']]), None)
+            district_key = INDEX_PROVINCE_DISTRICT[province_key].get(district_keyword)
 
 
 
@@ -129,10 +244,9 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
 
             # Tìm district cũ (bị chia)
             if DICT_DISTRICT_DIVIDED:
-                divided_district_keywords = sorted(sum([DICT_DISTRICT_DIVIDED[k]['dividedDistrictKeywords'] for k in DICT_DISTRICT_DIVIDED], []), key=len, reverse=True)
-                PATTERN_DISTRICT_DIVIDED = re.compile('|'.join(re.escape(k) for k in divided_district_keywords), flags=re.IGNORECASE)
-                divided_district_keyword = next((m.group() for m in reversed(list(PATTERN_DISTRICT_DIVIDED.finditer(address_key)))), None)
-                divided_district_key = next((k for k, v in DICT_DISTRICT_DIVIDED.items() if divided_district_keyword and divided_district_keyword in [kw for kw in v['dividedDistrictKeywords']]), None)
+                MATCHER_DISTRICT_DIVIDED = get_matcher('LEGACY', province_key, None, 'DIVIDED_DISTRICT', DICT_DISTRICT_DIVIDED, 'dividedDistrictKeywords')
+                divided_district_keyword = MATCHER_DISTRICT_DIVIDED.find_last(address_key)
+                divided_district_key = INDEX_PROVINCE_DISTRICT_DIVIDED[province_key].get(divided_district_keyword)
 
                 # print(divided_district_keyword)
 
@@ -146,10 +260,9 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
                         tmp_hidden_keyword = None
 
                     DICT_DISTRICT_WARD = DICT_DISTRICT_DIVIDED[divided_district_key]['districts']
-                    ward_keywords = sorted(sum([DICT_DISTRICT_WARD[k]['wardKeywords'] for k in DICT_DISTRICT_WARD], []), key=len, reverse=True)
-                    PATTERN_WARD = re.compile('|'.join(ward_keywords), flags=re.IGNORECASE)
-                    ward_keyword = next((m.group() for m in reversed(list(PATTERN_WARD.finditer(address_key)))), None)
-                    district_key = next((k for k, v in DICT_DISTRICT_WARD.items() if ward_keyword and ward_keyword in [kw for kw in v['wardKeywords']]), None)
+                    MATCHER_WARD = get_matcher('LEGACY', province_key, divided_district_key, 'DIVIDED_WARD', DICT_DISTRICT_WARD, 'wardKeywords')
+                    ward_keyword = MATCHER_WARD.find_last(address_key)
+                    district_key = INDEX_PROVINCE_DISTRICT_DIVIDED_WARD[province_key][divided_district_key].get(ward_keyword)
                     
                     # print(address_key)
                     # print(ward_keyword)
@@ -162,10 +275,9 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
             divided_district_key = district_key
             district_key = None
             DICT_DISTRICT_WARD = DICT_DISTRICT_DIVIDED[divided_district_key]['districts']
-            ward_keywords = sorted(sum([DICT_DISTRICT_WARD[k]['wardKeywords'] for k in DICT_DISTRICT_WARD], []), key=len, reverse=True)
-            PATTERN_WARD = re.compile('|'.join(ward_keywords), flags=re.IGNORECASE)
-            ward_keyword = next((m.group() for m in reversed(list(PATTERN_WARD.finditer(address_key)))), None)
-            district_key = next((k for k, v in DICT_DISTRICT_WARD.items() if ward_keyword and ward_keyword in [kw for kw in v['wardKeywords']]), None)
+            MATCHER_WARD = get_matcher('LEGACY', province_key, divided_district_key, 'DIVIDED_WARD', DICT_DISTRICT_WARD, 'wardKeywords')
+            ward_keyword = MATCHER_WARD.find_last(address_key)
+            district_key = INDEX_PROVINCE_DISTRICT_DIVIDED_WARD[province_key][divided_district_key].get(ward_keyword)
             if not district_key:
                 district_key = next((k for k in DICT_DISTRICT_WARD if DICT_DISTRICT_WARD[k]['districtDefault'] == True), None)
 
@@ -180,6 +292,9 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
             unit.latitude = DICT_DISTRICT[district_key]['districtLat']
             unit.longitude = DICT_DISTRICT[district_key]['districtLon']
 
+        if profile:
+            lap = profiling.lap('district', lap)
+
     # Find ward
     if level == 3:
 
@@ -191,27 +306,30 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
         DICT_WARD_ACCENTED = DICT_PROVINCE_DISTRICT_WARD_ACCENTED.get(province_key, {}).get(district_key)
         DICT_WARD_SHORT_ACCENTED = DICT_PROVINCE_DISTRICT_WARD_SHORT_ACCENTED.get(province_key, {}).get(district_key)
 
-        def find_ward(address_key, DICT_WARD):
-            ward_keywords = sorted(sum([DICT_WARD[k]['wardKeywords'] for k in DICT_WARD], []), key=len, reverse=True)
-            PATTERN_WARD = re.compile('|'.join(ward_keywords), flags=re.IGNORECASE)
+        INDEX_WARD_NO_ACCENTED = INDEX_PROVINCE_DISTRICT_WARD_NO_ACCENTED.get(province_key, {}).get(district_key)
+        INDEX_WARD_ACCENTED = INDEX_PROVINCE_DISTRICT_WARD_ACCENTED.get(province_key, {}).get(district_key)
+        INDEX_WARD_SHORT_ACCENTED = INDEX_PROVINCE_DISTRICT_WARD_SHORT_ACCENTED.get(province_key, {}).get(district_key)
+
+        def find_ward(address_key, DICT_WARD, INDEX_WARD, variant):
+            MATCHER_WARD = get_matcher('LEGACY', province_key, district_key, variant, DICT_WARD, 'wardKeywords')
 
-            ward_keyword = next((m.group() for m in reversed(list(PATTERN_WARD.finditer(address_key)))), None)
+            ward_keyword = MATCHER_WARD.find_last(address_key)
 
-            ward_key = next((k for k, v in DICT_WARD.items() if ward_keyword and ward_keyword in [kw for kw in v['wardKeywords']]), None)
+            ward_key = INDEX_WARD.get(ward_keyword)
             return ward_keyword, ward_key
 
         if DICT_WARD_NO_ACCENTED:
-            ward_keyword, ward_key = find_ward(address_key=address_key, DICT_WARD=DICT_WARD_NO_ACCENTED)
+            ward_keyword, ward_key = find_ward(address_key=address_key, DICT_WARD=DICT_WARD_NO_ACCENTED, INDEX_WARD=INDEX_WARD_NO_ACCENTED, variant='NO_ACCENTED')
             if ward_key:
                 DICT_WARD = DICT_WARD_NO_ACCENTED
 
         if not ward_key and DICT_WARD_ACCENTED:
-            ward_keyword, ward_key = find_ward(address_key=address_key_accented, DICT_WARD=DICT_WARD_ACCENTED)
+            ward_keyword, ward_key = find_ward(address_key=address_key_accented, DICT_WARD=DICT_WARD_ACCENTED, INDEX_WARD=INDEX_WARD_ACCENTED, variant='ACCENTED')
             if ward_key:
                 DICT_WARD = DICT_WARD_ACCENTED
 
         if not ward_key and DICT_WARD_SHORT_ACCENTED:
-            ward_keyword, ward_key = find_ward(address_key=address_key_accented, DICT_WARD=DICT_WARD_SHORT_ACCENTED)
+            ward_keyword, ward_key = find_ward(address_key=address_key_accented, DICT_WARD=DICT_WARD_SHORT_ACCENTED, INDEX_WARD=INDEX_WARD_SHORT_ACCENTED, variant='SHORT_ACCENTED')
             if ward_key:
                 DICT_WARD = DICT_WARD_SHORT_ACCENTED
 
@@ -227,6 +345,9 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
             # Không dùng address_key_accented bên dưới nữa nên chỉ remove cho address_key
             address_key = replace_from_right(text=address_key, old=key_normalize(ward_keyword), new='')
 
+        if profile:
+            lap = profiling.lap('ward', lap)
+
     # Keep street
     special_zone = ['huyenbachlongvi', 'huyenconco', 'huyenhoangsa', 'huyenlyson', 'huyencondao']
 
@@ -234,6 +355,8 @@ def parse_address_legacy(address: str, keep_street :bool=True, level :int=3) ->
         street = extract_street(address=address, address_key=address_key)
     if street:
         unit.street = street
+    if profile and keep_street:
+        profiling.lap('street', lap)
 
     return unit
 
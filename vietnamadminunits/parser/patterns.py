@@ -0,0 +1,37 @@
+from time import perf_counter
+
+if __name__ == '__main__':
+    from matcher import MATCHERS, get_match_engine
+    import profiling
+else:
+    from .matcher import MATCHERS, get_match_engine
+    from . import profiling
+
+
+# Keyword matchers, keyed by (engine, mode, province_key, district_key, variant).
+# Filled lazily: a matcher is built the first time its province/district is parsed, then reused.
+PATTERN_REGISTRY = {}
+
+
+def get_matcher(mode: str, province_key: str, district_key: str, variant: str, DICT: dict, field: str):
+    '''
+    Get the keyword matcher of a dictionary from the registry, build it on the first call.
+
+    :param mode: Parse mode value, `'LEGACY'` or `'FROM_2025'`.
+    :param province_key: Province key of the dictionary, `None` for country-wide dictionaries.
+    :param district_key: District key of the dictionary, `None` if the dictionary is not per district.
+    :param variant: Dictionary variant, e.g. `'NO_ACCENTED'`, `'ACCENTED'`, `'SHORT_ACCENTED'`, `'DISTRICT'`.
+    :param DICT: Dictionary of `{key: {field: [keywords]}}`.
+    :param field: Keyword field, e.g. `'wardKeywords'`.
+    :return: `RegexMatcher` or `TrieMatcher`, depending on `get_match_engine()`.
+    '''
+    engine = get_match_engine()
+    registry_key = (engine, mode, province_key, district_key, variant)
+    matcher = PATTERN_REGISTRY.get(registry_key)
+    if matcher is None:
+        start = perf_counter() if profiling.CALLBACKS else None
+        matcher = MATCHERS[engine](sum([DICT[k][field] for k in DICT], []))
+        PATTERN_REGISTRY[registry_key] = matcher
+        if start is not None:
+            profiling.lap('matcher', start)
+    return matcher
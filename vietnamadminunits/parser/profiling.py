@@ -0,0 +1,118 @@
+import sys
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+
+# Stages timed by the parsers and the converter. `matcher` (building a keyword matcher on its first use) is part of
+# the time of the stage that needed the matcher, it is reported on its own to show the cold-start cost.
+STAGES = ['normalize', 'province', 'district', 'ward', 'street', 'conversion', 'geocode']
+NESTED_STAGES = ['matcher']
+
+# Functions called with `(stage, seconds)` after each timed stage. The parsers only read the clock when it is not
+# empty, so profiling costs a truthiness check per stage when disabled. Replaced, never modified, so reads need no lock.
+CALLBACKS = ()
+_callbacks_lock = threading.Lock()
+
+
+def add_stage_callback(callback):
+    '''
+    Call `callback(stage, seconds)` after each timed stage of the parsers and the converter, in every thread of this
+    process (not in worker processes, e.g. `n_jobs > 1`).
+
+    :param callback: Function of `(stage, seconds)`, see `STAGES`. It must be fast and thread-safe.
+    '''
+    global CALLBACKS
+    with _callbacks_lock:
+        CALLBACKS = CALLBACKS + (callback,)
+
+
+def remove_stage_callback(callback):
+    '''
+    :param callback: Function registered with `add_stage_callback()`.
+    '''
+    global CALLBACKS
+    with _callbacks_lock:
+        callbacks = list(CALLBACKS)
+        callbacks.remove(callback)
+        CALLBACKS = tuple(callbacks)
+
+
+def lap(stage: str, start: float) -> float:
+    '''
+    Report the time of `stage` to the callbacks.
+
+    :param stage: Stage name, see `STAGES`.
+    :param start: `perf_counter()` at the start of the stage.
+    :return: `perf_counter()` now, the start of the next stage.
+    '''
+    end = perf_counter()
+    for callback in CALLBACKS:
+        callback(stage, end - start)
+    return end
+
+
+class StageProfiler:
+    '''
+    Thread-safe call count and cumulative time per stage.
+    '''
+    def __init__(self):
+        self.stats = {}  # {stage: [calls, seconds]}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            stats = self.stats.get(stage)
+            if stats is None:
+                stats = self.stats[stage] = [0, 0.0]
+            stats[0] += 1
+            stats[1] += seconds
+
+    def reset(self):
+        with self._lock:
+            self.stats.clear()
+
+    def report(self) -> str:
+        '''
+        :return: Table of the calls, cumulative time, mean time and share of the total time of each stage.
+        '''
+        with self._lock:
+            stats = {stage: tuple(v) for stage, v in self.stats.items()}
+
+        stages = [s for s in STAGES if s in stats] + sorted(s for s in stats if s not in STAGES + NESTED_STAGES)
+        total = sum(stats[s][1] for s in stages)
+
+        def row(stage):
+            calls, seconds = stats[stage]
+            share = seconds / total * 100 if total else 0
+            return f'{stage:<12} | {calls:>10,} | {seconds:>10.3f} | {seconds / calls * 1e6:>10.1f} | {share:>6.1f}%'
+
+        lines = [f"{'Stage':<12} | {'Calls':>10} | {'Total (s)':>10} | {'Mean (µs)':>10} | {'Share':>7}", '-' * 62]
+        lines += [row(stage) for stage in stages]
+        lines += ['-' * 62, f"{'total':<12} | {'':>10} | {total:>10.3f} | {'':>10} | {'100.0%' if total else '':>7}"]
+        nested = [s for s in NESTED_STAGES if s in stats]
+        if nested:
+            lines += [row(stage) + '  (included above)' for stage in nested]
+        return '\n'.join(lines)
+
+    def print_report(self, file=None):
+        print(self.report(), file=file or sys.stdout)
+
+
+@contextmanager
+def profile_stages():
+    '''
+    Time the stages of the parsers and the converter in the block. Usage:
+
+        with profile_stages() as profiler:
+            parse_addresses(addresses, mode='LEGACY')
+        profiler.print_report()
+
+    :return: `StageProfiler` object, filled in until the end of the block.
+    '''
+    profiler = StageProfiler()
+    add_stage_callback(profiler.record)
+    try:
+        yield profiler
+    finally:
+        remove_stage_callback(profiler.record)
@@ -0,0 +1,132 @@
+import hashlib
+import pickle
+import struct
+import warnings
+from collections.abc import Mapping
+from pathlib import Path
+
+
+# Snapshot layout: MAGIC | header length (uint32) | pickled header | pickled sections.
+# The header holds the format version, the SHA-256 of the source JSON and the (offset, length) of every section.
+# Per-province tables are stored as one section per province, so a province is only unpickled when it is parsed.
+SNAPSHOT_VERSION = 1
+PICKLE_PROTOCOL = 4  # Readable by every supported Python version
+MAGIC = b'VAUSNAP\x00'
+HEADER = struct.Struct('<I')
+
+
+class LazyTable(Mapping):
+    '''
+    Read-only `{province_key: table}` mapping of a snapshot. Each province table is unpickled on first access.
+    '''
+    def __init__(self, buffer, segments: dict):
+        self._buffer = buffer
+        self._segments = segments
+        self._tables = {}
+
+    def __getitem__(self, key):
+        table = self._tables.get(key)
+        if table is None:
+            offset, length = self._segments[key]
+            table = self._tables[key] = pickle.loads(self._buffer[offset:offset + length])
+        return table
+
+    def get(self, key, default=None):
+        return self[key] if key in self._segments else default
+
+    def __contains__(self, key):
+        return key in self._segments
+
+    def __iter__(self):
+        return iter(self._segments)
+
+    def __len__(self):
+        return len(self._segments)
+
+    def __repr__(self):
+        return f"LazyTable({len(self._tables)}/{len(self._segments)} loaded)"
+
+
+def source_checksum(source_path: Path):
+    '''
+    :param source_path: Path of the source JSON.
+    :return: SHA-256 hex digest of the source JSON.
+    '''
+    with open(source_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def write_snapshot(path: Path, source_path: Path, data: dict, province_tables: list):
+    '''
+    Serialize the derived lookup tables of a dataset to a snapshot file.
+
+    :param path: Snapshot path, e.g. `vietnamadminunits/data/parser_legacy.snapshot`.
+    :param source_path: Path of the source JSON the tables were built from.
+    :param data: Dictionary of `{name: table}`.
+    :param province_tables: Names of the `{province_key: table}` tables to split into one section per province.
+    '''
+    sections = []
+    offset = 0
+
+    def add_section(value):
+        nonlocal offset
+        blob = pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+        sections.append(blob)
+        offset += len(blob)
+        return offset - len(blob), len(blob)
+
+    tables = add_section({name: table for name, table in data.items() if name not in province_tables})
+    segments = {name: {p: add_section(t) for p, t in data[name].items()} for name in province_tables}
+
+    header = pickle.dumps({
+        'version': SNAPSHOT_VERSION,
+        'source_sha256': source_checksum(source_path),
+        'names': list(data),
+        'tables': tables,
+        'segments': segments,
+    }, protocol=PICKLE_PROTOCOL)
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC + HEADER.pack(len(header)) + header)
+        for blob in sections:
+            f.write(blob)
+
+
+def read_snapshot(path: Path, source_path: Path, names: list):
+    '''
+    Load the lookup tables of a dataset from its snapshot file.
+
+    :param path: Snapshot path.
+    :param source_path: Path of the source JSON, to check the snapshot is built from its current content.
+    :param names: Table names the caller needs.
+    :return: Dictionary of `{name: table}`, or `None` if the snapshot is missing, stale or from another format version.
+    '''
+    try:
+        with open(path, 'rb') as f:
+            buffer = f.read()
+    except FileNotFoundError:
+        return None
+
+    start = len(MAGIC) + HEADER.size
+    try:
+        if not buffer.startswith(MAGIC):
+            raise ValueError('Bad magic number')
+        header_length, = HEADER.unpack_from(buffer, len(MAGIC))
+        header = pickle.loads(buffer[start:start + header_length])
+    except Exception:
+        warnings.warn(f'{path.name} is not a valid snapshot file, loading {source_path.name} instead.', RuntimeWarning)
+        return None
+
+    if header['version'] != SNAPSHOT_VERSION or not set(names) <= set(header['names']):
+        warnings.warn(f'{path.name} was built by another version, loading {source_path.name} instead.', RuntimeWarning)
+        return None
+    if header['source_sha256'] != source_checksum(source_path):
+        warnings.warn(f'{path.name} does not match {source_path.name}, loading {source_path.name} instead.', RuntimeWarning)
+        return None
+
+    buffer = memoryview(buffer)[start + header_length:]
+    offset, length = header['tables']
+    data = pickle.loads(buffer[offset:offset + length])
+    for name, segments in header['segments'].items():
+        data[name] = LazyTable(buffer, segments)
+    return data
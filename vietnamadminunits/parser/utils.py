@@ -1,25 +1,28 @@
-from shapely.geometry import Polygon, Point
-from geopy.distance import distance
-from geopy.geocoders import ArcGIS
-from geopy.distance import geodesic
-
 from unidecode import unidecode
+import math
 import re
 import unicodedata
 
-geolocator = ArcGIS()
+# shapely and geopy are imported inside the geo functions, so they are only loaded when an address needs geocoding.
+geolocator = None
 
 
 def get_geo_location(address):
+    global geolocator
+    if geolocator is None:
+        from geopy.geocoders import ArcGIS
+        geolocator = ArcGIS()
     return geolocator.geocode(address)
 
 
-def generate_square_polygon(center: tuple, area_km2: float):
+def square_bounds(center: tuple, area_km2: float):
     '''
     :param center: (latitude, longitude)
     :param area_km2: float
-    :return: shapely.geometry.Polygon in (longitude, latitude) order
+    :return: (south, west, north, east) of the square of area `area_km2` centered on `center`
     '''
+    from geopy.distance import distance
+
     side_km = area_km2 ** 0.5
     half_side_km = side_km / 2
 
@@ -28,6 +31,18 @@ def generate_square_polygon(center: tuple, area_km2: float):
     south = distance(kilometers=half_side_km).destination(center, 180).latitude
     east  = distance(kilometers=half_side_km).destination(center, 90).longitude
     west  = distance(kilometers=half_side_km).destination(center, 270).longitude
+    return south, west, north, east
+
+
+def generate_square_polygon(center: tuple, area_km2: float):
+    '''
+    :param center: (latitude, longitude)
+    :param area_km2: float
+    :return: shapely.geometry.Polygon in (longitude, latitude) order
+    '''
+    from shapely.geometry import Polygon
+
+    south, west, north, east = square_bounds(center, area_km2)
 
     # Theo thứ tự (lon, lat) nếu dùng GeoJSON hoặc shapely
     polygon_coords = [
@@ -48,6 +63,8 @@ def check_point_in_polygon(point: tuple, polygon_center: tuple, polygon_area_km2
     :param polygon_area_km2: float
     :return: boolean
     '''
+    from shapely.geometry import Point
+
     polygon = generate_square_polygon(center=polygon_center, area_km2=polygon_area_km2)
     point = Point(point[1], point[0])
     return polygon.contains(point)
@@ -59,9 +76,56 @@ def find_nearest_point(a_point: tuple, list_of_b_points: list):
     :param list_of_b_points: list of tuples (latitude, longitude)
     :return: (latitude, longitude)
     '''
+    from geopy.distance import geodesic
+
     return min(list_of_b_points, key=lambda b: geodesic(a_point, b).meters)
 
 
+def point_in_bounds(point: tuple, bounds: tuple):
+    '''
+    Same result as `check_point_in_polygon()`, for precomputed `square_bounds()`: points on the edges are outside.
+
+    :param point: (latitude, longitude)
+    :param bounds: (south, west, north, east)
+    :return: boolean
+    '''
+    south, west, north, east = bounds
+    return south < point[0] < north and west < point[1] < east
+
+
+EARTH_RADIUS_KM = 6371.0088
+# Spherical (haversine) and ellipsoidal (geodesic) distances differ by less than 0.6%
+HAVERSINE_TOLERANCE = 0.02
+
+
+def haversine_km(a_point: tuple, b_point: tuple):
+    '''
+    :param a_point: (latitude, longitude)
+    :param b_point: (latitude, longitude)
+    :return: Great-circle distance in km
+    '''
+    lat1, lon1, lat2, lon2 = map(math.radians, (a_point[0], a_point[1], b_point[0], b_point[1]))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def find_nearest_point_fast(a_point: tuple, list_of_b_points: list):
+    '''
+    Same result as `find_nearest_point()`. Points are ranked by haversine distance, the geodesic distance is only
+    computed to break near ties, where the two distances could rank points differently.
+
+    :param a_point: (latitude, longitude)
+    :param list_of_b_points: list of tuples (latitude, longitude)
+    :return: (latitude, longitude)
+    '''
+    distances = [haversine_km(a_point, b) for b in list_of_b_points]
+    limit = min(distances) * (1 + HAVERSINE_TOLERANCE) + 1e-6
+    candidates = [b for b, d in zip(list_of_b_points, distances) if d <= limit]
+    if len(candidates) == 1:
+        return candidates[0]
+    return find_nearest_point(a_point, candidates)
+
+
 def correct_typos(text):
     '''
     :param text: str
@@ -96,6 +160,10 @@ def uppercase_first_letters(text: str, all_first_letters=False):
 
 
 
+# Quote and dash fixes of `unicode_normalize()`, applied in one `str.translate()` pass
+UNICODE_NORMALIZE_TABLE = str.maketrans({'’': "'", '‘': "'", '“': '"', '”': '"', '-': ' - '})
+
+
 def unicode_normalize(text):
     '''
     - Chuyển Unicode tổ hợp sang Unicode dựng sẵn (lỗi gõ dấu bằng ký tự đặc biệt)
@@ -106,15 +174,59 @@ def unicode_normalize(text):
     :return: str or np.nan
     '''
     if isinstance(text, str):
-        text = unicodedata.normalize('NFC', text)
-        text = text.replace("’", "'").replace("‘", "'").replace("“", '"').replace("”", '"') # Normalize quotes
-        text = text.replace('-', ' - ')
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\'\s+', "'", text)
-        return text.strip()
+        if not text.isascii():  # ASCII is already NFC
+            text = unicodedata.normalize('NFC', text)
+        text = text.translate(UNICODE_NORMALIZE_TABLE)
+        text = ' '.join(text.split())  # str.split() and `\s` use the same whitespace definition
+        return text.replace("' ", "'").strip()
     return text
 
 
+# Vietnamese letters in both cases: every vowel with every tone mark, and đ. Precomputed in every key table.
+VIETNAMESE_CHARACTERS = ''.join(
+    unicodedata.normalize('NFC', vowel + tone)
+    for vowel in 'aăâeêioôơuưyAĂÂEÊIOÔƠUƯY'
+    for tone in ['', '\u0300', '\u0309', '\u0303', '\u0301', '\u0323']
+) + 'đĐ'
+
+
+class KeyTable(dict):
+    '''
+    `str.translate()` table of `key_normalize()` for one `keep` and `decode`. ASCII and Vietnamese characters are
+    precomputed, any other character is added the first time it is seen.
+    '''
+    def __init__(self, keep: str, decode: bool):
+        super().__init__()
+        self.pattern = re.compile(rf"[^\w{''.join(re.escape(c) for c in keep)}]+")
+        self.decode = decode
+        self.keep_spaces = any(c.isspace() for c in keep)  # Kept spaces still have to be collapsed
+        for char in map(chr, range(128)):
+            self[ord(char)]
+        for char in VIETNAMESE_CHARACTERS:
+            self[ord(char)]
+
+    def __missing__(self, code):
+        # Same steps as `key_normalize_regex()`, on one character
+        char = chr(code)
+        value = self[code] = self.pattern.sub('', unidecode(char) if self.decode else char).lower()
+        return value
+
+
+KEY_TABLES = {}
+
+
+def get_key_table(keep: list=[], decode=True) -> KeyTable:
+    '''
+    :param keep: list
+    :param decode: bool
+    :return: `KeyTable` of `key_normalize(text, keep, decode)`, created on the first call.
+    '''
+    table = KEY_TABLES.get((tuple(keep), decode))
+    if table is None:
+        table = KEY_TABLES[(tuple(keep), decode)] = KeyTable(''.join(keep), decode)
+    return table
+
+
 def key_normalize(text: str, keep: list=[], decode=True):
     '''
     Loại bỏ tất cả ký tự không phải chữ/số/keep
@@ -123,6 +235,27 @@ def key_normalize(text: str, keep: list=[], decode=True):
     :param decode: bool, bỏ dấu tiếng Việt hay không
     :return: str or np.nan
     '''
+    if isinstance(text, str):
+        # unidecode(), the filter and lower() map characters one by one, so a per-character table gives the same result.
+        # Except for 'Σ', whose lowercase depends on the next character, and is only kept as is if decode=False.
+        if not decode and 'Σ' in text:
+            return key_normalize_regex(text, keep=keep, decode=decode)
+
+        table = get_key_table(keep, decode)
+        text = text.translate(table)
+        if table.keep_spaces:
+            text = re.sub(r'\s+', ' ', text)
+    return text
+
+
+def key_normalize_regex(text: str, keep: list=[], decode=True):
+    '''
+    Reference implementation of `key_normalize()` with unidecode and regex passes over the whole text.
+    :param text: str
+    :param keep: list
+    :param decode: bool, bỏ dấu tiếng Việt hay không
+    :return: str or np.nan
+    '''
     if isinstance(text, str):
         keep_set = ''.join(re.escape(c) for c in keep)
         pattern = rf"[^\w{keep_set}]+"  # \w là a-zA-Z0-9_
@@ -131,6 +264,21 @@ def key_normalize(text: str, keep: list=[], decode=True):
     return text
 
 
+def build_keyword_index(DICT: dict, field: str=None):
+    '''
+    Map each keyword to the key owning it, to replace scanning `DICT` for a keyword.
+
+    :param DICT: Dictionary of `{key: {field: [keywords]}}`, or `{key: [keywords]}` if `field` is `None`.
+    :param field: Keyword field, e.g. `'wardKeywords'`.
+    :return: Dictionary of `{keyword: key}`. If many keys own a keyword, the first one in `DICT` wins.
+    '''
+    index = {}
+    for key, value in DICT.items():
+        for keyword in (value[field] if field else value):
+            index.setdefault(keyword, key)
+    return index
+
+
 def replace_from_right(text: str, old: str, new: str='', for_text: str=None):
     '''
     Help remove keyword in address key.
@@ -155,21 +303,24 @@ def extract_street(address: str, address_key: str):
     first_address_part_norm = key_normalize(first_address_part)
     first_address_key_part_norm = key_normalize(first_address_key_part)
 
-    # Tìm phần giao nhau giữa normalized key và normalized text
-    common_prefix = ''
-    for i in range(min(len(first_address_part_norm), len(first_address_key_part_norm))):
-        if first_address_part_norm[i] == first_address_key_part_norm[i]:
-            common_prefix += first_address_part_norm[i]
-        else:
+    # Tìm độ dài phần giao nhau giữa normalized key và normalized text
+    common_length = 0
+    for char, key_char in zip(first_address_part_norm, first_address_key_part_norm):
+        if char != key_char:
             break
+        common_length += 1
 
-    # Dùng common_prefix để dò lại chuỗi gốc tương ứng trong first_address_part
-    match_result = ''
+    # Dò lại chuỗi gốc tương ứng trong first_address_part: key_normalize() map từng ký tự một, nên độ dài
+    # normalized của prefix là tổng độ dài normalized của từng ký tự. Lấy prefix dài nhất không vượt common_length.
+    table = get_key_table()
+    end = 0
+    normalized_length = 0
     for char in first_address_part:
-        if key_normalize(match_result + char) == common_prefix[:len(key_normalize(match_result + char))]:
-            match_result += char
-        else:
+        normalized_length += len(table[ord(char)])
+        if normalized_length > common_length:
             break
+        end += 1
+    match_result = first_address_part[:end]
 
     return match_result.strip().title() if match_result else None
 
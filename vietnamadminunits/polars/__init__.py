@@ -0,0 +1 @@
+from .main import AdminUnitNamespace, struct_dtype
@@ -0,0 +1,103 @@
+import polars as pl
+from ..parser import parse_unique_addresses, ParseMode
+from ..converter import convert_unique_addresses, ConvertMode, Geocoder
+from ..parser.cache import LRUCache
+from ..pandas.table import COLUMN_TYPES, default_columns, check_columns, column_values
+from typing import Union, List
+
+
+DTYPES = {'int': pl.Int32, 'float': pl.Float64, 'str': pl.String}
+
+
+def struct_dtype(fields: List[str]) -> pl.Struct:
+    '''
+    :param fields: AdminUnit fields.
+    :return: Struct dtype of the results: codes as `Int32`, latitude and longitude as `Float64`, the others as `String`.
+    '''
+    return pl.Struct({field: DTYPES[COLUMN_TYPES[field]] for field in fields})
+
+
+def _map_unique(series: pl.Series, process, fields: List[str], cache: LRUCache) -> pl.Series:
+    '''
+    Process each distinct value of `series` once, then broadcast the results back to its rows.
+
+    :param series: String series of addresses.
+    :param process: Function mapping a list of distinct addresses to `(units, indexes)`.
+    :param fields: AdminUnit fields of the struct.
+    :param cache: `{address: values of fields}`, shared by the batches of an expression.
+    :return: Struct series, same length and order as `series`. Null addresses get null structs.
+    '''
+    dtype = struct_dtype(fields)
+    uniques = series.drop_nulls().unique()
+    if uniques.is_empty():
+        return pl.Series(series.name, [None] * len(series), dtype=dtype)
+
+    addresses = uniques.to_list()
+    rows = [cache.get(address) for address in addresses]
+    missing = [i for i, row in enumerate(rows) if row is None]
+    if missing:
+        units, indexes = process([addresses[i] for i in missing])
+        values = column_values(units, fields)
+        new_rows = list(zip(*[values[field] for field in fields]))
+        for i, index in zip(missing, indexes):
+            rows[i] = new_rows[index]
+            cache.put(addresses[i], rows[i])
+
+    schema = {field: DTYPES[COLUMN_TYPES[field]] for field in fields}
+    results = pl.DataFrame(rows, schema=schema, orient='row').to_struct(series.name)
+
+    # Row -> index of its distinct address, by a hash lookup in native code
+    positions = series.replace_strict(uniques, pl.int_range(len(uniques), dtype=pl.UInt32, eager=True), default=None, return_dtype=pl.UInt32)
+    return results.gather(positions)
+
+
+@pl.api.register_expr_namespace('vau')
+@pl.api.register_series_namespace('vau')
+class AdminUnitNamespace:
+    '''
+    `vau` namespace of Polars expressions and series of addresses.
+
+    Each batch parses or converts its distinct addresses only and broadcasts the results back to the rows, as a struct
+    with one field per AdminUnit field. The expressions are elementwise, so they work in lazy and streaming queries.
+    '''
+    def __init__(self, expr: Union[pl.Expr, pl.Series]):
+        self._expr = expr
+
+    def _map(self, process, fields: List[str], cache_size: int):
+        check_columns(fields)
+        cache = LRUCache(maxsize=cache_size)
+        function = lambda series: _map_unique(series.cast(pl.String), process, fields, cache)
+        if isinstance(self._expr, pl.Series):
+            return function(self._expr)
+        return self._expr.map_batches(function, return_dtype=struct_dtype(fields), is_elementwise=True)
+
+    def parse(self, mode: Union[str, ParseMode]=ParseMode.latest(), keep_street: bool=True, level: int=0, fields: List[str]=None, cache_size: int=100000):
+        '''
+        Parse the addresses, see `parse_address()`.
+
+        :param mode: One of the `ParseMode` values. See `parse_address()`.
+        :param keep_street: See `parse_address()`.
+        :param level: See `parse_address()`.
+        :param fields: AdminUnit fields of the struct. Default is every field except `address` and the keys, and the district fields in `'LEGACY'` mode only.
+        :param cache_size: Distinct addresses remembered across batches, so they are parsed once.
+        :return: Struct expression or series.
+        '''
+        if fields is None:
+            fields = default_columns(district=mode in [ParseMode.LEGACY, ParseMode.LEGACY.value])
+        process = lambda addresses: parse_unique_addresses(addresses, mode=mode, keep_street=keep_street, level=level)
+        return self._map(process, fields, cache_size)
+
+    def convert(self, mode: Union[str, ConvertMode]=ConvertMode.CONVERT_2025, geocoder: Geocoder=None, fields: List[str]=None, cache_size: int=100000):
+        '''
+        Convert the old (63-province) addresses to the new (34-province) system, see `convert_address()`.
+
+        :param mode: One of the `ConvertMode` values. Currently, only `'CONVERT_2025'` is supported.
+        :param geocoder: Object with a `geocode(unit)` method. Default is `get_default_geocoder()`.
+        :param fields: AdminUnit fields of the struct. Default is every field except `address`, the keys and the district fields.
+        :param cache_size: Distinct addresses remembered across batches, so they are converted once.
+        :return: Struct expression or series.
+        '''
+        if fields is None:
+            fields = default_columns(district=False)
+        process = lambda addresses: convert_unique_addresses(addresses, mode=mode, geocoder=geocoder)
+        return self._map(process, fields, cache_size)
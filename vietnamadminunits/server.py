@@ -0,0 +1,399 @@
+'''
+Local HTTP/JSON service: parse and convert addresses with the data loaded once, shared by every client.
+
+Usage:
+    python -m vietnamadminunits.server --port 8000 -j 4
+
+Endpoints:
+    GET  /parse?address=...&mode=LEGACY&level=3&keep_street=true   One address, or POST a JSON object with the same keys
+    GET  /convert?address=...&mode=CONVERT_2025                     One address, or POST a JSON object with the same keys
+    POST /parse/batch?mode=LEGACY&level=3                           NDJSON body, one address per line (a JSON string, or an object with an address key)
+    POST /convert/batch                                             NDJSON body, see /parse/batch
+    GET  /stats                                                     Requests, errors and p50/p99 latency per endpoint
+    GET  /health
+
+Results are `AdminUnit.to_dict()` objects, or `{"error": ...}`. Batch request bodies are read, processed and answered
+in chunks, with a chunked NDJSON response in input order, so a batch of any size uses constant memory.
+'''
+import argparse
+import json
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from urllib.parse import urlsplit, parse_qs
+
+from .parser import parse_address, parse_addresses, ParseMode
+from .converter import convert_address, convert_unique_addresses, ConvertMode
+
+
+COMMANDS = {'/parse': 'parse', '/convert': 'convert'}
+# Endpoints with their own /stats entry, every other path is counted under 'other'
+ENDPOINTS = ['/health', *COMMANDS, *[f'{e}/batch' for e in COMMANDS]]
+LATENCY_WINDOW = 10000  # Latencies kept per endpoint for the percentiles of /stats
+
+
+# WORKERS
+def _init_worker():
+    from . import preload
+    preload(freeze=False)  # Nothing to load if forked: the data is inherited from the parent, frozen
+
+
+def _process_one(address: str, command: str, options: dict) -> dict:
+    if command == 'parse':
+        return parse_address(address, **options).to_dict()
+    return convert_address(address, **options).to_dict()
+
+
+def process_addresses(addresses: List[str], command: str, options: dict) -> List[dict]:
+    '''
+    :param addresses: List of addresses.
+    :param command: `'parse'` or `'convert'`.
+    :param options: Keyword arguments of `parse_address()` or `convert_address()`.
+    :return: `AdminUnit.to_dict()` of each address, or `{"error": ...}` for the addresses that raised an error.
+    '''
+    try:
+        if command == 'parse':
+            return [unit.to_dict() for unit in parse_addresses(addresses, **options)]
+        units, indexes = convert_unique_addresses(addresses, **options)
+        return [units[i].to_dict() for i in indexes]
+    except Exception:
+        pass  # One address of the batch raised: process them one by one, so only its result is an error
+
+    results = []
+    for address in addresses:
+        try:
+            results.append(_process_one(address, command, options))
+        except Exception as e:
+            results.append({'error': f'{type(e).__name__}: {e}'})
+    return results
+
+
+# STATISTICS
+class LatencyStats:
+    '''
+    Thread-safe request count, error count and latency percentiles per endpoint, over the last `window` requests.
+    '''
+    def __init__(self, window: int=LATENCY_WINDOW):
+        self.window = window
+        self.started_at = time.time()
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, error: bool=False):
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = {'requests': 0, 'errors': 0, 'latencies': deque(maxlen=self.window)}
+            stats['requests'] += 1
+            stats['errors'] += error
+            stats['latencies'].append(seconds)
+
+    def report(self) -> dict:
+        def percentile(values: list, q: float) -> float:
+            return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+        with self._lock:
+            endpoints = {e: (s['requests'], s['errors'], sorted(s['latencies'])) for e, s in self._endpoints.items()}
+        return {
+            'uptime_s': round(time.time() - self.started_at, 1),
+            'endpoints': {
+                endpoint: {
+                    'requests': requests,
+                    'errors': errors,
+                    'p50_ms': round(percentile(latencies, 0.50), 3),
+                    'p99_ms': round(percentile(latencies, 0.99), 3),
+                    'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3),
+                }
+                for endpoint, (requests, errors, latencies) in sorted(endpoints.items())
+            },
+        }
+
+
+# SERVER
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive connections and chunked responses
+    disable_nagle_algorithm = True  # Headers and body are separate writes: do not delay the body of small responses
+    server_version = 'vietnamadminunits'
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def _handle(self):
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        endpoint = url.path.rstrip('/') or '/'
+        status = 500
+        try:
+            status = self._route(endpoint, {k: v[-1] for k, v in parse_qs(url.query).items()})
+        except ValueError as e:
+            self.close_connection = True  # The request body may be left unread
+            status = self._send_json(400, {'error': str(e)})
+        except Exception as e:
+            self.close_connection = True
+            status = self._send_json(500, {'error': f'{type(e).__name__}: {e}'})
+        finally:
+            if endpoint != '/stats':
+                # Not the path itself: clients could grow the stats without bound with random paths
+                self.server.stats.record(endpoint if endpoint in ENDPOINTS else 'other', time.perf_counter() - start, error=status >= 400)
+
+    def _route(self, endpoint: str, query: dict) -> int:
+        if endpoint == '/health':
+            return self._send_json(200, {'status': 'ok'})
+        if endpoint == '/stats':
+            return self._send_json(200, self.server.stats.report())
+
+        batch = endpoint.endswith('/batch')
+        command = COMMANDS.get(endpoint[:-len('/batch')] if batch else endpoint)
+        if command is None:
+            self._discard_body()
+            return self._send_json(404, {'error': f'Unknown endpoint {endpoint}'})
+
+        if not batch:
+            params = dict(query)
+            if self.command == 'POST':
+                body = self._read_body()
+                if body:
+                    try:
+                        data = json.loads(body)
+                    except ValueError as e:
+                        raise ValueError(f'Invalid JSON body: {e}')
+                    if not isinstance(data, dict):
+                        raise ValueError('The JSON body must be an object, e.g. {"address": "..."}')
+                    params.update(data)
+            if not isinstance(params.get('address'), str):
+                raise ValueError('address is required')
+            address = params.pop('address')
+            result = self.server.run(process_addresses, [address], command, parse_options(command, params))[0]
+            return self._send_json(422 if 'error' in result else 200, result)
+
+        if self.command != 'POST':
+            return self._send_json(405, {'error': 'Batch endpoints take a POST request with an NDJSON body'})
+        options = parse_options(command, query)
+        self._stream_batch(command, options)
+        return 200
+
+    # Request bodies
+    def _iter_body(self):
+        # Body bytes, read as they come: chunked transfer encoding, or Content-Length
+        if 'chunked' in self.headers.get('Transfer-Encoding', '').lower():
+            while True:
+                size = int(self.rfile.readline().split(b';')[0].strip() or b'0', 16)
+                if size == 0:
+                    while self.rfile.readline().strip():  # Trailers
+                        pass
+                    return
+                yield self.rfile.read(size)
+                self.rfile.readline()
+        else:
+            remaining = int(self.headers.get('Content-Length') or 0)
+            while remaining > 0:
+                data = self.rfile.read(min(remaining, 65536))
+                if not data:
+                    return
+                remaining -= len(data)
+                yield data
+
+    def _read_body(self) -> bytes:
+        return b''.join(self._iter_body())
+
+    def _discard_body(self):
+        for _ in self._iter_body():
+            pass
+
+    def _iter_lines(self):
+        buffer = b''
+        for data in self._iter_body():
+            buffer += data
+            *lines, buffer = buffer.split(b'\n')
+            yield from lines
+        yield buffer
+
+    def _iter_addresses(self):
+        # Address of each non-empty line, or the error of a line without one
+        for line in self._iter_lines():
+            if line.strip():
+                try:
+                    item = json.loads(line)
+                except ValueError as e:
+                    yield {'error': f'Invalid JSON line: {e}'}
+                    continue
+                address = item.get('address') if isinstance(item, dict) else item
+                yield address if isinstance(address, str) else {'error': 'address is required'}
+
+    # Responses
+    def _send_json(self, status: int, data) -> int:
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return status
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+
+    def _stream_batch(self, command: str, options: dict):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        def submit(chunk):
+            # Invalid lines keep their error result, the others are processed by a worker
+            addresses = [item for item in chunk if isinstance(item, str)]
+            return chunk, self.server.submit(process_addresses, addresses, command, options)
+
+        def write(chunk, future):
+            results = iter(future.result())
+            lines = (item if isinstance(item, dict) else next(results) for item in chunk)
+            self._write_chunk(''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in lines).encode('utf-8'))
+
+        # At most 2 chunks per worker in flight, answered in input order
+        pending = deque()
+        chunk = []
+        try:
+            for item in self._iter_addresses():
+                chunk.append(item)
+                if len(chunk) >= self.server.chunksize:
+                    pending.append(submit(chunk))
+                    chunk = []
+                    while pending and (len(pending) > 2 * max(self.server.workers, 1) or pending[0][1].done()):
+                        write(*pending.popleft())
+            if chunk:
+                pending.append(submit(chunk))
+            while pending:
+                write(*pending.popleft())
+        except Exception as e:  # E.g. a broken request body: the status is sent already, end the stream with an error line
+            self.close_connection = True
+            self._write_chunk(json.dumps({'error': f'{type(e).__name__}: {e}'}).encode('utf-8') + b'\n')
+        self._write_chunk(b'')
+
+
+def parse_options(command: str, params: dict) -> dict:
+    '''
+    :param command: `'parse'` or `'convert'`.
+    :param params: Request parameters, strings from the query string or JSON values.
+    :return: Keyword arguments of `parse_address()` or `convert_address()`.
+    '''
+    if command == 'parse':
+        mode = params.get('mode') or ParseMode.latest().value
+        if mode not in ParseMode.available(value=True):
+            raise ValueError(f"Invalid mode. Available modes are {ParseMode.available(value=True)}.")
+        level = int(params.get('level') or 0)
+        max_level = 2 if mode == ParseMode.FROM_2025.value else 3
+        if not 0 <= level <= max_level:
+            raise ValueError(f'Level must be between 0 and {max_level}')
+        keep_street = params.get('keep_street', True)
+        if isinstance(keep_street, str):
+            keep_street = keep_street.lower() not in ['0', 'false', 'no']
+        return {'mode': mode, 'level': level, 'keep_street': bool(keep_street)}
+
+    mode = params.get('mode') or ConvertMode.CONVERT_2025.value
+    if mode not in ConvertMode.available(value=True):
+        raise ValueError(f"Invalid mode. Available modes are {ConvertMode.available(value=True)}.")
+    return {'mode': mode}
+
+
+class AdminUnitServer(ThreadingHTTPServer):
+    '''
+    HTTP server: one thread per connection for I/O, CPU work in a pool of `workers` processes sharing the preloaded data.
+    '''
+    daemon_threads = True
+
+    def __init__(self, address, workers: int=1, chunksize: int=1000, quiet: bool=False):
+        '''
+        :param address: `(host, port)`, port `0` for any free port.
+        :param workers: Worker processes, `0` to process requests in the connection threads.
+        :param chunksize: Addresses of a batch request sent to a worker at a time.
+        :param quiet: Do not log requests.
+        '''
+        import gc
+        from . import preload
+
+        self.workers = workers
+        self.chunksize = chunksize
+        self.quiet = quiet
+        self.stats = LatencyStats()
+
+        # Load the data before the workers start: forked workers then share its memory pages
+        preload(freeze=False)
+        self.executor = None
+        if workers > 0:
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+            # Frozen only while the workers are forked (all of them on the first submit with the fork start method),
+            # so their collections skip the shared pages. This process gets its objects back, except those its caller froze.
+            frozen = gc.get_freeze_count()
+            gc.freeze()
+            try:
+                self.executor.submit(os.getpid)
+            finally:
+                if not frozen:
+                    gc.unfreeze()
+        super().__init__(address, RequestHandler)
+
+    def submit(self, function, *args):
+        if self.executor is not None:
+            return self.executor.submit(function, *args)
+        from concurrent.futures import Future
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+    def run(self, function, *args):
+        return self.submit(function, *args).result()
+
+    def server_close(self):
+        super().server_close()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+def create_server(host: str='127.0.0.1', port: int=8000, workers: int=None, chunksize: int=1000, quiet: bool=False) -> AdminUnitServer:
+    '''
+    Create the server with the data preloaded, without starting it: call `serve_forever()`, e.g. in a thread for tests.
+
+    :param host: Host to listen on.
+    :param port: Port to listen on, `0` for any free port (see `server.server_address`).
+    :param workers: Worker processes, `0` to process requests in the connection threads. Default is the number of CPUs.
+    :param chunksize: Addresses of a batch request sent to a worker at a time.
+    :param quiet: Do not log requests.
+    :return: `AdminUnitServer` object.
+    '''
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return AdminUnitServer((host, port), workers=workers, chunksize=chunksize, quiet=quiet)
+
+
+def main(argv: List[str]=None):
+    arg_parser = argparse.ArgumentParser(prog='python -m vietnamadminunits.server', description='Parse and convert addresses over HTTP/JSON.')
+    arg_parser.add_argument('--host', default='127.0.0.1', help='Host to listen on. Default is 127.0.0.1.')
+    arg_parser.add_argument('--port', type=int, default=8000, help='Port to listen on. Default is 8000.')
+    arg_parser.add_argument('-j', '--workers', type=int, default=None, help='Worker processes, 0 to process requests in the connection threads. Default is the number of CPUs.')
+    arg_parser.add_argument('--chunksize', type=int, default=1000, help='Addresses of a batch request sent to a worker at a time. Default is 1000.')
+    arg_parser.add_argument('-q', '--quiet', action='store_true', help='Do not log requests.')
+    args = arg_parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, workers=args.workers, chunksize=args.chunksize, quiet=args.quiet)
+    print(f'Serving on http://{server.server_address[0]}:{server.server_address[1]} with {server.workers} workers', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()